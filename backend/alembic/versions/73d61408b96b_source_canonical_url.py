@@ -0,0 +1,139 @@
+"""SourceCanonicalUrl
+
+Revision ID: 73d61408b96b
+Revises: 755b8b2a2957
+Create Date: 2026-10-19 10:12:31.518204
+
+Adds ``sources.canonical_url``, backfills it in batches, merges sources
+whose URLs canonicalize to the same page (repointing ``source_articles`` to
+the lowest id) and moves the unique constraint from ``url`` to
+``canonical_url``.
+"""
+import re
+from typing import Sequence, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '73d61408b96b'
+down_revision: Union[str, Sequence[str], None] = '755b8b2a2957'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+# Frozen copy of ``backend.services.source_services.canonicalize_url`` at this
+# revision, so later changes to the live function cannot alter this backfill
+TRACKING_PARAM_PREFIXES = ("utm_", "mc_", "pk_", "hsa_")
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "gbraid", "wbraid", "msclkid", "yclid", "twclid", "igshid",
+    "_ga", "_gl", "ref", "ref_src", "ref_url", "cmpid", "ocid", "sr_share", "amp", "outputtype",
+}
+
+
+def _canonicalize_url(url: str) -> str:
+    """Reduce ``url`` to its canonical form as defined at this revision."""
+    url = (url or "").strip()
+    try:
+        parts = urlsplit(url)
+        hostname = parts.hostname or ""
+        port = parts.port
+    except ValueError:
+        return url
+    if parts.scheme.lower() not in ("http", "https") or not hostname:
+        return url
+
+    path = parts.path
+
+    if hostname.endswith(".cdn.ampproject.org"):
+        match = re.match(r"^/[a-z]/(?:s/)?([^/]+)(/.*)?$", path)
+        if match:
+            hostname, path, port = match.group(1).lower(), match.group(2) or "", None
+
+    for prefix in ("www.", "amp.", "m."):
+        if hostname.startswith(prefix) and hostname.count(".") > 1:
+            hostname = hostname[len(prefix):]
+            break
+    netloc = hostname if port in (None, 80, 443) else f"{hostname}:{port}"
+
+    path = re.sub(r"/{2,}", "/", path)
+    path = re.sub(r"^/amp(?=/)", "", path)
+    path = re.sub(r"/amp(?:\.html)?/?$", "", path)
+    path = path.rstrip("/")
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+    )
+
+    return urlunsplit(("https", netloc, path, urlencode(query), ""))
+
+
+def _backfill_canonical_urls(conn) -> None:
+    """Fill ``canonical_url`` for every source, ``BATCH_SIZE`` rows at a time."""
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.text("SELECT id, url FROM sources WHERE id > :last_id ORDER BY id LIMIT :limit"),
+            {"last_id": last_id, "limit": BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        conn.execute(
+            sa.text("UPDATE sources SET canonical_url = :canonical_url WHERE id = :id"),
+            [{"id": row.id, "canonical_url": _canonicalize_url(row.url)} for row in rows],
+        )
+        last_id = rows[-1].id
+
+
+def _merge_duplicate_sources(conn) -> None:
+    """Collapse sources sharing a canonical URL onto the one with the lowest id."""
+    duplicates = conn.execute(sa.text(
+        "SELECT s.id AS old_id, k.keep_id FROM sources s "
+        "JOIN (SELECT canonical_url, MIN(id) AS keep_id FROM sources GROUP BY canonical_url HAVING COUNT(*) > 1) k "
+        "ON k.canonical_url = s.canonical_url "
+        "WHERE s.id <> k.keep_id ORDER BY s.id"
+    )).all()
+
+    for start in range(0, len(duplicates), BATCH_SIZE):
+        batch = duplicates[start:start + BATCH_SIZE]
+        old_ids = [row.old_id for row in batch]
+        # One statement per batch: repoint every link of the batch's (old_id, keep_id) pairs
+        conn.execute(
+            sa.text(
+                "INSERT INTO source_articles (article_id, source_id) "
+                "SELECT DISTINCT sa.article_id, m.keep_id FROM source_articles sa "
+                "JOIN unnest(CAST(:old_ids AS integer[]), CAST(:keep_ids AS integer[])) AS m(old_id, keep_id) "
+                "ON sa.source_id = m.old_id "
+                "ON CONFLICT DO NOTHING"
+            ),
+            {"old_ids": old_ids, "keep_ids": [row.keep_id for row in batch]},
+        )
+        conn.execute(sa.text("DELETE FROM source_articles WHERE source_id IN :ids").bindparams(sa.bindparam("ids", expanding=True)), {"ids": old_ids})
+        conn.execute(sa.text("DELETE FROM sources WHERE id IN :ids").bindparams(sa.bindparam("ids", expanding=True)), {"ids": old_ids})
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('sources', sa.Column('canonical_url', sa.String(), nullable=True))
+
+    conn = op.get_bind()
+    _backfill_canonical_urls(conn)
+    _merge_duplicate_sources(conn)
+
+    op.alter_column('sources', 'canonical_url', existing_type=sa.String(), nullable=False)
+    op.drop_constraint('sources_url_key', 'sources', type_='unique')
+    op.create_index(op.f('ix_sources_canonical_url'), 'sources', ['canonical_url'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    Merged duplicate sources are not restored.
+    """
+    op.drop_index(op.f('ix_sources_canonical_url'), table_name='sources')
+    op.create_unique_constraint('sources_url_key', 'sources', ['url'])
+    op.drop_column('sources', 'canonical_url')
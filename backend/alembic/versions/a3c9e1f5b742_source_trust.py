@@ -0,0 +1,187 @@
+"""SourceTrust
+
+Revision ID: a3c9e1f5b742
+Revises: f2b7d4e8a961
+Create Date: 2026-10-19 19:02:44.381907
+
+Creates the ``source_trust`` registry, seeds it with the built-in
+``CREDIBLE_SOURCES`` and ``BLACKLISTED_SOURCES`` (a domain in both is
+blacklisted) and initializes the registry version in ``sector_state``.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c9e1f5b742'
+down_revision: Union[str, Sequence[str], None] = 'f2b7d4e8a961'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSION_KEY = 'source_trust_version'
+
+# Frozen copies of ``backend.services.source_services.CREDIBLE_SOURCES`` and
+# ``BLACKLISTED_SOURCES`` at this revision, so later edits to the live lists
+# cannot change what this migration seeds
+CREDIBLE_SOURCES = (
+    '988crisissystemshelp.samhsa.gov', 'aacsb.edu', 'abcnews.go.com', 'academic.oup.com',
+    'academy.openai.com', 'acceleratelearning.stanford.edu', 'accenture.com', 'afp.com',
+    'ag.idaho.gov', 'ag.ny.gov', 'ag.purdue.edu', 'agrilifetoday.tamu.edu',
+    'agupubs.onlinelibrary.wiley.com', 'ai-academy.ncsu.edu', 'ai.fsu.edu', 'ai.gov', 'ai.meta.com',
+    'ai.seas.upenn.edu', 'ai.ufl.edu', 'ai.wfu.edu', 'aiaccelerator.af.mil', 'aifarms.illinois.edu',
+    'aiforgood.itu.int', 'ailearning.ai.ufl.edu', 'alphafold.ebi.ac.uk',
+    'alz-journals.onlinelibrary.wiley.com', 'ama-assn.org', 'ameslab.gov', 'anthropic.com',
+    'ap.org', 'apcp.assembly.ca.gov', 'apps.apple.com', 'apu.apus.edu', 'arpa-e-foa.energy.gov',
+    'arxiv.org', 'ascode.osu.edu', 'assessatcuny.commons.gc.cuny.edu', 'assets.anthropic.com',
+    'assets.kpmg.com', 'atkinson.cornell.edu', 'attorneygeneral.gov', 'aws.amazon.com',
+    'azure.microsoft.com', 'bain.com', 'bcg.com', 'bertie.ces.ncsu.edu',
+    'besjournals.onlinelibrary.wiley.com', 'bhr.stern.nyu.edu', 'blog.google',
+    'blog.peabody.vanderbilt.edu', 'blog.seas.upenn.edu', 'blogs.ifas.ufl.edu',
+    'blogs.microsoft.com', 'blogs.nvidia.com', 'bls.gov', 'bootcamp.colostate.edu',
+    'bootcamp.cpe.vt.edu', 'bowdoin.edu', 'brookings.edu', 'brown.edu',
+    'bsppjournals.onlinelibrary.wiley.com', 'budgetlab.yale.edu', 'budgetmodel.wharton.upenn.edu',
+    'buffalo.edu', 'business.purdue.edu', 'businessdevelopment.mayoclinic.org',
+    'businessinsider.com', 'cacm.acm.org', 'calstate.edu', 'cambridge.org',
+    'careers.kogod.american.edu', 'careerservices.fas.harvard.edu', 'casmi.northwestern.edu',
+    'castleton.edu', 'catalogue.uncw.edu', 'cbsnews.com', 'cccco.edu', 'cde.ca.gov',
+    'cdn-dynmedia-1.microsoft.com', 'cedefop.europa.eu', 'cee.illinois.edu', 'cehd.gmu.edu',
+    'cfr.org', 'cic.edu', 'cisr.mit.edu', 'clarksoncollege.edu', 'cleanenergyforum.yale.edu',
+    'climate.uchicago.edu', 'climatecollab.uci.edu', 'cmr.berkeley.edu', 'cms.gov', 'cmu.edu',
+    'cns.utexas.edu', 'colorado.edu', 'commerce.senate.gov', 'commission.europa.eu',
+    'community.ibm.com', 'community.openai.com', 'congress.gov', 'copyright.gov',
+    'corpgov.law.harvard.edu', 'cpp.edu', 'creativeinquiry.lehigh.edu', 'cs.purdue.edu',
+    'cset.georgetown.edu', 'csis.org', 'csrc.nist.gov', 'cte.utah.edu', 'ctl.ox.ac.uk',
+    'ctl.utahtech.edu', 'ctl.utexas.edu', 'data.consilium.europa.eu', 'datascienceacademy.ncsu.edu',
+    'datasmart.hks.harvard.edu', 'dbmi.hms.harvard.edu', 'dean.house.gov', 'deloitte.com',
+    'developer.ibm.com', 'developer.nvidia.com', 'devry.edu', 'dewv.edu',
+    'digital-strategy.ec.europa.eu', 'discovermagazine.com', 'dl.acm.org', 'dla.mil',
+    'doe.mass.edu', 'doi.gov', 'doiu.doi.gov', 'dr.lib.iastate.edu', 'e360.yale.edu', 'ebnet.ac.uk',
+    'ec.europa.eu', 'ecb.europa.eu', 'ecmwf.int', 'ed.gov', 'edhub.ama-assn.org', 'edps.europa.eu',
+    'education.ec.europa.eu', 'education.illinois.edu', 'education.ohio.gov',
+    'education.purdue.edu', 'educause.edu', 'edunewsletter.openai.com', 'eere-exchange.energy.gov',
+    'eia.gov', 'eit.europa.eu', 'energy.cmu.edu', 'energy.ec.europa.eu', 'energy.gov',
+    'energy.mit.edu', 'energy.utexas.edu', 'energycommerce.house.gov', 'energypolicy.columbia.edu',
+    'environment.ec.europa.eu', 'ep.jhu.edu', 'epic.noaa.gov', 'er.educause.edu', 'eric.ed.gov',
+    'esajournals.onlinelibrary.wiley.com', 'essec.edu', 'esto.nasa.gov', 'ethics.harvard.edu',
+    'europarl.europa.eu', 'european-research-area.ec.europa.eu', 'execed.business.columbia.edu',
+    'executive.mit.edu', 'executiveeducation.wharton.upenn.edu', 'ey.com', 'fda.gov',
+    'fdc.fullerton.edu', 'federalregister.gov', 'federalreserve.gov', 'fhu.edu', 'fic.tufts.edu',
+    'files.eric.ed.gov', 'fortune.com', 'frontiersin.org', 'fuqua.duke.edu', 'gatech.edu',
+    'genai.calstate.edu', 'gmu.edu', 'gov.ca.gov', 'gsb.stanford.edu', 'gse.harvard.edu',
+    'guides.library.georgetown.edu', 'hai.stanford.edu', 'hallcenter.ku.edu', 'harvard.edu',
+    'hawley.senate.gov', 'hbr.org', 'hbs.edu', 'hbsp.harvard.edu', 'hcctraining.ac.uk',
+    'health.ec.europa.eu', 'health.ucdavis.edu', 'help.openai.com', 'hepi.ac.uk', 'hms.harvard.edu',
+    'home.dartmouth.edu', 'hub.jhu.edu', 'huit.harvard.edu', 'humanresources.illinois.edu',
+    'husson.edu', 'ibm.com', 'ic3.gov', 'iclr.cc', 'icml.cc', 'ie.edu', 'ieai.sot.tum.de',
+    'iee.psu.edu', 'ietresearch.onlinelibrary.wiley.com', 'iica.int', 'illinoisattorneygeneral.gov',
+    'imf.org', 'indwes.edu', 'infoguides.gmu.edu', 'investor.nvidia.com', 'irving.dartmouth.edu',
+    'ischool.syracuse.edu', 'ithaca.edu', 'itu.int', 'jamanetwork.com', 'journals.sagepub.com',
+    'knight.as.cornell.edu', 'knowledge.wharton.upenn.edu', 'kogod.american.edu', 'kpmg.com',
+    'lab.vanderbilt.edu', 'ldlprogram.web.illinois.edu', 'le.utah.gov', 'learningsciences.smu.edu',
+    'lgpress.clemson.edu', 'libguides.lib.siu.edu', 'libguides.marian.edu', 'library.educause.edu',
+    'library.hbs.edu', 'lile.duke.edu', 'livescience.com', 'mckinsey.com', 'med.stanford.edu',
+    'media-publications.bcg.com', 'medicine.yale.edu', 'medschool.duke.edu',
+    'medschool.umaryland.edu', 'miamioh.edu', 'michigan.gov', 'microsoft.com', 'mitili.mit.edu',
+    'mitsloan.mit.edu', 'moreland.edu', 'morningstar.com', 'msutoday.msu.edu', 'nam.edu',
+    'nature.com', 'ncbi.nlm.nih.gov', 'nccleantech.ncsu.edu', 'ncdoj.gov', 'ncsa.illinois.edu',
+    'ncua.gov', 'neurips.cc', 'neuroscience.cam.ac.uk', 'news.clemson.edu',
+    'news.climate.columbia.edu', 'news.cornell.edu', 'news.delta.ncsu.edu', 'news.emory.edu',
+    'news.engin.umich.edu', 'news.feinberg.northwestern.edu', 'news.gsu.edu', 'news.harvard.edu',
+    'news.ku.edu', 'news.microsoft.com', 'news.mit.edu', 'news.njit.edu', 'news.northeastern.edu',
+    'news.osu.edu', 'news.rice.edu', 'news.stanford.edu', 'news.uchicago.edu', 'news.ufl.edu',
+    'news.un.org', 'news.unl.edu', 'news.utexas.edu', 'news.vt.edu', 'newscenter.lbl.gov',
+    'newsnetwork.mayoclinic.org', 'newsroom.accenture.com', 'newsroom.ibm.com',
+    'newsroom.wiley.com', 'nih.gov', 'nist.gov', 'njoag.gov', 'nrel.gov', 'nsf.gov', 'nu.edu',
+    'nvidia.com', 'nvidianews.nvidia.com', 'nysenate.gov', 'oaa.osu.edu', 'oag.ca.gov',
+    'oaisc.fas.harvard.edu', 'oecd.org', 'olcf.ornl.gov', 'online.champlain.edu',
+    'online.lifelonglearning.jhu.edu', 'online.ysu.edu', 'onlinedegrees.sandiego.edu',
+    'onlinelibrary.wiley.com', 'onlineprograms.education.uiowa.edu', 'openai.com',
+    'ospra.udmercy.edu', 'ox.ac.uk', 'papers.ssrn.com', 'park.edu', 'partner.microsoft.com',
+    'pce.sandiego.edu', 'pewresearch.org', 'phoenix.edu', 'physicsworld.com',
+    'pmc.ncbi.nlm.nih.gov', 'pnas.org', 'policies.northeastern.edu', 'politico.com',
+    'portal.ct.gov', 'presidency.ucsb.edu', 'princeton.edu', 'professional.dce.harvard.edu',
+    'progressives.house.gov', 'provost.columbia.edu', 'provost.utsa.edu', 'pubmed.ncbi.nlm.nih.gov',
+    'purdue.edu', 'pwc.com', 'pwcs.edu', 'queue.acm.org', 'reflect.ucl.ac.uk',
+    'registrar.gse.harvard.edu', 'research-and-innovation.ec.europa.eu', 'research.google',
+    'research.nvidia.com', 'research.pitt.edu', 'resources.nvidia.com', 'responsibleai.arizona.edu',
+    'reutersinstitute.politics.ox.ac.uk', 'rhsmith.umd.edu', 'rmets.onlinelibrary.wiley.com',
+    'rossier.usc.edu', 'sac.edu', 'safecomputing.umich.edu', 'salatainstitute.harvard.edu',
+    'saopaulo.nd.edu', 'sc.edu', 'scale.stanford.edu', 'schaeffer.usc.edu', 'science.org',
+    'sciencedaily.com', 'scmp.com', 'scu.edu', 'sesp.northwestern.edu', 'sessions.edu',
+    'setr.stanford.edu', 'sir.advancedleadership.harvard.edu', 'sites.campbell.edu',
+    'sites.psu.edu', 'sjf.edu', 'sjsu.edu', 'sloanreview.mit.edu', 'smithsonianmag.com',
+    'social.desa.un.org', 'solve.mit.edu', 'sph.umn.edu', 'stars.library.ucf.edu',
+    'statutes.capitol.texas.gov', 'stemstarts.utexas.edu', 'sydney.edu.au', 'tandfonline.com',
+    'teaching.charlotte.edu', 'teaching.cornell.edu', 'teaching.pitt.edu', 'teaching.uic.edu',
+    'teachingcommons.stanford.edu', 'techcommunity.microsoft.com', 'techcrunch.com',
+    'techpolicy.sanford.duke.edu', 'thedocs.worldbank.org', 'tiffin.edu', 'time.com',
+    'today.uconn.edu', 'today.ucsd.edu', 'towcenter.columbia.edu', 'tpd.tcnj.edu',
+    'trac-ai.iastate.edu', 'transportation.gov', 'trumpwhitehouse.archives.gov', 'ttioc.edu',
+    'turing.ac.uk', 'twin-cities.umn.edu', 'ucl.ac.uk', 'ucumberlands.edu', 'udel.edu',
+    'ukerc.ac.uk', 'un.org', 'unc.edu', 'unesco.org', 'unesdoc.unesco.org', 'unfccc.int',
+    'unlocked.microsoft.com', 'unr.edu', 'unsw.edu.au', 'uona.edu', 'upcea.edu', 'usa.edu',
+    'usccr.gov', 'usda.gov', 'usmd.edu', 'ussc.gov', 'ustr.gov', 'utsc.utoronto.ca',
+    'viterbischool.usc.edu', 'washington.edu', 'wcet.wiche.edu', 'westvalley.edu', 'whitehouse.gov',
+    'who.int', 'windsor.edu', 'wmo.int', 'workflow.ap.org', 'www-cdn.anthropic.com', 'york.ac.uk',
+    'ysph.yale.edu',
+)
+
+BLACKLISTED_SOURCES = (
+    'answers.com', 'answers.yahoo.com', 'askme.com', 'blogger.com', 'blogspot.com',
+    'dailymotion.com', 'digg.com', 'facebook.com', 'ghost.io', 'gist.github.com', 'hackernews.com',
+    'instagram.com', 'linkedin.com', 'mastodon.social', 'medium.com', 'news.ycombinator.com',
+    'notion.so', 'pastebin.com', 'pinterest.com', 'quora.com', 'reddit.com', 'slack.com',
+    'slashdot.org', 'snapchat.com', 'squarespace.com', 'stackexchange.com', 'stackoverflow.com',
+    'substack.com', 'threads.net', 'tiktok.com', 'truthsocial.com', 'tumblr.com', 'twitch.tv',
+    'twitter.com', 'vimeo.com', 'wix.com', 'wordpress.com', 'x.com', 'youtu.be', 'youtube.com',
+)
+
+
+def _normalize_host(host: str) -> str:
+    """Frozen copy of ``backend.services.domain_trust.normalize_host`` at this revision."""
+    host = (host or "").strip().lower()
+    if ":" in host:
+        if host.startswith("[") or host.count(":") > 1:
+            return host.split("]")[0].lstrip("[")
+        host = host.split(":", 1)[0]
+    if host.endswith("."):
+        host = host.rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    return host
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ### commands auto generated by Alembic - please adjust! ###
+    source_trust = op.create_table('source_trust',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('domain', sa.String(), nullable=False),
+    sa.Column('verdict', sa.String(), nullable=False),
+    sa.Column('weight', sa.Float(), server_default='1', nullable=False),
+    sa.Column('note', sa.Text(), nullable=True),
+    sa.Column('updated_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('domain')
+    )
+    # ### end Alembic commands ###
+
+    verdicts = {_normalize_host(domain): 'trusted' for domain in CREDIBLE_SOURCES}
+    verdicts.update({_normalize_host(domain): 'blacklisted' for domain in BLACKLISTED_SOURCES})
+    op.bulk_insert(source_trust, [
+        {'domain': domain, 'verdict': verdict, 'weight': 1.0, 'note': 'built-in list'}
+        for domain, verdict in sorted(verdicts.items()) if domain
+    ])
+    op.execute(
+        sa.text("INSERT INTO sector_state (key, value, updated_at) VALUES (:key, '1', now())").bindparams(key=VERSION_KEY)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(sa.text("DELETE FROM sector_state WHERE key = :key").bindparams(key=VERSION_KEY))
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.drop_table('source_trust')
+    # ### end Alembic commands ###
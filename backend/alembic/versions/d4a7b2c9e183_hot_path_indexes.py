@@ -0,0 +1,64 @@
+"""HotPathIndexes
+
+Revision ID: d4a7b2c9e183
+Revises: c8f3a6d1e925
+Create Date: 2026-10-19 21:14:52.903317
+
+Indexes the columns the API and the ingest job filter and sort on:
+``articles.created_at`` (every article list's ``ORDER BY``),
+``articles.sector`` (together with ``created_at``, so per-sector lists
+come out of the index in order), ``sources.domain`` and the second
+column of the ``source_articles`` / ``article_tags`` primary keys, which
+lead with ``article_id`` and so cannot serve lookups by source or tag.
+
+On PostgreSQL the indexes are built with ``CREATE INDEX CONCURRENTLY``,
+which does not block writes but cannot run inside a transaction, so this
+migration runs in an autocommit block. A concurrent build that failed
+leaves an invalid index behind; it is dropped and rebuilt on the next run.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7b2c9e183'
+down_revision: Union[str, Sequence[str], None] = 'c8f3a6d1e925'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_articles_created_at', 'articles', ['created_at']),
+    ('ix_articles_sector_created_at', 'articles', ['sector', 'created_at']),
+    ('ix_sources_domain', 'sources', ['domain']),
+    ('ix_source_articles_source_id', 'source_articles', ['source_id']),
+    ('ix_article_tags_tag_id', 'article_tags', ['tag_id']),
+]
+
+
+def _drop_invalid_index(name: str) -> None:
+    """Drop ``name`` if an interrupted concurrent build left it invalid (PostgreSQL only)."""
+    invalid = op.get_bind().execute(sa.text(
+        "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+        "WHERE c.relname = :name AND NOT i.indisvalid"
+    ).bindparams(name=name)).first()
+    if invalid:
+        op.drop_index(name, postgresql_concurrently=True, if_exists=True)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    postgresql = op.get_bind().dialect.name == 'postgresql'
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            if postgresql:
+                _drop_invalid_index(name)
+            op.create_index(name, table, columns, unique=False, if_not_exists=True, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
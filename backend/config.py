@@ -19,6 +19,48 @@ class Settings:
     :ivar PERPLEXITY_API_KEY: API key for Perplexity API.
     :ivar DATABASE_URL: SQLAlchemy database connection URL.
     :ivar OPENAI_API_KEY: API key for OpenAI API.
+    :ivar PERPLEXITY_ENDPOINT: Perplexity chat/completions URL (override to use a local stand-in).
+    :ivar OPENAI_BASE_URL: Optional OpenAI API base URL override.
+    :ivar ADMIN_API_KEY: Key expected in the ``X-Admin-Key`` header of admin endpoints (empty disables them).
+    :ivar INGEST_WORKERS: Number of trends the cron job processes concurrently.
+    :ivar IMPACT_BATCH_SIZE: Articles scored per impact scoring request.
+    :ivar SECTORS_PER_RUN: Number of sectors claimed from the rotation per cron run.
+    :ivar SECTOR_WORKERS: Number of claimed sectors processed concurrently.
+    :ivar DB_POOL_SIZE: Database connections kept in the engine pool (defaults to one per ingest thread, ``SECTOR_WORKERS`` x ``INGEST_WORKERS``, plus two).
+    :ivar DB_MAX_OVERFLOW: Extra connections opened beyond ``DB_POOL_SIZE`` under load (short-lived stage, checkpoint and rate-limit sessions).
+    :ivar SECTOR_SCHEDULER: ``rotation`` (round-robin) or ``yield`` (sectors with the best recent yield first).
+    :ivar SECTOR_YIELD_LOOKBACK_DAYS: Days of run history the ``yield`` scheduler scores sectors on.
+    :ivar SECTOR_REVISIT_SECONDS: Longest a sector may go unclaimed under the ``yield`` scheduler.
+    :ivar SECTOR_SECONDARY_MIN_SCORE: Keyword score a sector needs to become an article's secondary sector.
+    :ivar SECTOR_SECONDARY_MAX: Most secondary sectors assigned to an article.
+    :ivar HTTP_MAX_CONNECTIONS: Connection limit of the shared HTTP client pool.
+    :ivar HTTP_MAX_KEEPALIVE: Idle keep-alive connections kept in the pool.
+    :ivar HTTP_KEEPALIVE_EXPIRY: Seconds an idle pooled connection is kept open.
+    :ivar HTTP_CONNECT_TIMEOUT: Connect timeout (seconds) for upstream calls.
+    :ivar HTTP2_ENABLED: Use HTTP/2 for upstream calls (requires ``h2``).
+    :ivar API_MAX_RETRIES: Retries for transient upstream errors (429, 5xx, timeouts).
+    :ivar API_BACKOFF_BASE: Base delay (seconds) for exponential backoff.
+    :ivar API_BACKOFF_MAX: Maximum delay (seconds) between retries.
+    :ivar CIRCUIT_FAILURE_THRESHOLD: Consecutive failures that open an endpoint's circuit.
+    :ivar CIRCUIT_RESET_SECONDS: Seconds an open circuit waits before a trial call.
+    :ivar RATE_LIMITS: Upstream limits as ``key=rpm/tpm`` entries, keyed by provider or ``provider:model`` (empty disables).
+    :ivar RATE_LIMIT_HEADROOM: Fraction of each rate limit the callers aim for.
+    :ivar RATE_LIMIT_BURST_SECONDS: Seconds of rate-limit capacity that may be spent in one burst.
+    :ivar RATE_LIMIT_BACKEND: ``memory`` (per process) or ``database`` (shared by all processes).
+    :ivar SOURCE_TRUST_FILE: JSON file of source trust rules used instead of the ``source_trust`` table (empty uses the table).
+    :ivar SOURCE_TRUST_RELOAD_SECONDS: How often the source trust rules are checked for changes.
+    :ivar LLM_CACHE_DIR: Directory for the on-disk LLM response cache (disabled when empty).
+    :ivar LLM_CACHE_TTL_SECONDS: Age after which cached responses expire.
+    :ivar LLM_CACHE_MAX_BYTES: Size budget of the response cache.
+    :ivar DEDUP_THRESHOLD: Similarity at which a trend duplicates a recent article (0 disables).
+    :ivar DEDUP_LOOKBACK_DAYS: How far back published articles are checked for near-duplicates.
+    :ivar DAEMON_INTERVAL_SECONDS: Time between ingest runs in daemon mode.
+    :ivar DAEMON_JITTER_SECONDS: Random extra delay (up to this many seconds) added to each interval.
+    :ivar DAEMON_HEALTH_PORT: Port of the daemon's health/metrics endpoint (0 disables it).
+    :ivar QUEUE_VISIBILITY_TIMEOUT: Seconds a claimed trend job stays invisible to other workers.
+    :ivar QUEUE_MAX_ATTEMPTS: Claims after which a failing trend job is dead-lettered.
+    :ivar QUEUE_RETRY_DELAY: Base delay before a failed trend job is retried (doubles per attempt).
+    :ivar WORKER_POLL_SECONDS: How often an idle worker polls the queue.
     """
     PERPLEXITY_API_KEY = os.getenv("PERPLEXITY_API_KEY")
     if not PERPLEXITY_API_KEY:
@@ -31,5 +73,54 @@ class Settings:
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
     if not OPENAI_API_KEY:
         raise ValueError("Missing OPENAI_API_KEY environment variable.")
+
+    # Upstream endpoints; point both at backend.util_scripts.fake_llm_server for offline runs
+    PERPLEXITY_ENDPOINT = os.getenv("PERPLEXITY_ENDPOINT") or "https://api.perplexity.ai/chat/completions"
+    OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or None
+
+    # Admin endpoints are disabled until a key is set
+    ADMIN_API_KEY = os.getenv("ADMIN_API_KEY", "")
+
+    # Optional tuning knobs (defaults are used when unset)
+    INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", "3"))
+    IMPACT_BATCH_SIZE = int(os.getenv("IMPACT_BATCH_SIZE", "8"))
+    SECTORS_PER_RUN = int(os.getenv("SECTORS_PER_RUN", "1"))
+    SECTOR_WORKERS = int(os.getenv("SECTOR_WORKERS", "4"))
+    # Every ingest thread holds its own session, so the pool grows with the thread count
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", str(SECTOR_WORKERS * INGEST_WORKERS + 2)))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    SECTOR_SCHEDULER = os.getenv("SECTOR_SCHEDULER", "rotation").lower()
+    SECTOR_YIELD_LOOKBACK_DAYS = float(os.getenv("SECTOR_YIELD_LOOKBACK_DAYS", "30"))
+    SECTOR_REVISIT_SECONDS = float(os.getenv("SECTOR_REVISIT_SECONDS", str(7 * 24 * 60 * 60)))
+    SECTOR_SECONDARY_MIN_SCORE = int(os.getenv("SECTOR_SECONDARY_MIN_SCORE", "4"))
+    SECTOR_SECONDARY_MAX = int(os.getenv("SECTOR_SECONDARY_MAX", "3"))
+    HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+    HTTP_MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "10"))
+    HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+    HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "10"))
+    HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "false").lower() in ("1", "true", "yes")
+    API_MAX_RETRIES = int(os.getenv("API_MAX_RETRIES", "3"))
+    API_BACKOFF_BASE = float(os.getenv("API_BACKOFF_BASE", "1.0"))
+    API_BACKOFF_MAX = float(os.getenv("API_BACKOFF_MAX", "30"))
+    CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+    CIRCUIT_RESET_SECONDS = float(os.getenv("CIRCUIT_RESET_SECONDS", "60"))
+    RATE_LIMITS = os.getenv("RATE_LIMITS", "perplexity=50/0,openai=500/200000")
+    RATE_LIMIT_HEADROOM = float(os.getenv("RATE_LIMIT_HEADROOM", "0.9"))
+    RATE_LIMIT_BURST_SECONDS = float(os.getenv("RATE_LIMIT_BURST_SECONDS", "10"))
+    RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory").lower()
+    SOURCE_TRUST_FILE = os.getenv("SOURCE_TRUST_FILE", "")
+    SOURCE_TRUST_RELOAD_SECONDS = float(os.getenv("SOURCE_TRUST_RELOAD_SECONDS", "30"))
+    LLM_CACHE_DIR = os.getenv("LLM_CACHE_DIR", "")
+    LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", "86400"))
+    LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+    DEDUP_THRESHOLD = float(os.getenv("DEDUP_THRESHOLD", "0.6"))
+    DEDUP_LOOKBACK_DAYS = int(os.getenv("DEDUP_LOOKBACK_DAYS", "30"))
+    DAEMON_INTERVAL_SECONDS = float(os.getenv("DAEMON_INTERVAL_SECONDS", str(6 * 60 * 60)))
+    DAEMON_JITTER_SECONDS = float(os.getenv("DAEMON_JITTER_SECONDS", "300"))
+    DAEMON_HEALTH_PORT = int(os.getenv("DAEMON_HEALTH_PORT", "8081"))
+    QUEUE_VISIBILITY_TIMEOUT = float(os.getenv("QUEUE_VISIBILITY_TIMEOUT", "900"))
+    QUEUE_MAX_ATTEMPTS = int(os.getenv("QUEUE_MAX_ATTEMPTS", "3"))
+    QUEUE_RETRY_DELAY = float(os.getenv("QUEUE_RETRY_DELAY", "60"))
+    WORKER_POLL_SECONDS = float(os.getenv("WORKER_POLL_SECONDS", "5"))
     
 settings = Settings()
\ No newline at end of file
@@ -1,8 +1,10 @@
 """CRUD helpers for database models.
 
 This module contains convenience functions to create, read, update and link
-database objects used by the application (articles, sources, tags). Functions
-are small wrappers around SQLAlchemy sessions and preserve existing behaviour.
+database objects used by the application (articles, sources, tags, ingest
+run checkpoints, metrics and sector yield, rate-limit buckets, backfill
+writes and source trust rules). Functions are small wrappers around
+SQLAlchemy sessions and preserve existing behaviour.
 
 Design goals:
 - Provide clear, well-documented helper functions used by higher-level
@@ -10,41 +12,90 @@ Design goals:
 - Keep SQLAlchemy session usage explicit via the `db: Session` parameter.
 """
 
-from typing import cast
+from datetime import datetime, timedelta
+from typing import Optional, cast
+from sqlalchemy import Integer, String, bindparam, case, cast as sql_cast, delete, func, insert, literal, or_, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 from backend.db import models
+from backend.services.source_services import canonicalize_url
+
+def _dialect_insert(db: Session):
+    """Return the ``insert`` construct supporting ``ON CONFLICT`` for the session's database.
+
+    :raises ValueError: If the database is neither PostgreSQL nor SQLite.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert
+    if dialect == "sqlite":
+        return sqlite.insert
+    raise ValueError(f"Unsupported database dialect '{dialect}': ON CONFLICT upserts need PostgreSQL or SQLite")
+
+def _upsert_ids(db: Session, model, key: str, rows: list[dict]) -> dict:
+    """Insert ``rows`` ignoring unique conflicts on ``key`` and return ``{key: id}`` for all of them.
+
+    Runs ``INSERT ... ON CONFLICT (key) DO NOTHING RETURNING id, key`` and,
+    only if some rows already existed, one follow-up ``SELECT`` for those
+    keys, so the statement count is constant per batch. Concurrent writers
+    inserting the same key wait on the unique index instead of failing.
+    Rows are inserted in key order so overlapping batches lock in the same
+    order and cannot deadlock.
+
+    :param db: Active SQLAlchemy ``Session``.
+    :param model: Mapped class with an ``id`` primary key and a unique ``key`` column.
+    :param key: Name of the unique column.
+    :param rows: Column dicts to insert, unique by ``key``.
+    :returns: Mapping of key value to primary key id.
+    """
+    if not rows:
+        return {}
+
+    dialect_insert = _dialect_insert(db)
+    key_column = getattr(model, key)
+    rows = sorted(rows, key=lambda row: row[key])
+    stmt = dialect_insert(model).values(rows).on_conflict_do_nothing(index_elements=[key]).returning(model.id, key_column)
+    ids = {row_key: row_id for row_id, row_key in db.execute(stmt)}
+
+    missing = [row[key] for row in rows if row[key] not in ids]
+    if missing:
+        ids.update({row_key: row_id for row_id, row_key in db.query(model.id, key_column).filter(key_column.in_(missing)).all()})
+    return ids
 
 def get_or_create_sources_bulk(db: Session, sources: list[dict]):
     """Bulk get or create sources from a list of source dicts.
 
+    Sources are identified by their canonical URL (see
+    :func:`canonicalize_url`), so tracking parameters, fragments, AMP and
+    ``http``/``https`` variants of a page resolve to the same row.
+
+    Uses a single ``INSERT ... ON CONFLICT DO NOTHING ... RETURNING`` plus at
+    most one follow-up ``SELECT`` (see :func:`_upsert_ids`), so concurrent
+    ingest workers that see the same new URL do not collide on the unique
+    constraint. Nothing is committed; the caller owns the transaction.
+
     :param db: Active SQLAlchemy ``Session``.
     :param sources: List of dicts with keys 'title', 'url', 'domain', 'sector'.
-    :returns: List of source IDs (int) for the sources created or found.
-    """
-    urls = [s["url"] for s in sources]
-    existing_sources = db.query(models.Source).filter(models.Source.url.in_(urls)).all()
-    existing_urls = {source.url: source.id for source in existing_sources}
-    sourceIDs: list[int] = []
-        
-    for source in sources:
-        if source["url"] in existing_urls:
-            sourceIDs.append(cast(int, existing_urls[source["url"]]))
-        else:
-            new_source = models.Source(title=source["title"], url=source["url"], domain=source["domain"], sector=source["sector"])
-            db.add(new_source)
-            db.flush()
-            sourceIDs.append(cast(int, new_source.id))
-    
-    return sourceIDs
+    :returns: List of source IDs (int) for the sources created or found, in input order.
+    """
+    canonical_urls = [canonicalize_url(source["url"]) for source in sources]
+    rows = {}
+    for source, canonical_url in zip(sources, canonical_urls):
+        rows.setdefault(canonical_url, {"title": source["title"], "url": source["url"], "canonical_url": canonical_url, "domain": source["domain"], "sector": source["sector"]})
+
+    source_ids = _upsert_ids(db, models.Source, "canonical_url", list(rows.values()))
+    return [cast(int, source_ids[canonical_url]) for canonical_url in canonical_urls]
 
 def get_source_by_url(db: Session, url: str):
-    """Return a :class:`models.Source` matching ``url``, or ``None``.
+    """Return the :class:`models.Source` for the page at ``url``, or ``None``.
+
+    Any variant of the URL matches, since lookups go through its canonical form.
 
     :param db: Active SQLAlchemy ``Session``.
     :param url: The source URL to look up.
     :returns: The matching :class:`models.Source` instance or ``None`` if not found.
     """
-    return db.query(models.Source).filter(models.Source.url == url).first()
+    return db.query(models.Source).filter(models.Source.canonical_url == canonicalize_url(url)).first()
 
 def get_source_by_id(db: Session, source_id: int):
     """Return a :class:`models.Source` by its integer id, or ``None``.
@@ -58,44 +109,67 @@ def get_source_by_id(db: Session, source_id: int):
 def get_or_create_tags_bulk(db: Session, tags: list[str]):
     """Bulk get or create tags from a list of tag names.
 
+    Uses a single ``INSERT ... ON CONFLICT DO NOTHING ... RETURNING`` plus at
+    most one follow-up ``SELECT`` (see :func:`_upsert_ids`). Nothing is
+    committed; the caller owns the transaction.
+
     :param db: Active SQLAlchemy ``Session``.
     :param tags: List of tag name strings.
-    :returns: List of tag IDs (int) for the tags created or found.
-    """
-    existing_tags = {cast(str, tag.name): cast(int, tag.id) for tag in db.query(models.Tag).filter(models.Tag.name.in_(tags)).all()}
-    tagIDs: list[int] = []
-        
-    for name in tags:
-        if name in existing_tags.keys():
-            tagIDs.append(existing_tags[name])
-        else:
-            new_tag = models.Tag(name=name)
-            db.add(new_tag)
-            db.flush()
-            tagIDs.append(cast(int, new_tag.id))
-    
-    return tagIDs
+    :returns: List of tag IDs (int) for the tags created or found, in input order.
+    """
+    tag_ids = _upsert_ids(db, models.Tag, "name", [{"name": name} for name in dict.fromkeys(tags)])
+    return [cast(int, tag_ids[name]) for name in tags]
 
-def create_article_with_sources_and_tags(db: Session, title: str, content: str, sources: list[dict], tags: list[str], impact_score: int = -1, sector: str = "General"):
+def create_article_with_sources_and_tags(db: Session, title: str, content: str, sources: list[dict], tags: list[str], impact_score: int = -1, sector: str = "General", secondary_sectors: Optional[list[str]] = None, commit: bool = True):
     """Create an article and link it to sources and tags in one transaction.
 
+    The article insert, source/tag lookups and inserts, and both sets of
+    association rows are written with multi-row statements and committed
+    once, so the cost stays at a handful of statements regardless of how
+    many sources and tags the article has. On error nothing is committed.
+
+    Pass ``commit=False`` to leave the transaction open so the caller can
+    write related rows (e.g. a run checkpoint) and commit them atomically
+    with the article.
+
     :param db: Active SQLAlchemy ``Session``.
     :param title: Article title.
     :param content: Article body/content.
-    :param sources: List of source dicts to link.
+    :param sources: List of source dicts to link, in citation order (``sources[0]`` is cited as ``[1]``).
     :param tags: List of tag names to link.
     :param impact_score: Integer impact score (default ``-1`` when unknown).
+    :param sector: Sector the article was ingested under.
+    :param secondary_sectors: Other sectors the article belongs to.
+    :param commit: Commit the transaction (default ``True``).
     :returns: The newly created :class:`models.Article` instance.
     """
-    article = create_article(db=db, title=title, content=content, impact_score=impact_score, sector=sector)
-    sourceIDs = get_or_create_sources_bulk(db=db, sources=sources)
-    tagIDs = get_or_create_tags_bulk(db=db, tags=tags)
+    try:
+        article = models.Article(title=title, content=content, impact_score=impact_score, sector=sector, secondary_sectors=list(secondary_sectors or []))
+        db.add(article)
+        db.flush()
+        article_id = cast(int, article.id)
+
+        sourceIDs = get_or_create_sources_bulk(db=db, sources=sources)
+        tagIDs = get_or_create_tags_bulk(db=db, tags=tags)
 
-    for source_id in sourceIDs:
-        link_article_to_source(db=db, article_id=cast(int, article.id), source_id=source_id)
+        if sourceIDs:
+            # Sources arrive in citation order, so source N is cited as [N]
+            positions: dict[int, int] = {}
+            for position, source_id in enumerate(sourceIDs, start=1):
+                positions.setdefault(source_id, position)
+            db.execute(insert(models.source_articles).values(
+                [{"article_id": article_id, "source_id": source_id, "position": position} for source_id, position in positions.items()]
+            ))
+        if tagIDs:
+            db.execute(insert(models.article_tags).values(
+                [{"article_id": article_id, "tag_id": tag_id} for tag_id in dict.fromkeys(tagIDs)]
+            ))
 
-    for tag_id in tagIDs:
-        link_article_to_tag(db=db, article_id=cast(int, article.id), tag_id=tag_id)
+        if commit:
+            db.commit()
+    except Exception:
+        db.rollback()
+        raise
 
     return article
 
@@ -148,6 +222,30 @@ def get_all_articles(db: Session, search: str | None = None, limit: int = 20, of
     
     return articles, total_count
 
+def get_recent_article_titles_and_tags(db: Session, since: datetime):
+    """Return ``(id, title, tag_names)`` for every article created since ``since``.
+
+    Uses a single outer-joined query rather than loading relationships.
+
+    :param db: Active SQLAlchemy ``Session``.
+    :param since: Only include articles created at or after this time.
+    :returns: List of ``(article_id, title, [tag names])`` tuples.
+    """
+    rows = (
+        db.query(models.Article.id, models.Article.title, models.Tag.name)
+        .outerjoin(models.article_tags, models.article_tags.c.article_id == models.Article.id)
+        .outerjoin(models.Tag, models.Tag.id == models.article_tags.c.tag_id)
+        .filter(models.Article.created_at >= since)
+        .all()
+    )
+
+    articles: dict[int, tuple[str, list[str]]] = {}
+    for article_id, title, tag_name in rows:
+        entry = articles.setdefault(article_id, (title or "", []))
+        if tag_name:
+            entry[1].append(tag_name)
+    return [(article_id, title, tags) for article_id, (title, tags) in articles.items()]
+
 def link_article_to_source(db: Session, article_id: int, source_id: int):
     """Associate a source with an article (many-to-many).
 
@@ -190,4 +288,569 @@ def link_article_to_tag(db: Session, article_id: int, tag_id: int):
         db.commit()
         db.refresh(article)
     
-    return article
\ No newline at end of file
+    return article
+
+def bulk_update_by_id(db: Session, model, rows: list[dict]):
+    """Update many rows of ``model`` by primary key with one executemany ``UPDATE``.
+
+    Nothing is committed; the caller owns the transaction.
+
+    :param db: Active SQLAlchemy ``Session``.
+    :param model: Mapped class with an ``id`` primary key.
+    :param rows: Dicts with ``id`` and the column values to set (same keys in every row).
+    """
+    if rows:
+        db.execute(update(model), rows)
+
+def unlink_article_sources(db: Session, pairs: list[tuple[int, int]]):
+    """Delete ``(article_id, source_id)`` links in one statement.
+
+    Nothing is committed; the caller owns the transaction.
+
+    :param db: Active SQLAlchemy ``Session``.
+    :param pairs: Links to remove.
+    """
+    if pairs:
+        links = models.source_articles.c
+        db.execute(delete(models.source_articles).where(tuple_(links.article_id, links.source_id).in_(pairs)))
+
+def set_article_source_positions(db: Session, positions: list[tuple[int, int, int]]):
+    """Set the citation position of ``(article_id, source_id)`` links in one executemany.
+
+    Nothing is committed; the caller owns the transaction.
+
+    :param db: Active SQLAlchemy ``Session``.
+    :param positions: ``(article_id, source_id, position)`` tuples.
+    """
+    if positions:
+        links = models.source_articles.c
+        db.execute(
+            update(models.source_articles)
+            .where(links.article_id == bindparam("link_article_id"), links.source_id == bindparam("link_source_id"))
+            .values(position=bindparam("link_position")),
+            [{"link_article_id": article_id, "link_source_id": source_id, "link_position": position} for article_id, source_id, position in positions],
+        )
+
+def rename_tags(db: Session, renames: dict[int, str]) -> int:
+    """Rename tags, merging a tag into an existing one that already has the new name.
+
+    Merged tags' article links are moved to the surviving tag and the
+    merged tag is deleted. Nothing is committed; the caller owns the
+    transaction.
+
+    :param db: Active SQLAlchemy ``Session``.
+    :param renames: Mapping of tag id to its new name.
+    :returns: Number of tags merged away.
+    """
+    if not renames:
+        return 0
+    existing = dict(db.query(models.Tag.name, models.Tag.id).filter(models.Tag.name.in_(set(renames.values()))).all())
+    links = models.article_tags.c
+    merged = 0
+    for tag_id, name in renames.items():
+        target = existing.get(name)
+        if target is None:
+            db.execute(update(models.Tag).where(models.Tag.id == tag_id).values(name=name))
+            existing[name] = tag_id
+        elif target != tag_id:
+            db.execute(
+                _dialect_insert(db)(models.article_tags)
+                .from_select(["article_id", "tag_id"], select(links.article_id, literal(target)).where(links.tag_id == tag_id))
+                .on_conflict_do_nothing()
+            )
+            db.execute(delete(models.article_tags).where(links.tag_id == tag_id))
+            db.execute(delete(models.Tag).where(models.Tag.id == tag_id))
+            merged += 1
+    return merged
+
+def get_system_state(db: Session, key: str) -> Optional[str]:
+    """Return the stored value of system state ``key``, or ``None``.
+
+    :param db: Active SQLAlchemy ``Session``.
+    :param key: State key.
+    """
+    return db.query(models.SystemState.value).filter(models.SystemState.key == key).scalar()
+
+def set_system_state(db: Session, key: str, value: str):
+    """Create or update system state ``key``. Nothing is committed.
+
+    :param db: Active SQLAlchemy ``Session``.
+    :param key: State key.
+    :param value: Serialized value.
+    """
+    updated = db.execute(update(models.SystemState).where(models.SystemState.key == key).values(value=value, updated_at=func.now()))
+    if updated.rowcount == 0:
+        db.add(models.SystemState(key=key, value=value))
+        db.flush()
+
+def create_pipeline_run(db: Session, sectors: list[str]):
+    """Record the start of an ingest run.
+
+    :param db: Active SQLAlchemy ``Session``.
+    :param sectors: Sectors claimed by the run.
+    :returns: The committed :class:`models.PipelineRun`.
+    """
+    run = models.PipelineRun(status="running", sectors=list(sectors))
+    db.add(run)
+    db.commit()
+    return run
+
+OPEN_TREND_STATUSES = ("pending", "found", "summarized", "scored")
+
+def create_pipeline_trends(db: Session, run_id: int, sector: str, trends: list[str], locked_by: Optional[str] = None, visibility_timeout: float = 0):
+    """Create checkpoints (queue jobs) for the trends discovered in ``sector``.
+
+    :param db: Active SQLAlchemy ``Session``.
+    :param run_id: Id of the owning :class:`models.PipelineRun`.
+    :param sector: Sector the trends were discovered in.
+    :param trends: Trending topic texts.
+    :param locked_by: Worker id to create the jobs already claimed by (for
+        in-line processing); ``None`` leaves them queued for any worker.
+    :param visibility_timeout: Claim duration in seconds when ``locked_by`` is set.
+    :returns: List of committed :class:`models.PipelineTrend` instances, in input order.
+    """
+    claim = {}
+    if locked_by is not None:
+        claim = {"locked_by": locked_by, "locked_until": datetime.now() + timedelta(seconds=visibility_timeout), "attempts": 1}
+    checkpoints = [models.PipelineTrend(run_id=run_id, sector=sector, trend=trend, status="pending", **claim) for trend in trends]
+    db.add_all(checkpoints)
+    db.commit()
+    return checkpoints
+
+def claim_pipeline_trends(db: Session, worker_id: str, limit: Optional[int], visibility_timeout: float, max_attempts: int, include_delayed: bool = False):
+    """Claim up to ``limit`` open trend jobs for ``worker_id``.
+
+    Candidate rows are selected with ``FOR UPDATE SKIP LOCKED`` so
+    concurrent workers never block on, or claim, the same job. Each claimed
+    job is locked until ``now + visibility_timeout`` and its ``attempts`` is
+    incremented. Jobs whose lock expired after ``max_attempts`` claims
+    (their worker kept dying) are dead-lettered instead of returned.
+
+    :param db: Active SQLAlchemy ``Session``.
+    :param worker_id: Identifier of the claiming worker.
+    :param limit: Maximum number of jobs to claim (``None`` for all).
+    :param visibility_timeout: Seconds the claim lasts.
+    :param max_attempts: Claims after which a job is dead-lettered.
+    :param include_delayed: Also claim failed jobs still waiting out their retry delay.
+    :returns: The claimed :class:`models.PipelineTrend` rows, oldest first.
+    """
+    now = datetime.now()
+    available = or_(models.PipelineTrend.locked_until.is_(None), models.PipelineTrend.locked_until < now)
+    if include_delayed:
+        available = or_(available, models.PipelineTrend.locked_by.is_(None))
+
+    query = (
+        db.query(models.PipelineTrend)
+        .filter(models.PipelineTrend.status.in_(OPEN_TREND_STATUSES), available)
+        .order_by(models.PipelineTrend.id)
+        .with_for_update(skip_locked=True)
+    )
+    if limit is not None:
+        query = query.limit(limit)
+
+    claimed = []
+    for job in query.all():
+        if job.attempts >= max_attempts:
+            job.status = "dead"
+            job.locked_by = None
+            job.locked_until = None
+            job.error = job.error or "Visibility timeout expired on the final attempt"
+            continue
+        job.attempts += 1
+        job.locked_by = worker_id
+        job.locked_until = now + timedelta(seconds=visibility_timeout)
+        claimed.append(job)
+
+    db.commit()
+    return claimed
+
+def _held_pipeline_trend(db: Session, checkpoint_id: int, worker_id: Optional[str]):
+    """Query for a trend job that is not done and, if ``worker_id`` is given, still held by it."""
+    query = db.query(models.PipelineTrend).filter(models.PipelineTrend.id == checkpoint_id, models.PipelineTrend.status != "done")
+    if worker_id is not None:
+        query = query.filter(models.PipelineTrend.locked_by == worker_id)
+    return query
+
+def save_pipeline_trend_progress(db: Session, checkpoint_id: int, worker_id: Optional[str], fields: dict, visibility_timeout: float) -> bool:
+    """Store stage outputs on a trend job and extend its claim (heartbeat); the caller commits.
+
+    Like :func:`complete_pipeline_trend`, the update only applies while
+    ``worker_id`` still holds the job, so a worker whose claim expired
+    cannot overwrite the progress of the worker that took it over.
+
+    :param db: Active SQLAlchemy ``Session``.
+    :param checkpoint_id: Id of the :class:`models.PipelineTrend`.
+    :param worker_id: Worker expected to hold the job (``None`` if unclaimed).
+    :param fields: Column values to set, e.g. ``status`` and ``summary``.
+    :param visibility_timeout: Seconds from now the claim should last.
+    :returns: Whether the job was updated.
+    """
+    values = dict(fields)
+    if worker_id is not None:
+        values["locked_until"] = datetime.now() + timedelta(seconds=visibility_timeout)
+    return _held_pipeline_trend(db, checkpoint_id, worker_id).update(values, synchronize_session=False) == 1
+
+def complete_pipeline_trend(db: Session, checkpoint_id: int, article_id: int, worker_id: Optional[str]) -> bool:
+    """Mark a trend job ``done`` inside the caller's transaction.
+
+    The update only applies while ``worker_id`` still holds the job and it
+    is not already done, so a worker whose claim expired and was taken over
+    cannot persist a second article: the caller must roll back when this
+    returns ``False``. Nothing is committed.
+
+    :param db: Active SQLAlchemy ``Session``.
+    :param checkpoint_id: Id of the :class:`models.PipelineTrend`.
+    :param article_id: Id of the article persisted for the trend.
+    :param worker_id: Worker expected to hold the job (``None`` if unclaimed).
+    :returns: Whether the job was marked done.
+    """
+    updated = _held_pipeline_trend(db, checkpoint_id, worker_id).update(
+        {"status": "done", "article_id": article_id, "error": None, "locked_by": None, "locked_until": None},
+        synchronize_session=False,
+    )
+    return updated == 1
+
+def fail_pipeline_trend(db: Session, checkpoint_id: int, worker_id: Optional[str], error: str, max_attempts: int, retry_delay: float) -> Optional[str]:
+    """Release a failed trend job for a later retry, or dead-letter it, and commit.
+
+    The retry delay doubles with every attempt. Like
+    :func:`complete_pipeline_trend`, nothing changes unless ``worker_id``
+    still holds the job: a worker whose claim expired must not release or
+    dead-letter a job another worker is processing.
+
+    :param db: Active SQLAlchemy ``Session``.
+    :param checkpoint_id: Id of the failed :class:`models.PipelineTrend`.
+    :param worker_id: Worker expected to hold the job (``None`` if unclaimed).
+    :param error: Error message to record.
+    :param max_attempts: Attempts after which the job becomes ``dead``.
+    :param retry_delay: Base delay in seconds before the job may be claimed again.
+    :returns: The job's new status, or ``None`` if the claim was lost.
+    """
+    job = _held_pipeline_trend(db, checkpoint_id, worker_id).with_entities(models.PipelineTrend.attempts, models.PipelineTrend.status).first()
+    if job is None:
+        return None
+    attempts = job.attempts
+    values = {"error": error, "locked_by": None, "status": job.status}
+    if attempts >= max_attempts:
+        values.update(status="dead", locked_until=None)
+    else:
+        values["locked_until"] = datetime.now() + timedelta(seconds=retry_delay * 2 ** max(0, attempts - 1))
+    # Attempts only change when the job is claimed again, which also changes locked_by
+    updated = _held_pipeline_trend(db, checkpoint_id, worker_id).filter(models.PipelineTrend.attempts == attempts).update(values, synchronize_session=False)
+    db.commit()
+    return values["status"] if updated == 1 else None
+
+def finish_pipeline_run(db: Session, run_id: int, failed: bool = False):
+    """Mark a run as ended.
+
+    The run becomes ``completed`` when none of its trends is still open
+    (every trend is ``done`` or ``dead``), ``incomplete`` while some can
+    still be processed, and ``failed`` when ``failed`` is set.
+
+    :param db: Active SQLAlchemy ``Session``.
+    :param run_id: Id of the run to finish.
+    :param failed: Whether the run aborted with an error.
+    :returns: The updated :class:`models.PipelineRun`, or ``None`` if not found.
+    """
+    run = db.query(models.PipelineRun).filter(models.PipelineRun.id == run_id).first()
+    if not run:
+        return None
+
+    unfinished = db.query(models.PipelineTrend).filter(models.PipelineTrend.run_id == run_id, models.PipelineTrend.status.in_(OPEN_TREND_STATUSES)).count()
+    run.status = "failed" if failed else ("incomplete" if unfinished else "completed")
+    run.finished_at = datetime.now()
+    db.commit()
+    return run
+
+def add_pipeline_stage_event(db: Session, run_id: int, sector: str, metrics, pipeline_trend_id: Optional[int] = None):
+    """Add a ``pipeline_stage_events`` row for a finished stage; nothing is committed.
+
+    :param db: Active SQLAlchemy ``Session``.
+    :param run_id: Run the stage belongs to.
+    :param sector: Sector being processed.
+    :param metrics: :class:`backend.services.pipeline_metrics.StageMetrics` of the stage.
+    :param pipeline_trend_id: Trend the stage processed, if trend-specific.
+    :returns: The pending :class:`models.PipelineStageEvent`.
+    """
+    event = models.PipelineStageEvent(run_id=run_id, pipeline_trend_id=pipeline_trend_id, sector=sector, **metrics.as_row())
+    db.add(event)
+    return event
+
+def get_pipeline_run_summaries(db: Session, limit: int = 20, offset: int = 0):
+    """Summarize the most recent runs, newest first.
+
+    Per-run totals are aggregated from ``pipeline_trends`` (trend outcomes)
+    and ``pipeline_stage_events`` (timing, upstream usage and source
+    counts) with one grouped query each, regardless of the page size.
+
+    :param db: Active SQLAlchemy ``Session``.
+    :param limit: Maximum runs to return.
+    :param offset: Runs to skip.
+    :returns: Tuple ``(summaries, total_count)``; each summary is a dict with
+        the run's columns, ``trends`` (count per status), totals and ``stages``
+        (per-stage aggregates).
+    """
+    total_count = db.query(func.count(models.PipelineRun.id)).scalar()
+    runs = db.query(models.PipelineRun).order_by(models.PipelineRun.id.desc()).offset(offset).limit(limit).all()
+    run_ids = [run.id for run in runs]
+    if not run_ids:
+        return [], total_count
+
+    trends: dict[int, dict[str, int]] = {run_id: {} for run_id in run_ids}
+    for run_id, status, count in (
+        db.query(models.PipelineTrend.run_id, models.PipelineTrend.status, func.count())
+        .filter(models.PipelineTrend.run_id.in_(run_ids))
+        .group_by(models.PipelineTrend.run_id, models.PipelineTrend.status)
+    ):
+        trends[run_id][status] = count
+
+    event = models.PipelineStageEvent
+    stages: dict[int, dict[str, dict]] = {run_id: {} for run_id in run_ids}
+    for row in (
+        db.query(
+            event.run_id,
+            event.stage,
+            func.count().label("count"),
+            func.sum(case((event.outcome == "error", 1), else_=0)).label("errors"),
+            func.avg(event.duration_ms).label("avg_duration_ms"),
+            func.max(event.duration_ms).label("max_duration_ms"),
+            func.sum(event.upstream_calls).label("upstream_calls"),
+            func.sum(event.upstream_ms).label("upstream_ms"),
+            func.sum(event.prompt_tokens).label("prompt_tokens"),
+            func.sum(event.completion_tokens).label("completion_tokens"),
+            func.sum(event.total_tokens).label("total_tokens"),
+            func.sum(event.sources_provided).label("sources_provided"),
+            func.sum(event.sources_cited).label("sources_cited"),
+            func.sum(event.sources_removed).label("sources_removed"),
+        )
+        .filter(event.run_id.in_(run_ids))
+        .group_by(event.run_id, event.stage)
+    ):
+        stages[row.run_id][row.stage] = {
+            "count": row.count,
+            "errors": row.errors or 0,
+            "avg_duration_ms": round(row.avg_duration_ms or 0, 1),
+            "max_duration_ms": round(row.max_duration_ms or 0, 1),
+            "upstream_calls": row.upstream_calls or 0,
+            "upstream_ms": round(row.upstream_ms or 0, 1),
+            "prompt_tokens": row.prompt_tokens or 0,
+            "completion_tokens": row.completion_tokens or 0,
+            "total_tokens": row.total_tokens or 0,
+        }
+        if row.sources_provided is not None:
+            stages[row.run_id][row.stage].update(
+                sources_provided=row.sources_provided,
+                sources_cited=row.sources_cited,
+                sources_removed=row.sources_removed,
+            )
+
+    summaries = []
+    for run in runs:
+        run_stages = stages[run.id]
+        persist = run_stages.get("persist", {})
+        duration = (run.finished_at - run.started_at).total_seconds() if run.finished_at else None
+        articles = trends[run.id].get("done", 0)
+        summaries.append({
+            "id": run.id,
+            "status": run.status,
+            "sectors": run.sectors,
+            "started_at": run.started_at,
+            "finished_at": run.finished_at,
+            "duration_seconds": duration,
+            "trends": trends[run.id],
+            "articles_created": articles,
+            "articles_per_minute": round(articles * 60 / duration, 2) if duration else None,
+            "upstream_calls": sum(stage["upstream_calls"] for stage in run_stages.values()),
+            "prompt_tokens": sum(stage["prompt_tokens"] for stage in run_stages.values()),
+            "completion_tokens": sum(stage["completion_tokens"] for stage in run_stages.values()),
+            "total_tokens": sum(stage["total_tokens"] for stage in run_stages.values()),
+            "sources_provided": persist.get("sources_provided", 0),
+            "sources_cited": persist.get("sources_cited", 0),
+            "sources_removed": persist.get("sources_removed", 0),
+            "stages": run_stages,
+        })
+    return summaries, total_count
+
+def get_sector_yield_stats(db: Session, since: datetime, host_since: Optional[datetime] = None) -> dict[str, dict]:
+    """Aggregate each sector's ingest yield from the run history since ``since``.
+
+    Upstream calls and trend searches come from ``pipeline_stage_events``
+    (a ``skipped`` trend search found too few topics), persisted articles
+    and their impact scores from finished ``pipeline_trends`` and claim
+    times from ``pipeline_runs``; one grouped query each. Run and trend
+    times are set by the database's ``now()``, stage events are timed on
+    the app host, so each table is filtered on its own clock.
+
+    :param db: Active SQLAlchemy ``Session``.
+    :param since: Start of the history window on the database clock.
+    :param host_since: The same start on the app host's clock (defaults to ``since``).
+    :returns: Mapping of sector to a dict with ``searches``, ``skipped``,
+        ``upstream_calls``, ``articles``, ``impact_sum`` and ``last_claimed``
+        (``None`` if not claimed in the window).
+    """
+    stats: dict[str, dict] = {}
+
+    def sector_stats(sector: str) -> dict:
+        return stats.setdefault(sector, {"searches": 0, "skipped": 0, "upstream_calls": 0, "articles": 0, "impact_sum": 0, "last_claimed": None})
+
+    event = models.PipelineStageEvent
+    for sector, searches, skipped, upstream_calls in db.execute(
+        select(
+            event.sector,
+            func.sum(case((event.stage == "trend_search", 1), else_=0)),
+            func.sum(case(((event.stage == "trend_search") & (event.outcome == "skipped"), 1), else_=0)),
+            func.sum(event.upstream_calls),
+        ).where(event.started_at >= (since if host_since is None else host_since)).group_by(event.sector)
+    ):
+        sector_stats(sector).update(searches=searches or 0, skipped=skipped or 0, upstream_calls=upstream_calls or 0)
+
+    trend = models.PipelineTrend
+    for sector, articles, impact_sum in db.execute(
+        select(trend.sector, func.count(), func.sum(func.coalesce(trend.impact_score, 0)))
+        .where(trend.status == "done", trend.article_id.is_not(None), trend.updated_at >= since)
+        .group_by(trend.sector)
+    ):
+        sector_stats(sector).update(articles=articles, impact_sum=impact_sum or 0)
+
+    for sectors, started_at in db.execute(select(models.PipelineRun.sectors, models.PipelineRun.started_at).where(models.PipelineRun.started_at >= since)):
+        for sector in sectors or []:
+            entry = sector_stats(sector)
+            if entry["last_claimed"] is None or started_at > entry["last_claimed"]:
+                entry["last_claimed"] = started_at
+    return stats
+
+def take_rate_limit_tokens(db: Session, key: str, amount: float, rate: float, capacity: float, now: float) -> float:
+    """Refill rate-limit bucket ``key`` up to ``now`` and take ``amount`` from it.
+
+    The bucket row is locked until the caller commits, so concurrent
+    processes take from it one at a time. A missing bucket is created full.
+    Nothing is committed.
+
+    :param db: Active SQLAlchemy ``Session``.
+    :param key: Bucket name.
+    :param amount: Units to take (negative to refund).
+    :param rate: Refill rate in units per second.
+    :param capacity: Maximum bucket level.
+    :param now: Current Unix time in seconds.
+    :returns: The new level; negative when the caller has to wait for it to refill.
+    """
+    # A no-op UPDATE takes the row lock on every backend (SQLite ignores FOR UPDATE)
+    locked = db.execute(update(models.RateLimitBucket).where(models.RateLimitBucket.key == key).values(updated_at=models.RateLimitBucket.updated_at))
+    if locked.rowcount == 0:
+        db.execute(_dialect_insert(db)(models.RateLimitBucket).values(key=key, tokens=capacity, updated_at=now).on_conflict_do_nothing(index_elements=["key"]))
+    bucket = db.query(models.RateLimitBucket).filter(models.RateLimitBucket.key == key).with_for_update().populate_existing().one()
+
+    # A clock behind the last writer's adds nothing rather than draining the bucket
+    level = min(capacity, bucket.tokens + max(0.0, now - bucket.updated_at) * rate) - amount
+    bucket.tokens = min(capacity, level)
+    bucket.updated_at = max(bucket.updated_at, now)
+    db.flush()
+    return level
+
+SOURCE_TRUST_VERSION_KEY = "source_trust_version"
+
+def get_source_trust_version(db: Session) -> Optional[int]:
+    """Return the source trust registry version (``None`` if it was never initialized).
+
+    :param db: Active SQLAlchemy ``Session``.
+    """
+    value = get_system_state(db, SOURCE_TRUST_VERSION_KEY)
+    return int(value) if value is not None else None
+
+def _init_source_trust(db: Session):
+    """Seed a registry that was never initialized (e.g. created with ``create_all``) with the built-in lists."""
+    from backend.services.domain_trust import normalize_host
+    from backend.services.source_services import CREDIBLE_SOURCES, BLACKLISTED_SOURCES
+
+    # Normalized like the migration seeds them, so both paths store the same domains
+    verdicts = {normalize_host(domain): "trusted" for domain in CREDIBLE_SOURCES}
+    verdicts.update({normalize_host(domain): "blacklisted" for domain in BLACKLISTED_SOURCES})
+    db.execute(
+        _dialect_insert(db)(models.SourceTrust)
+        .values([{"domain": domain, "verdict": verdict, "weight": 1.0, "note": "built-in list"} for domain, verdict in sorted(verdicts.items()) if domain])
+        .on_conflict_do_nothing(index_elements=["domain"])
+    )
+    set_system_state(db, SOURCE_TRUST_VERSION_KEY, "0")
+
+def _bump_source_trust_version(db: Session):
+    """Increment the registry version in the caller's transaction."""
+    bumped = db.execute(
+        update(models.SystemState)
+        .where(models.SystemState.key == SOURCE_TRUST_VERSION_KEY)
+        .values(value=sql_cast(sql_cast(models.SystemState.value, Integer) + 1, String), updated_at=func.now())
+    )
+    if bumped.rowcount == 0:
+        set_system_state(db, SOURCE_TRUST_VERSION_KEY, "1")
+
+def get_source_trust_rules(db: Session) -> list[tuple[str, str, float]]:
+    """Return every source trust rule as ``(domain, verdict, weight)``.
+
+    :param db: Active SQLAlchemy ``Session``.
+    """
+    rules = db.query(models.SourceTrust.domain, models.SourceTrust.verdict, models.SourceTrust.weight).all()
+    return [(domain, verdict, weight) for domain, verdict, weight in rules]
+
+def list_source_trust(db: Session, search: Optional[str] = None, verdict: Optional[str] = None, limit: int = 50, offset: int = 0):
+    """Get paginated source trust rules ordered by domain.
+
+    :param db: Active SQLAlchemy ``Session``.
+    :param search: Optional substring of the domain.
+    :param verdict: Optional ``trusted``/``blacklisted`` filter.
+    :param limit: Maximum number of rules to return.
+    :param offset: Number of rules to skip.
+    :returns: Tuple of ``(rules_list, total_count)``.
+    """
+    query = db.query(models.SourceTrust)
+    if search:
+        query = query.filter(models.SourceTrust.domain.ilike(f"%{search}%"))
+    if verdict:
+        query = query.filter(models.SourceTrust.verdict == verdict)
+    total_count = query.count()
+    return query.order_by(models.SourceTrust.domain).offset(offset).limit(limit).all(), total_count
+
+def upsert_source_trust(db: Session, domain: str, verdict: str, weight: float = 1.0, note: Optional[str] = None):
+    """Create or replace the trust rule for ``domain`` and bump the registry version.
+
+    The first edit of a registry that was never initialized seeds it with
+    the built-in lists, so they are not dropped.
+
+    :param db: Active SQLAlchemy ``Session``.
+    :param domain: Normalized domain.
+    :param verdict: ``trusted`` or ``blacklisted``.
+    :param weight: Ranking weight among trusted sources.
+    :param note: Optional reason for the rule.
+    :returns: The committed :class:`models.SourceTrust`.
+    """
+    try:
+        if get_source_trust_version(db) is None:
+            _init_source_trust(db)
+        db.execute(
+            _dialect_insert(db)(models.SourceTrust)
+            .values(domain=domain, verdict=verdict, weight=weight, note=note)
+            .on_conflict_do_update(index_elements=["domain"], set_={"verdict": verdict, "weight": weight, "note": note, "updated_at": func.now()})
+        )
+        _bump_source_trust_version(db)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return db.query(models.SourceTrust).filter(models.SourceTrust.domain == domain).populate_existing().one()
+
+def delete_source_trust(db: Session, domain: str) -> bool:
+    """Delete the trust rule for ``domain`` and bump the registry version.
+
+    :param db: Active SQLAlchemy ``Session``.
+    :param domain: Normalized domain.
+    :returns: ``True`` if a rule was deleted.
+    """
+    try:
+        if get_source_trust_version(db) is None:
+            _init_source_trust(db)
+        deleted = db.execute(delete(models.SourceTrust).where(models.SourceTrust.domain == domain)).rowcount
+        if deleted:
+            _bump_source_trust_version(db)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return bool(deleted)
@@ -6,10 +6,18 @@ configuration, exposes the declarative base for models, and provides a
 """
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
 from backend.config import settings
 
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True) # type: ignore
+def _pool_options(database_url: str) -> dict:
+    """Return pool sizing for ``database_url`` (in-memory SQLite uses a per-thread pool without overflow)."""
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {"pool_size": max(1, settings.DB_POOL_SIZE), "max_overflow": max(0, settings.DB_MAX_OVERFLOW)}
+
+engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True, **_pool_options(settings.DATABASE_URL)) # type: ignore
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -3,9 +3,19 @@
 Defines the primary tables and association tables used by the system:
 - Article, Source, Tag and SystemState plus the many-to-many association
     tables used to link articles to sources and tags.
+- SectorRotation, the round-robin position of the ingest sector rotation.
+- PipelineRun and PipelineTrend, which checkpoint the per-trend stage
+    outputs of ingest runs so interrupted runs can be resumed. PipelineTrend
+    rows double as the durable job queue consumed by summarization workers.
+- PipelineStageEvent, the per-stage timing, upstream usage and source
+    counts recorded for every trend a run processes.
+- RateLimitBucket, the shared token-bucket state used by the upstream rate
+    limiter when several processes draw from the same provider limits.
+- SourceTrust, the editable per-domain trust/blacklist rules used to
+    classify sources.
 """
 
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, Table, TIMESTAMP
+from sqlalchemy import Column, Integer, Float, String, Text, ForeignKey, Index, Table, TIMESTAMP, JSON, func
 from sqlalchemy.orm import relationship
 from backend.db.database import Base
 
@@ -13,14 +23,17 @@ source_articles = Table(
     "source_articles",
     Base.metadata,
     Column("article_id", Integer, ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True),
-    Column("source_id", Integer, ForeignKey("sources.id", ondelete="CASCADE"), primary_key=True),
+    # Indexed on its own for reverse lookups; the primary key leads with article_id
+    Column("source_id", Integer, ForeignKey("sources.id", ondelete="CASCADE"), primary_key=True, index=True),
+    # 1-based citation number of the source in the article text; NULL on links stored before it was recorded
+    Column("position", Integer, nullable=True),
 )
 
 article_tags = Table(
     "article_tags",
     Base.metadata,
     Column("article_id", Integer, ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True),
-    Column("tag_id", Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+    Column("tag_id", Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True, index=True),
 )
 
 class Article(Base):
@@ -31,15 +44,20 @@ class Article(Base):
     :ivar content: Full article body.
     :ivar created_at: Timestamp of creation.
     :ivar impact_score: Integer score for estimated impact.
+    :ivar sector: Sector the article was ingested under.
+    :ivar secondary_sectors: Other sectors its keywords match, best first.
     """
     __tablename__ = 'articles'
+    # Serves sector filters and per-sector listings newest first
+    __table_args__ = (Index("ix_articles_sector_created_at", "sector", "created_at"),)
     
     id = Column(Integer, primary_key=True)
     title = Column(String)
     content = Column(Text)
-    created_at = Column(TIMESTAMP, server_default="CURRENT_TIMESTAMP", nullable=False)
+    created_at = Column(TIMESTAMP, server_default=func.now(), nullable=False, index=True)
     impact_score = Column(Integer, default=-1)
     sector = Column(String, default="General")
+    secondary_sectors = Column(JSON, nullable=False, default=list, server_default="[]")
     
     sources = relationship('Source', secondary=source_articles, back_populates='articles')
     tags = relationship('Tag', secondary='article_tags', back_populates='articles')
@@ -49,7 +67,9 @@ class Source(Base):
 
     :ivar id: Primary key.
     :ivar title: Human-readable source title.
-    :ivar url: Canonical URL for the source (unique).
+    :ivar url: URL the source was first seen under.
+    :ivar canonical_url: Normalized URL identifying the page (unique), see
+        :func:`backend.services.source_services.canonicalize_url`.
     :ivar domain: Extracted domain string.
     :ivar sector: Sector classification for the source.
     """
@@ -57,8 +77,9 @@ class Source(Base):
     
     id = Column(Integer, primary_key=True)
     title = Column(String)  
-    url = Column(String, unique=True, nullable=False)
-    domain = Column(String)  
+    url = Column(String, nullable=False)
+    canonical_url = Column(String, unique=True, index=True, nullable=False)
+    domain = Column(String, index=True)
     sector = Column(String)  
     
     articles = relationship('Article', secondary=source_articles, back_populates='sources')
@@ -89,4 +110,171 @@ class SystemState(Base):
     id = Column(Integer, primary_key=True)
     key = Column(String, unique=True, nullable=False)
     value = Column(Text, nullable=False)
-    updated_at = Column(TIMESTAMP, server_default="CURRENT_TIMESTAMP", nullable=False)
\ No newline at end of file
+    updated_at = Column(TIMESTAMP, server_default=func.now(), nullable=False)
+
+class SectorRotation(Base):
+    """Round-robin position of a sector rotation.
+
+    Runners advance it with a single ``UPDATE ... RETURNING`` statement,
+    so overlapping runs never claim the same position.
+
+    :ivar name: Rotation name (the ingest job uses ``default``).
+    :ivar sectors: Sector names in rotation order.
+    :ivar sector_count: Length of ``sectors`` (kept for in-database arithmetic).
+    :ivar current_index: Position of the next sector to claim.
+    :ivar cycle_count: Completed passes through the rotation.
+    :ivar last_run: When sectors were last claimed.
+    """
+    __tablename__ = 'sector_rotation'
+
+    name = Column(String, primary_key=True)
+    sectors = Column(JSON, nullable=False, default=list)
+    sector_count = Column(Integer, nullable=False, default=0, server_default="0")
+    current_index = Column(Integer, nullable=False, default=0, server_default="0")
+    cycle_count = Column(Integer, nullable=False, default=0, server_default="0")
+    last_run = Column(TIMESTAMP, nullable=True)
+
+class PipelineRun(Base):
+    """One execution of the ingest cron job.
+
+    :ivar id: Primary key.
+    :ivar status: ``running``, ``completed``, ``incomplete`` (some trends unfinished) or ``failed``.
+    :ivar sectors: JSON list of sectors claimed by the run.
+    :ivar started_at: Timestamp the run started.
+    :ivar finished_at: Timestamp the run ended, if it did.
+    """
+    __tablename__ = 'pipeline_runs'
+
+    id = Column(Integer, primary_key=True)
+    status = Column(String, nullable=False, default="running")
+    sectors = Column(JSON, nullable=False, default=list)
+    started_at = Column(TIMESTAMP, server_default=func.now(), nullable=False)
+    finished_at = Column(TIMESTAMP, nullable=True)
+
+    trends = relationship('PipelineTrend', back_populates='run', cascade='all, delete-orphan')
+    events = relationship('PipelineStageEvent', back_populates='run', cascade='all, delete-orphan')
+
+class PipelineTrend(Base):
+    """Checkpoint of a single trend's progress through the ingest pipeline.
+
+    Each stage output is stored as soon as it is available so a resumed run
+    can skip the upstream calls that already succeeded.
+
+    Rows are also queue jobs: a worker claims one by setting ``locked_by``
+    and ``locked_until`` (the visibility timeout) and incrementing
+    ``attempts``. A job whose lock expires becomes claimable again, and one
+    that runs out of attempts is dead-lettered with status ``dead``.
+
+    :ivar id: Primary key.
+    :ivar run_id: Run that discovered the trend.
+    :ivar sector: Sector the trend belongs to.
+    :ivar trend: Trending topic text.
+    :ivar status: Last completed stage: ``pending``, ``found``, ``summarized``, ``scored`` or ``done``;
+        ``dead`` once retries are exhausted.
+    :ivar found_articles: Output of the article search stage.
+    :ivar summary: Output of the summarize stage (``article``, ``sources``, ``tags``).
+    :ivar impact_score: Output of the scoring stage.
+    :ivar article_id: Persisted article, set in the same transaction that creates it.
+    :ivar error: Last error message, if the trend failed.
+    :ivar attempts: Number of times the job has been claimed.
+    :ivar locked_by: Worker currently holding the job.
+    :ivar locked_until: End of the current claim, or of the retry delay after a failure.
+    :ivar updated_at: Last time the checkpoint changed.
+    """
+    __tablename__ = 'pipeline_trends'
+
+    id = Column(Integer, primary_key=True)
+    run_id = Column(Integer, ForeignKey("pipeline_runs.id", ondelete="CASCADE"), nullable=False, index=True)
+    sector = Column(String, nullable=False)
+    trend = Column(String, nullable=False)
+    status = Column(String, nullable=False, default="pending", index=True)
+    found_articles = Column(JSON, nullable=True)
+    summary = Column(JSON, nullable=True)
+    impact_score = Column(Integer, nullable=True)
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="SET NULL"), nullable=True)
+    error = Column(Text, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    locked_by = Column(String, nullable=True)
+    locked_until = Column(TIMESTAMP, nullable=True, index=True)
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    run = relationship('PipelineRun', back_populates='trends')
+
+class PipelineStageEvent(Base):
+    """Metrics of one pipeline stage executed for a run.
+
+    Stages that serve several trends at once (``trend_search``,
+    ``impact_score_batch``) have no ``pipeline_trend_id``.
+
+    :ivar id: Primary key.
+    :ivar run_id: Run the stage belongs to.
+    :ivar pipeline_trend_id: Trend the stage processed, if it was trend-specific.
+    :ivar sector: Sector being processed.
+    :ivar stage: ``trend_search``, ``article_find``, ``summarize``, ``impact_score``,
+        ``impact_score_batch`` or ``persist``.
+    :ivar started_at: Timestamp the stage started.
+    :ivar duration_ms: Wall time of the stage.
+    :ivar upstream_calls: Upstream requests made, including retried attempts.
+    :ivar upstream_ms: Time spent waiting on upstream requests.
+    :ivar prompt_tokens: Prompt tokens from the API ``usage`` fields.
+    :ivar completion_tokens: Completion tokens from the API ``usage`` fields.
+    :ivar total_tokens: Total tokens from the API ``usage`` fields.
+    :ivar sources_provided: Sources handed to the summarizer (``persist`` only).
+    :ivar sources_cited: Sources kept because the article cites them (``persist`` only).
+    :ivar sources_removed: Uncited sources dropped (``persist`` only).
+    :ivar outcome: ``ok``, ``skipped`` (trend search found too few topics) or ``error``.
+    :ivar error: Error message when the stage failed.
+    """
+    __tablename__ = 'pipeline_stage_events'
+
+    id = Column(Integer, primary_key=True)
+    run_id = Column(Integer, ForeignKey("pipeline_runs.id", ondelete="CASCADE"), nullable=False, index=True)
+    pipeline_trend_id = Column(Integer, ForeignKey("pipeline_trends.id", ondelete="SET NULL"), nullable=True)
+    sector = Column(String, nullable=False)
+    stage = Column(String, nullable=False)
+    started_at = Column(TIMESTAMP, nullable=False)
+    duration_ms = Column(Float, nullable=False)
+    upstream_calls = Column(Integer, nullable=False, default=0)
+    upstream_ms = Column(Float, nullable=False, default=0)
+    prompt_tokens = Column(Integer, nullable=False, default=0)
+    completion_tokens = Column(Integer, nullable=False, default=0)
+    total_tokens = Column(Integer, nullable=False, default=0)
+    sources_provided = Column(Integer, nullable=True)
+    sources_cited = Column(Integer, nullable=True)
+    sources_removed = Column(Integer, nullable=True)
+    outcome = Column(String, nullable=False)
+    error = Column(Text, nullable=True)
+
+    run = relationship('PipelineRun', back_populates='events')
+
+class RateLimitBucket(Base):
+    """Token-bucket level shared by processes calling the same upstream provider.
+
+    :ivar key: Bucket name, e.g. ``perplexity:rpm`` or ``openai:gpt-4o-mini:tpm``.
+    :ivar tokens: Level at ``updated_at``; negative while callers wait out a debt.
+    :ivar updated_at: Unix time (seconds) the level was last computed.
+    """
+    __tablename__ = 'rate_limit_buckets'
+
+    key = Column(String, primary_key=True)
+    tokens = Column(Float, nullable=False)
+    updated_at = Column(Float, nullable=False)
+
+class SourceTrust(Base):
+    """Trust rule for a source domain and its subdomains.
+
+    :ivar id: Primary key.
+    :ivar domain: Domain the rule applies to, e.g. ``nature.com``.
+    :ivar verdict: ``trusted`` or ``blacklisted``.
+    :ivar weight: Ranking weight among trusted sources (higher is listed first).
+    :ivar note: Optional reason for the rule.
+    :ivar updated_at: Last change timestamp.
+    """
+    __tablename__ = 'source_trust'
+
+    id = Column(Integer, primary_key=True)
+    domain = Column(String, unique=True, nullable=False)
+    verdict = Column(String, nullable=False)
+    weight = Column(Float, nullable=False, default=1.0, server_default="1")
+    note = Column(Text, nullable=True)
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=False)
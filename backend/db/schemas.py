@@ -4,7 +4,9 @@ These models mirror the SQLAlchemy models for use as input/output
 models in FastAPI route handlers.
 """
 
-from pydantic import BaseModel
+from typing import Literal
+
+from pydantic import BaseModel, Field
 from datetime import datetime
 
 class SourceSchema(BaseModel):
@@ -47,6 +49,7 @@ class ArticleSchema(BaseModel):
     :ivar sources: List of attached sources.
     :ivar tags: List of tags.
     :ivar impact_score: Impact score integer.
+    :ivar secondary_sectors: Other sectors the article's keywords match.
     """
     id: int
     title: str
@@ -56,6 +59,7 @@ class ArticleSchema(BaseModel):
     tags: list[TagSchema] = []
     impact_score: int
     sector: str
+    secondary_sectors: list[str] = []
 
     class Config:
         from_attributes = True
@@ -69,6 +73,7 @@ class ArticleListSchema(BaseModel):
     :ivar created_at: Creation timestamp.
     :ivar impact_score: Optional impact score.
     :ivar tags: List of tags.
+    :ivar secondary_sectors: Other sectors the article's keywords match.
     """
     id: int
     title: str
@@ -77,6 +82,7 @@ class ArticleListSchema(BaseModel):
     impact_score: int | None = None
     tags: list[TagSchema] = []
     sector: str
+    secondary_sectors: list[str] = []
 
     class Config:
         from_attributes = True
@@ -138,4 +144,132 @@ class ChatResponse(BaseModel):
     :ivar messages: Conversation history after the request.
     """
     response: str
-    messages: list[dict]
\ No newline at end of file
+    messages: list[dict]
+class StageSummarySchema(BaseModel):
+    """Aggregated metrics of one pipeline stage within a run.
+
+    :ivar count: Times the stage ran.
+    :ivar errors: Times the stage failed.
+    :ivar avg_duration_ms: Mean wall time.
+    :ivar max_duration_ms: Longest wall time.
+    :ivar upstream_calls: Upstream requests made, including retries.
+    :ivar upstream_ms: Total time spent waiting on upstream requests.
+    :ivar prompt_tokens: Prompt tokens reported by the provider.
+    :ivar completion_tokens: Completion tokens reported by the provider.
+    :ivar total_tokens: Total tokens reported by the provider.
+    :ivar sources_provided: Sources handed to the summarizer (``persist`` only).
+    :ivar sources_cited: Sources cited by the articles (``persist`` only).
+    :ivar sources_removed: Uncited sources dropped (``persist`` only).
+    """
+    count: int
+    errors: int
+    avg_duration_ms: float
+    max_duration_ms: float
+    upstream_calls: int
+    upstream_ms: float
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+    sources_provided: int | None = None
+    sources_cited: int | None = None
+    sources_removed: int | None = None
+
+class PipelineRunSummarySchema(BaseModel):
+    """Summary of one ingest run for the admin run report.
+
+    :ivar id: Run id.
+    :ivar status: ``running``, ``completed``, ``incomplete`` or ``failed``.
+    :ivar sectors: Sectors claimed by the run.
+    :ivar started_at: Start timestamp.
+    :ivar finished_at: End timestamp, if the run ended.
+    :ivar duration_seconds: Wall time of the run, if it ended.
+    :ivar trends: Number of the run's trends per status.
+    :ivar articles_created: Trends persisted as articles.
+    :ivar articles_per_minute: Throughput of the run, if it ended.
+    :ivar upstream_calls: Upstream requests made by all stages.
+    :ivar prompt_tokens: Prompt tokens used by all stages.
+    :ivar completion_tokens: Completion tokens used by all stages.
+    :ivar total_tokens: Total tokens used by all stages.
+    :ivar sources_provided: Sources handed to the summarizer.
+    :ivar sources_cited: Sources cited by the persisted articles.
+    :ivar sources_removed: Uncited sources dropped.
+    :ivar stages: Aggregated metrics per stage name.
+    """
+    id: int
+    status: str
+    sectors: list[str]
+    started_at: datetime
+    finished_at: datetime | None = None
+    duration_seconds: float | None = None
+    trends: dict[str, int]
+    articles_created: int
+    articles_per_minute: float | None = None
+    upstream_calls: int
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+    sources_provided: int
+    sources_cited: int
+    sources_removed: int
+    stages: dict[str, StageSummarySchema]
+
+class PaginatedRunsResponse(BaseModel):
+    """Response model for the paginated admin run report.
+
+    :ivar items: Run summaries, newest first.
+    :ivar total_count: Total number of runs.
+    :ivar page: Current page number.
+    :ivar page_size: Items per page.
+    :ivar total_pages: Total pages available.
+    """
+    items: list[PipelineRunSummarySchema]
+    total_count: int
+    page: int
+    page_size: int
+    total_pages: int
+
+class SourceTrustSchema(BaseModel):
+    """Trust rule for a source domain.
+
+    :ivar domain: Domain the rule applies to (and its subdomains).
+    :ivar verdict: ``trusted`` or ``blacklisted``.
+    :ivar weight: Ranking weight among trusted sources.
+    :ivar note: Optional reason for the rule.
+    :ivar updated_at: Last change timestamp.
+    """
+    domain: str
+    verdict: str
+    weight: float
+    note: str | None = None
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class SourceTrustUpdate(BaseModel):
+    """Request body creating or replacing a source trust rule.
+
+    :ivar verdict: ``trusted`` or ``blacklisted``.
+    :ivar weight: Ranking weight among trusted sources (default 1).
+    :ivar note: Optional reason for the rule.
+    """
+    verdict: Literal["trusted", "blacklisted"]
+    weight: float = Field(1.0, ge=0)
+    note: str | None = None
+
+class PaginatedSourceTrustResponse(BaseModel):
+    """Response model for the paginated source trust rule list.
+
+    :ivar version: Registry version; changes with every edit.
+    :ivar items: Rules ordered by domain.
+    :ivar total_count: Total number of matching rules.
+    :ivar page: Current page number.
+    :ivar page_size: Items per page.
+    :ivar total_pages: Total pages available.
+    """
+    version: int | None = None
+    items: list[SourceTrustSchema]
+    total_count: int
+    page: int
+    page_size: int
+    total_pages: int
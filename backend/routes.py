@@ -18,21 +18,36 @@ send_message
     Send a message in a chat session and return assistant response.
 close_chat_session
     Close and cleanup a chat session.
+get_pipeline_runs
+    Admin report of recent ingest runs (requires ``X-Admin-Key``).
+list_source_trust_rules
+    List the source trust registry (requires ``X-Admin-Key``).
+put_source_trust_rule
+    Create or replace a source trust rule (requires ``X-Admin-Key``).
+delete_source_trust_rule
+    Delete a source trust rule (requires ``X-Admin-Key``).
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException
 from sqlalchemy.orm import Session
+from backend.config import settings
 from backend.db.database import get_db
-from backend.db.crud import get_all_articles, get_article_by_id
+from backend.db.crud import (
+    get_all_articles, get_article_by_id, get_pipeline_run_summaries,
+    get_source_trust_version, list_source_trust, upsert_source_trust, delete_source_trust
+)
 from backend.db.schemas import (
     ArticleSchema, SessionCreateRequest, SessionResponse,
-    ChatRequest, ChatResponse, PaginatedArticlesResponse
+    ChatRequest, ChatResponse, PaginatedArticlesResponse, PaginatedRunsResponse,
+    SourceTrustSchema, SourceTrustUpdate, PaginatedSourceTrustResponse
 )
+from backend.services.domain_trust import normalize_host, is_public_suffix, reload_domain_trust
 from backend.services.openai_service import openai_chat_service
 from backend.services.session_service import (
     create_session_with_context, get_session, add_message_to_session,
     get_session_messages, end_session, get_session_article_id
 )
+import hmac
 import logging
 from typing import Optional
 from fastapi import Query
@@ -41,6 +56,16 @@ router = APIRouter()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def require_admin(x_admin_key: Optional[str] = Header(None)):
+    """Reject requests without the admin key in the ``X-Admin-Key`` header.
+
+    :param x_admin_key: Value of the ``X-Admin-Key`` header.
+    :raises HTTPException: 403 if the key is missing or wrong, or if no
+        ``ADMIN_API_KEY`` is configured.
+    """
+    if not settings.ADMIN_API_KEY or not x_admin_key or not hmac.compare_digest(x_admin_key, settings.ADMIN_API_KEY):
+        raise HTTPException(status_code=403, detail="Admin key required")
+
 @router.get("/articles", response_model=PaginatedArticlesResponse)
 def get_articles(
     db: Session = Depends(get_db),
@@ -203,4 +228,114 @@ def close_chat_session(session_id: str):
             raise HTTPException(status_code=404, detail="Session not found")
     except Exception as e:
         logger.error(f"Error closing session: {e}", exc_info=True)
-        raise
\ No newline at end of file
+        raise
+
+
+@router.get("/admin/runs", response_model=PaginatedRunsResponse, dependencies=[Depends(require_admin)])
+def get_pipeline_runs(
+    db: Session = Depends(get_db),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100)):
+    """Report recent ingest runs with per-stage timing, token usage and source counts.
+
+    :param db: Injected database session.
+    :param page: Page number (1-indexed, default 1).
+    :param page_size: Number of runs per page (default 20, max 100).
+    :returns: Paginated run summaries, newest first.
+    :raises: HTTPException 403 without a valid admin key, or Exception on database errors.
+    """
+    try:
+        runs, total_count = get_pipeline_run_summaries(db, limit=page_size, offset=(page - 1) * page_size)
+        return {
+            "items": runs,
+            "total_count": total_count,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": (total_count + page_size - 1) // page_size
+        }
+    except Exception as e:
+        logger.error(f"Error in get_pipeline_runs: {e}", exc_info=True)
+        raise
+
+def _rule_domain(domain: str) -> str:
+    """Normalize ``domain`` from the URL path, rejecting public suffixes with a 400."""
+    normalized = normalize_host(domain)
+    if is_public_suffix(normalized):
+        raise HTTPException(status_code=400, detail=f"'{domain}' is a public suffix, not a source domain")
+    return normalized
+
+@router.get("/admin/source-trust", response_model=PaginatedSourceTrustResponse, dependencies=[Depends(require_admin)])
+def list_source_trust_rules(
+    db: Session = Depends(get_db),
+    search: Optional[str] = Query(None),
+    verdict: Optional[str] = Query(None, pattern="^(trusted|blacklisted)$"),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=500)):
+    """List source trust rules ordered by domain.
+
+    :param db: Injected database session.
+    :param search: Optional substring of the domain.
+    :param verdict: Optional ``trusted``/``blacklisted`` filter.
+    :param page: Page number (1-indexed, default 1).
+    :param page_size: Number of rules per page (default 50, max 500).
+    :returns: Paginated rules and the registry version.
+    :raises: HTTPException 403 without a valid admin key, or Exception on database errors.
+    """
+    try:
+        rules, total_count = list_source_trust(db, search=search, verdict=verdict, limit=page_size, offset=(page - 1) * page_size)
+        return {
+            "version": get_source_trust_version(db),
+            "items": rules,
+            "total_count": total_count,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": (total_count + page_size - 1) // page_size
+        }
+    except Exception as e:
+        logger.error(f"Error in list_source_trust_rules: {e}", exc_info=True)
+        raise
+
+@router.put("/admin/source-trust/{domain}", response_model=SourceTrustSchema, dependencies=[Depends(require_admin)])
+def put_source_trust_rule(domain: str, request: SourceTrustUpdate, db: Session = Depends(get_db)):
+    """Create or replace the trust rule for ``domain`` (and its subdomains).
+
+    The change is visible to this process immediately and to other API and
+    ingest processes within ``SOURCE_TRUST_RELOAD_SECONDS``.
+
+    :param domain: Domain the rule applies to.
+    :param request: Verdict, weight and optional note.
+    :param db: Injected database session.
+    :returns: The stored rule.
+    :raises: HTTPException 400 for a public suffix, 403 without a valid admin key.
+    """
+    domain = _rule_domain(domain)
+    try:
+        rule = upsert_source_trust(db, domain, request.verdict, request.weight, request.note)
+        reload_domain_trust()
+        logger.info(f"Source trust rule for {domain} set to {request.verdict} (weight {request.weight})")
+        return rule
+    except Exception as e:
+        logger.error(f"Error in put_source_trust_rule: {e}", exc_info=True)
+        raise
+
+@router.delete("/admin/source-trust/{domain}", dependencies=[Depends(require_admin)])
+def delete_source_trust_rule(domain: str, db: Session = Depends(get_db)):
+    """Delete the trust rule for ``domain``.
+
+    :param domain: Domain of the rule.
+    :param db: Injected database session.
+    :returns: Confirmation message.
+    :raises: HTTPException 404 if there is no rule for ``domain``, 403 without a valid admin key.
+    """
+    domain = normalize_host(domain)
+    try:
+        if not delete_source_trust(db, domain):
+            raise HTTPException(status_code=404, detail="Rule not found")
+        reload_domain_trust()
+        logger.info(f"Source trust rule for {domain} deleted")
+        return {"message": "Rule deleted"}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in delete_source_trust_rule: {e}", exc_info=True)
+        raise
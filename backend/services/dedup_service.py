@@ -0,0 +1,187 @@
+"""Near-duplicate detection for trending topics.
+
+Trend searches regularly return close rephrasings of articles already
+published earlier in the rotation. :class:`TrendDeduplicator` keeps an
+in-memory inverted index over the word shingles of recent article titles
+and tags so that such trends can be dropped before any article search,
+summarization or scoring call is made.
+
+Similarity between a trend ``q`` and an article with title ``t`` and tags
+``g`` (all as sets of normalized word shingles) is a tag-aware Jaccard::
+
+    |q ∩ (t ∪ g)| / |q ∪ t|
+
+which equals plain title Jaccard when tags add nothing, and gives credit
+for trend words an article only carries as tags. Trends scoring at or
+above ``settings.DEDUP_THRESHOLD`` are treated as duplicates.
+
+Functions
+---------
+shingles
+    Normalize text into a set of word shingles.
+"""
+
+import logging
+import re
+import threading
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have", "in", "into", "is",
+    "it", "its", "new", "of", "on", "or", "over", "the", "their", "this", "to", "with", "within", "amid",
+    "how", "why", "what", "now", "across", "after", "via",
+}
+
+def _stem(token: str) -> str:
+    """Very light suffix stripping so simple inflections compare equal."""
+    for suffix in ("ing", "ies", "es", "ed", "s"):
+        if len(token) > len(suffix) + 3 and token.endswith(suffix):
+            return token[: -len(suffix)] + ("y" if suffix == "ies" else "")
+    return token
+
+def shingles(text: str) -> set[str]:
+    """Return the normalized word shingles (stemmed unigrams, stopwords removed) of ``text``.
+
+    :param text: Title, topic or tag text.
+    :returns: Set of shingle strings.
+    """
+    return {_stem(token) for token in re.findall(r"[a-z0-9]+", text.lower()) if token not in STOPWORDS}
+
+class TrendDeduplicator:
+    """Thread-safe in-memory near-duplicate index over recent articles.
+
+    Build it from the database with :meth:`from_db`, check trends with
+    :meth:`filter_trends` and register newly persisted articles with
+    :meth:`add` so later checks in the same process see them.
+    """
+
+    def __init__(self, threshold: float):
+        """Create an empty index.
+
+        :param threshold: Similarity at or above which a trend is a duplicate (``<= 0`` disables).
+        """
+        self.threshold = threshold
+        self.skipped_count = 0
+        self._docs: dict[object, tuple[str, set[str], set[str]]] = {}
+        self._index: dict[str, set[object]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_db(cls, db: Session, days: Optional[int] = None, threshold: Optional[float] = None) -> "TrendDeduplicator":
+        """Build an index over articles created in the last ``days`` days.
+
+        :param db: Active SQLAlchemy ``Session``.
+        :param days: Look-back window (defaults to ``settings.DEDUP_LOOKBACK_DAYS``).
+        :param threshold: Duplicate threshold (defaults to ``settings.DEDUP_THRESHOLD``).
+        :returns: Populated :class:`TrendDeduplicator`.
+        """
+        from backend.config import settings
+        from backend.db.crud import get_recent_article_titles_and_tags
+
+        deduper = cls(settings.DEDUP_THRESHOLD if threshold is None else threshold)
+        since = datetime.now() - timedelta(days=settings.DEDUP_LOOKBACK_DAYS if days is None else days)
+        for article_id, title, tags in get_recent_article_titles_and_tags(db, since):
+            deduper.add(article_id, title, tags)
+        logger.info(f"Near-duplicate index built over {len(deduper._docs)} recent articles")
+        return deduper
+
+    def add(self, key: object, title: str, tags: Iterable[str] = ()):
+        """Index an article (or an accepted in-flight trend).
+
+        :param key: Unique key, normally the article id.
+        :param title: Article title.
+        :param tags: Tag names of the article.
+        """
+        title_shingles = shingles(title or "")
+        tag_shingles = set().union(*(shingles(tag) for tag in tags)) if tags else set()
+        with self._lock:
+            self._insert(key, title or "", title_shingles, tag_shingles)
+
+    def discard(self, trend: str):
+        """Remove an accepted in-flight trend, so a later run may pick it up again.
+
+        Call it when a trend kept by :meth:`filter_trends` did not become an
+        article; a persisted trend is indexed under its article id instead.
+
+        :param trend: Trending topic text as passed to :meth:`filter_trends`.
+        """
+        with self._lock:
+            self._remove(("trend", trend))
+
+    def _insert(self, key: object, title: str, title_shingles: set[str], tag_shingles: set[str]):
+        """Add a document to the index. Caller holds the lock."""
+        self._docs[key] = (title, title_shingles, tag_shingles)
+        for shingle in title_shingles | tag_shingles:
+            self._index.setdefault(shingle, set()).add(key)
+
+    def _remove(self, key: object):
+        """Drop a document from the index if present. Caller holds the lock."""
+        doc = self._docs.pop(key, None)
+        if doc is None:
+            return
+        for shingle in doc[1] | doc[2]:
+            keys = self._index.get(shingle)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._index[shingle]
+
+    def _best_match(self, query: set[str]) -> Optional[tuple[str, float]]:
+        """Return ``(title, score)`` of the most similar indexed doc. Caller holds the lock."""
+        candidates: set[object] = set()
+        for shingle in query:
+            candidates |= self._index.get(shingle, set())
+
+        best: Optional[tuple[str, float]] = None
+        for key in candidates:
+            title, title_shingles, tag_shingles = self._docs[key]
+            union = len(query | title_shingles)
+            score = len(query & (title_shingles | tag_shingles)) / union if union else 0.0
+            if best is None or score > best[1]:
+                best = (title, score)
+        return best
+
+    def find_duplicate(self, trend: str) -> Optional[tuple[str, float]]:
+        """Return the indexed title ``trend`` duplicates and its score, or ``None``.
+
+        :param trend: Trending topic text.
+        :returns: ``(matched_title, score)`` or ``None`` if below the threshold.
+        """
+        if self.threshold <= 0:
+            return None
+        query = shingles(trend)
+        if not query:
+            return None
+        with self._lock:
+            best = self._best_match(query)
+        return best if best and best[1] >= self.threshold else None
+
+    def filter_trends(self, trends: list[str]) -> tuple[list[str], list[tuple[str, str, float]]]:
+        """Split ``trends`` into new ones and near-duplicates.
+
+        Accepted trends are indexed immediately (keyed by their text) so that
+        duplicates within the same batch, or claimed concurrently by another
+        sector worker, are caught too. Trends that fail must be released with
+        :meth:`discard`.
+
+        :param trends: Trending topic texts.
+        :returns: ``(kept, skipped)`` where ``skipped`` holds ``(trend, matched_title, score)``.
+        """
+        kept: list[str] = []
+        skipped: list[tuple[str, str, float]] = []
+        for trend in trends:
+            query = shingles(trend)
+            with self._lock:
+                best = self._best_match(query) if query and self.threshold > 0 else None
+                if best and best[1] >= self.threshold:
+                    skipped.append((trend, best[0], round(best[1], 3)))
+                    self.skipped_count += 1
+                    continue
+                self._insert(("trend", trend), trend, query, set())
+            kept.append(trend)
+        return kept, skipped
@@ -0,0 +1,326 @@
+"""Hierarchical trust classification of source domains.
+
+Trust and blacklist rules are compiled into a suffix trie keyed by
+reversed domain labels (``news.bbc.co.uk`` -> ``uk``, ``co``, ``bbc``,
+``news``). A lookup walks the host's labels once and returns the most
+specific rule covering it, so a rule for ``nature.com`` also classifies
+``foo.nature.com``, a rule for ``youtube.com`` also catches
+``m.youtube.com``, and a more specific rule (``community.example.com``)
+overrides its parent.
+
+Lookups are public-suffix aware:
+
+- Rules naming a public suffix (``com``, ``co.uk``, ``ac.jp`` ...) are
+  rejected, since they would classify every site under it.
+- On shared-hosting suffixes (``blogspot.com``, ``github.io`` ...), each
+  subdomain belongs to a different owner. A trust rule there only covers
+  the exact host, while a blacklist rule still covers every tenant.
+
+Rules come from the ``source_trust`` table, which is edited through the
+admin API. Each process keeps an immutable, versioned snapshot of the
+compiled rules, so lookups never touch the database. At most every
+``SOURCE_TRUST_RELOAD_SECONDS`` one caller compares the snapshot with the
+registry version (a single-row query) and, if an edit bumped it, builds a
+new snapshot and swaps it in. Other callers keep using the current snapshot
+while this happens. ``CREDIBLE_SOURCES`` and ``BLACKLISTED_SOURCES`` are
+used until the registry has been initialized.
+
+When ``SOURCE_TRUST_FILE`` is set, the rules are read from that JSON file
+instead (``{"trusted": [...], "blacklisted": [...]}``, optionally with
+``"weights"`` and extra ``"shared_suffixes"``), reloaded when it changes.
+
+Functions
+---------
+normalize_host
+    Reduce a host name to the form used for lookups.
+is_public_suffix
+    Whether a domain is a public suffix that rules may not name.
+load_domain_trust_file
+    Build an index from a JSON rules file.
+get_domain_trust_index
+    Return the current snapshot, refreshing it if the rules changed.
+reload_domain_trust
+    Make the next lookup re-check the rules.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Iterable, NamedTuple, Optional
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+TRUSTED = "trusted"
+BLACKLISTED = "blacklisted"
+
+# Multi-label public suffixes (ICANN section of the Public Suffix List) that
+# sources are commonly registered under. Every single label (``com``,
+# ``uk`` ...) is a public suffix as well.
+PUBLIC_SUFFIXES = frozenset({
+    "ac.uk", "co.uk", "gov.uk", "ltd.uk", "me.uk", "net.uk", "nhs.uk", "org.uk", "plc.uk", "police.uk", "sch.uk",
+    "com.au", "edu.au", "gov.au", "net.au", "org.au",
+    "ac.nz", "co.nz", "govt.nz", "org.nz",
+    "ac.jp", "co.jp", "go.jp", "ne.jp", "or.jp",
+    "ac.kr", "co.kr", "go.kr", "or.kr",
+    "com.cn", "edu.cn", "gov.cn", "net.cn", "org.cn",
+    "com.hk", "edu.hk", "gov.hk", "org.hk",
+    "com.sg", "edu.sg", "gov.sg", "org.sg",
+    "ac.in", "co.in", "gov.in", "net.in", "org.in",
+    "ac.za", "co.za", "gov.za", "org.za",
+    "com.br", "edu.br", "gov.br", "org.br",
+    "com.mx", "edu.mx", "gob.mx", "org.mx",
+    "com.tr", "edu.tr", "gov.tr", "org.tr",
+    "ac.il", "co.il", "gov.il", "org.il",
+})
+
+# Private-section suffixes under which every subdomain is a separate tenant
+SHARED_HOSTING_SUFFIXES = frozenset({
+    "appspot.com", "azurewebsites.net", "blogspot.com", "cloudfront.net", "firebaseapp.com",
+    "ghost.io", "github.io", "githubusercontent.com", "gitlab.io", "herokuapp.com", "netlify.app",
+    "pages.dev", "readthedocs.io", "s3.amazonaws.com", "substack.com", "vercel.app", "web.app",
+    "wixsite.com", "wordpress.com",
+})
+
+class TrustMatch(NamedTuple):
+    """Rule that classified a host.
+
+    :ivar verdict: ``trusted`` or ``blacklisted``.
+    :ivar rule: Domain the rule was written for.
+    :ivar weight: Ranking weight among trusted sources.
+    """
+    verdict: str
+    rule: str
+    weight: float = 1.0
+
+def normalize_host(host: str) -> str:
+    """Reduce ``host`` to the form used for lookups.
+
+    Lower-cases it and drops a port, a trailing dot and a leading ``www.``.
+
+    :param host: Host name or domain, e.g. the result of ``extract_domain``.
+    :returns: Normalized host (empty for empty input).
+    """
+    host = (host or "").strip().lower()
+    if ":" in host:
+        if host.startswith("[") or host.count(":") > 1:
+            # IPv6 literal, possibly with a port
+            return host.split("]")[0].lstrip("[")
+        host = host.split(":", 1)[0]
+    if host.endswith("."):
+        host = host.rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    return host
+
+def is_public_suffix(domain: str) -> bool:
+    """Return whether normalized ``domain`` is a public suffix (``com``, ``co.uk`` ...)."""
+    return "." not in domain or domain in PUBLIC_SUFFIXES
+
+class _Node:
+    """One label of the suffix trie."""
+
+    __slots__ = ("children", "match", "inherited", "shared")
+
+    def __init__(self):
+        self.children: dict[str, "_Node"] = {}
+        # Rule for this exact host, and the rule its subdomains inherit
+        self.match: Optional[TrustMatch] = None
+        self.inherited: Optional[TrustMatch] = None
+        self.shared = False
+
+class DomainTrustIndex:
+    """Compiled suffix trie answering "which rule covers this host?" in O(labels)."""
+
+    def __init__(self, trusted: Iterable[str] = (), blacklisted: Iterable[str] = (), shared_suffixes: Iterable[str] = SHARED_HOSTING_SUFFIXES, weights: Optional[dict[str, float]] = None, version: Optional[int] = None):
+        """Compile the rules.
+
+        A domain listed as both trusted and blacklisted is blacklisted.
+
+        :param trusted: Domains (and implicitly their subdomains) to trust.
+        :param blacklisted: Domains (and their subdomains) to reject.
+        :param shared_suffixes: Suffixes whose subdomains are separate tenants.
+        :param weights: Optional ranking weight per domain (default 1).
+        :param version: Version of the rule set the index was built from.
+        """
+        self.version = version
+        weights = {normalize_host(domain): weight for domain, weight in (weights or {}).items()}
+        self._root = _Node()
+        for suffix in shared_suffixes:
+            self._node(normalize_host(suffix)).shared = True
+        self.size = 0
+        for verdict, domains in ((TRUSTED, trusted), (BLACKLISTED, blacklisted)):
+            for domain in domains:
+                domain = normalize_host(domain)
+                if not domain:
+                    continue
+                if is_public_suffix(domain):
+                    logger.warning(f"Ignoring {verdict} rule for public suffix '{domain}'")
+                    continue
+                node = self._node(domain)
+                if node.match is None:
+                    self.size += 1
+                node.match = TrustMatch(verdict, domain, weights.get(domain, 1.0))
+                # Trust set on a shared-hosting suffix does not extend to its tenants
+                node.inherited = None if node.shared and verdict == TRUSTED else node.match
+
+    def _node(self, domain: str) -> _Node:
+        """Return the trie node for ``domain``, creating the path if needed."""
+        node = self._root
+        for label in reversed(domain.split(".")):
+            node = node.children.setdefault(label, _Node())
+        return node
+
+    def lookup(self, host: str) -> Optional[TrustMatch]:
+        """Return the most specific rule covering ``host``.
+
+        :param host: Host name (``www.`` and ports are ignored).
+        :returns: The matching :class:`TrustMatch`, or ``None`` if no rule applies.
+        """
+        labels = normalize_host(host).split(".")
+        node = self._root
+        best = None
+        i = len(labels)
+        while i:
+            i -= 1
+            node = node.children.get(labels[i])
+            if node is None:
+                break
+            if i == 0:
+                return node.match or best
+            if node.inherited is not None:
+                best = node.inherited
+        return best
+
+    def classify(self, host: str) -> tuple[bool, bool]:
+        """Return ``(trusted, blacklisted)`` for ``host``."""
+        match = self.lookup(host)
+        if match is None:
+            return False, False
+        return match.verdict == TRUSTED, match.verdict == BLACKLISTED
+
+    @classmethod
+    def from_rules(cls, rules: Iterable[tuple[str, str, float]], version: Optional[int] = None) -> "DomainTrustIndex":
+        """Compile ``(domain, verdict, weight)`` rules, e.g. rows of the ``source_trust`` table.
+
+        :param rules: Rules to compile; unknown verdicts are ignored.
+        :param version: Version of the rule set.
+        :returns: The compiled :class:`DomainTrustIndex`.
+        """
+        trusted, blacklisted, weights = [], [], {}
+        for domain, verdict, weight in rules:
+            if verdict == TRUSTED:
+                trusted.append(domain)
+            elif verdict == BLACKLISTED:
+                blacklisted.append(domain)
+            weights[domain] = weight
+        return cls(trusted, blacklisted, weights=weights, version=version)
+
+def load_domain_trust_file(path: str) -> DomainTrustIndex:
+    """Build an index from a JSON rules file.
+
+    :param path: File with ``trusted`` and ``blacklisted`` lists, optional ``weights`` and ``shared_suffixes``.
+    :returns: The compiled :class:`DomainTrustIndex`.
+    :raises OSError: If the file cannot be read.
+    :raises ValueError: If the file is not valid JSON of the expected shape.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or not all(isinstance(data.get(key, []), list) for key in ("trusted", "blacklisted", "shared_suffixes")) or not isinstance(data.get("weights", {}), dict):
+        raise ValueError(f"{path} must be a JSON object with 'trusted' and 'blacklisted' lists")
+    return DomainTrustIndex(
+        trusted=data.get("trusted", []),
+        blacklisted=data.get("blacklisted", []),
+        shared_suffixes=SHARED_HOSTING_SUFFIXES | set(data.get("shared_suffixes", [])),
+        weights=data.get("weights"),
+    )
+
+def _default_index() -> DomainTrustIndex:
+    """Build the index from the built-in source lists."""
+    from backend.services.source_services import CREDIBLE_SOURCES, BLACKLISTED_SOURCES
+
+    return DomainTrustIndex(CREDIBLE_SOURCES, BLACKLISTED_SOURCES)
+
+def _load_registry(current_version: Optional[int]) -> Optional[DomainTrustIndex]:
+    """Build a snapshot of the ``source_trust`` table if its version differs from ``current_version``.
+
+    :returns: The new index, or ``None`` if the registry is unchanged or was never initialized.
+    """
+    from backend.db.database import SessionLocal
+    from backend.db.crud import get_source_trust_version, get_source_trust_rules
+
+    db = SessionLocal()
+    try:
+        version = get_source_trust_version(db)
+        if version is None or version == current_version:
+            return None
+        return DomainTrustIndex.from_rules(get_source_trust_rules(db), version=version)
+    finally:
+        db.close()
+
+_index: Optional[DomainTrustIndex] = None
+_index_lock = threading.Lock()
+_loaded_mtime: Optional[int] = None
+_checked_at = float("-inf")
+
+def _refresh():
+    """Swap in a new snapshot if the rule source changed (caller holds ``_index_lock``)."""
+    global _index, _loaded_mtime
+
+    path = settings.SOURCE_TRUST_FILE
+    if path:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+            if mtime != _loaded_mtime:
+                # Recorded up front so a broken file is reported once, not on every check
+                _loaded_mtime = mtime
+                _index = load_domain_trust_file(path)
+                logger.info(f"Loaded {_index.size} domain trust rules from {path}")
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not load domain trust rules from {path}: {e}, keeping the previous rules")
+        return
+
+    try:
+        index = _load_registry(_index.version if _index is not None else None)
+        if index is not None:
+            _index = index
+            logger.info(f"Loaded {index.size} domain trust rules (registry version {index.version})")
+    except Exception as e:
+        logger.error(f"Could not load domain trust rules from the database: {e}, keeping the previous rules")
+
+def get_domain_trust_index() -> DomainTrustIndex:
+    """Return the current rule snapshot, refreshing it if the rules changed.
+
+    The rule source is checked at most every ``SOURCE_TRUST_RELOAD_SECONDS``.
+    While one caller refreshes, the others keep using the current snapshot.
+    If the rules cannot be loaded, the previous snapshot stays in use (the
+    built-in lists on first load).
+
+    :returns: The current :class:`DomainTrustIndex`.
+    """
+    global _index, _checked_at
+
+    index = _index
+    if index is not None and time.monotonic() - _checked_at < settings.SOURCE_TRUST_RELOAD_SECONDS:
+        return index
+
+    # Only the first load waits; later refreshes are skipped if one is in progress
+    if not _index_lock.acquire(blocking=index is None):
+        return index
+    try:
+        if _index is None or time.monotonic() - _checked_at >= settings.SOURCE_TRUST_RELOAD_SECONDS:
+            _refresh()
+            _checked_at = time.monotonic()
+        if _index is None:
+            _index = _default_index()
+        return _index
+    finally:
+        _index_lock.release()
+
+def reload_domain_trust():
+    """Make the next :func:`get_domain_trust_index` call re-check the rules (e.g. after an edit)."""
+    global _checked_at
+    _checked_at = float("-inf")
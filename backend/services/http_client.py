@@ -0,0 +1,121 @@
+"""Shared, connection-pooled HTTP clients for upstream API calls.
+
+Creating a new connection for every request pays for a TCP and TLS
+handshake each time. This module owns one process-wide ``httpx.Client``
+and one ``httpx.AsyncClient`` per event loop, both configured with
+keep-alive pooling, connection limits and (optionally) HTTP/2, so
+concurrent callers reuse warm connections.
+
+Functions
+---------
+get_sync_client
+    Return the shared synchronous client.
+get_async_client
+    Return the shared asynchronous client for the running event loop.
+request_timeout
+    Build a per-call ``httpx.Timeout``.
+close_clients
+    Close the shared clients (used on shutdown).
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Optional
+
+import httpx
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_sync_client: Optional[httpx.Client] = None
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+DEFAULT_HEADERS = {"Content-Type": "application/json"}
+
+def _http2_enabled() -> bool:
+    """Return True when HTTP/2 is requested and the ``h2`` package is available."""
+    if not settings.HTTP2_ENABLED:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logger.warning("HTTP2_ENABLED is set but the 'h2' package is not installed, using HTTP/1.1")
+        return False
+    return True
+
+def _limits() -> httpx.Limits:
+    """Connection pool limits shared by the sync and async clients."""
+    return httpx.Limits(
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+    )
+
+def request_timeout(timeout: float) -> httpx.Timeout:
+    """Build a per-call timeout with the configured connect timeout.
+
+    :param timeout: Read/write/pool timeout in seconds for this call.
+    :returns: An ``httpx.Timeout`` instance.
+    """
+    return httpx.Timeout(timeout, connect=min(timeout, settings.HTTP_CONNECT_TIMEOUT))
+
+def get_sync_client() -> httpx.Client:
+    """Return the process-wide synchronous client, creating it on first use.
+
+    The client is thread-safe and intended to be shared by worker threads.
+
+    :returns: Shared ``httpx.Client``.
+    """
+    global _sync_client
+    if _sync_client is None:
+        with _lock:
+            if _sync_client is None:
+                _sync_client = httpx.Client(
+                    headers=DEFAULT_HEADERS,
+                    limits=_limits(),
+                    http2=_http2_enabled(),
+                    timeout=request_timeout(60),
+                )
+    return _sync_client
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the shared asynchronous client for the running event loop.
+
+    Async clients are bound to the loop they were created on, so one is
+    kept per loop and discarded with it.
+
+    :returns: Shared ``httpx.AsyncClient``.
+    :raises RuntimeError: If called outside of a running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
+            limits=_limits(),
+            http2=_http2_enabled(),
+            timeout=request_timeout(60),
+        )
+        _async_clients[loop] = client
+    return client
+
+def close_clients() -> None:
+    """Close the shared synchronous client.
+
+    Async clients are closed by :func:`aclose_clients` from their loop.
+    """
+    global _sync_client
+    with _lock:
+        if _sync_client is not None:
+            _sync_client.close()
+            _sync_client = None
+
+async def aclose_clients() -> None:
+    """Close the async client belonging to the running event loop."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -3,7 +3,8 @@
 Provides a thin wrapper around the OpenAI client used to generate
 assistant responses in the context of article-based conversations.
 The service maintains session state and conversation history for
-multi-turn dialogues.
+multi-turn dialogues. Requests wait for capacity under the configured
+OpenAI rate limits (see :mod:`backend.services.rate_limiter`).
 
 Functions
 ---------
@@ -16,14 +17,19 @@ from typing import Optional
 
 from backend.config import settings
 from backend.services.session_service import get_session
+from backend.services.response_cache import get_response_cache, make_cache_key
+from backend.services.rate_limiter import get_rate_limiter, estimate_tokens
 
-client = OpenAI(api_key=settings.OPENAI_API_KEY)
+client = OpenAI(api_key=settings.OPENAI_API_KEY, base_url=settings.OPENAI_BASE_URL)
+
+OPENAI_MODEL = "gpt-4o-mini"
 
 def openai_chat_service(
     message: Optional[str] = None,
     conversation_history: Optional[list] = None,
     article_id: Optional[int] = None,
     session_id: Optional[str] = None,
+    use_cache: bool = True,
 ):
     """Generate an AI response using OpenAI's chat completion API.
 
@@ -39,6 +45,8 @@ def openai_chat_service(
     :type article_id: int or None
     :param session_id: Unique session identifier to retrieve article context and conversation state.
     :type session_id: str or None
+    :param use_cache: Read/write the LLM response cache when it is configured.
+    :type use_cache: bool
     :returns: Dict with key 'response' containing the AI-generated answer as a string.
     :rtype: dict
     :raises ValueError: If message parameter is not provided.
@@ -92,13 +100,29 @@ def openai_chat_service(
         # Add current message
         messages.append({"role": "user", "content": message})
 
-        # Get response from OpenAI
+        # Identical conversations are served from the response cache when enabled
+        cache = get_response_cache() if use_cache else None
+        if cache:
+            key = make_cache_key(f"openai:{client.base_url}chat/completions", OPENAI_MODEL, messages)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        # Wait for rate-limit capacity, then get response from OpenAI
+        limiter = get_rate_limiter("openai", OPENAI_MODEL)
+        estimated = estimate_tokens(messages)
+        if limiter:
+            limiter.acquire(estimated)
         response = client.chat.completions.create(
-            model="gpt-4o-mini",
+            model=OPENAI_MODEL,
             messages=messages,
         )
+        if limiter and response.usage:
+            limiter.settle(estimated, response.usage.total_tokens)
 
         answer = response.choices[0].message.content
+        if cache and answer:
+            cache.set(key, {"response": answer})
         # Normalize return shape to a dict for consistency across callers
         return {"response": answer}
     else:
@@ -14,23 +14,163 @@ perplexity_summarize
     Summarize a list of sources into an article and extract tags.
 perplexity_impact_score
     Estimate an impact score for an article.
+perplexity_impact_score_batch
+    Estimate impact scores for several articles per request.
+perplexity_post_async
+    Send a raw chat/completions payload from async code.
+clean_tag
+    Normalize one tag parsed from a summary (``None`` if unusable).
+
+All calls go through the shared, connection-pooled clients in
+:mod:`backend.services.http_client`, so concurrent callers reuse warm
+connections instead of opening a new one per request. Transient failures
+are retried with backoff behind a per-model circuit breaker (see
+:mod:`backend.services.resilience`), and every request first waits for
+capacity under the configured rate limits (see
+:mod:`backend.services.rate_limiter`). When ``LLM_CACHE_DIR`` is set,
+successful responses are cached on disk by request content (see
+:mod:`backend.services.response_cache`); pass ``use_cache=False`` to bypass.
+Latency and token usage of each request are added to the active pipeline
+stage (see :mod:`backend.services.pipeline_metrics`).
 """
 
-from backend.services.source_services import extract_domain, CREDIBLE_SOURCES, BLACKLISTED_SOURCES
+from backend.services.source_services import extract_domain, canonicalize_url
+from backend.services.domain_trust import get_domain_trust_index, TRUSTED, BLACKLISTED
+from backend.services.http_client import get_sync_client, get_async_client, request_timeout
+from backend.services.resilience import get_breaker, call_with_retry, acall_with_retry
+from backend.services.response_cache import get_response_cache, make_cache_key
+from backend.services.rate_limiter import get_rate_limiter, estimate_tokens
+from backend.services.pipeline_metrics import record_upstream_call
 from backend.config import settings
 import re
-import requests
 import datetime
+import json
+import logging
+import time
 
-PERPLEXITY_ENDPOINT = "https://api.perplexity.ai/chat/completions"
+logger = logging.getLogger(__name__)
 
-#Find trends
-def perplexity_search_trends(sector: str | None, tags: list, count: int = 3):
-    headers = {
-        "Authorization": f"Bearer {settings.PERPLEXITY_API_KEY}",
-        "Content-Type": "application/json"
+PERPLEXITY_ENDPOINT = settings.PERPLEXITY_ENDPOINT
+
+# Built once; the shared client already sends Content-Type
+PERPLEXITY_HEADERS = {"Authorization": f"Bearer {settings.PERPLEXITY_API_KEY}"}
+
+def clean_tag(tag: str):
+    """Normalize a tag name: strip markdown/quote characters and collapse whitespace.
+
+    :param tag: Raw tag text.
+    :returns: The cleaned tag, or ``None`` if it is not 2-50 characters long.
+    """
+    cleaned = " ".join(tag.strip().strip('*#[]"\'').split())
+    if cleaned and 2 <= len(cleaned) <= 50:
+        return cleaned
+    return None
+
+def _trust_fields(trust_index, domain: str) -> dict:
+    """Return the ``trusted``, ``blacklisted`` and ``trust_weight`` fields of a found article."""
+    match = trust_index.lookup(domain)
+    return {
+        "trusted": match is not None and match.verdict == TRUSTED,
+        "blacklisted": match is not None and match.verdict == BLACKLISTED,
+        "trust_weight": match.weight if match is not None else 1.0,
     }
 
+def _breaker_for(payload: dict):
+    """Return the circuit breaker for the endpoint/model targeted by ``payload``."""
+    return get_breaker(f"perplexity:{payload.get('model', '')}")
+
+def _limiter_for(payload: dict):
+    """Return the rate limiter for the model targeted by ``payload`` (``None`` if unlimited)."""
+    return get_rate_limiter("perplexity", payload.get("model", ""))
+
+def _usage_tokens(data: dict):
+    """Return the total tokens reported in a response's ``usage``, if any."""
+    return (data.get("usage") or {}).get("total_tokens")
+
+def _cache_key(payload: dict) -> str:
+    """Return the response-cache key for ``payload``."""
+    return make_cache_key(PERPLEXITY_ENDPOINT, payload.get("model", ""), payload.get("messages", []), payload.get("temperature"))
+
+def _perplexity_post(payload: dict, timeout: float = 60, use_cache: bool = True) -> dict:
+    """POST ``payload`` to the Perplexity endpoint using the shared client.
+
+    Waits for rate-limit capacity before every attempt, retries
+    429/5xx/transport errors with backoff (honouring ``Retry-After``) and
+    fails fast while the model's circuit is open.
+
+    :param payload: Chat/completions request body.
+    :param timeout: Per-call timeout in seconds.
+    :param use_cache: Read/write the response cache when it is configured.
+    :returns: Decoded JSON response.
+    :raises httpx.HTTPStatusError: On a non-2xx response once retries are exhausted.
+    :raises CircuitOpenError: If the circuit for this model is open.
+    """
+    cache = get_response_cache() if use_cache else None
+    if cache:
+        key = _cache_key(payload)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    limiter = _limiter_for(payload)
+    estimated = estimate_tokens(payload.get("messages", []), payload.get("max_tokens"))
+
+    def send() -> dict:
+        if limiter:
+            limiter.acquire(estimated)
+        start = time.perf_counter()
+        r = get_sync_client().post(PERPLEXITY_ENDPOINT, json=payload, headers=PERPLEXITY_HEADERS, timeout=request_timeout(timeout))
+        data = r.json() if r.is_success else {}
+        record_upstream_call(time.perf_counter() - start, data.get("usage"))
+        r.raise_for_status()
+        if limiter:
+            limiter.settle(estimated, _usage_tokens(data))
+        return data
+
+    data = call_with_retry(send, _breaker_for(payload))
+    if cache:
+        cache.set(key, data)
+    return data
+
+async def perplexity_post_async(payload: dict, timeout: float = 60, use_cache: bool = True) -> dict:
+    """Async counterpart of :func:`_perplexity_post` using the shared async client.
+
+    :param payload: Chat/completions request body.
+    :param timeout: Per-call timeout in seconds.
+    :param use_cache: Read/write the response cache when it is configured.
+    :returns: Decoded JSON response.
+    :raises httpx.HTTPStatusError: On a non-2xx response once retries are exhausted.
+    :raises CircuitOpenError: If the circuit for this model is open.
+    """
+    cache = get_response_cache() if use_cache else None
+    if cache:
+        key = _cache_key(payload)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    limiter = _limiter_for(payload)
+    estimated = estimate_tokens(payload.get("messages", []), payload.get("max_tokens"))
+
+    async def send() -> dict:
+        if limiter:
+            await limiter.aacquire(estimated)
+        start = time.perf_counter()
+        r = await get_async_client().post(PERPLEXITY_ENDPOINT, json=payload, headers=PERPLEXITY_HEADERS, timeout=request_timeout(timeout))
+        data = r.json() if r.is_success else {}
+        record_upstream_call(time.perf_counter() - start, data.get("usage"))
+        r.raise_for_status()
+        if limiter:
+            limiter.settle(estimated, _usage_tokens(data))
+        return data
+
+    data = await acall_with_retry(send, _breaker_for(payload))
+    if cache:
+        cache.set(key, data)
+    return data
+
+#Find trends
+def perplexity_search_trends(sector: str | None, tags: list, count: int = 3, use_cache: bool = True):
     # Create query with sector and tags
     tags_str = ", ".join(tags) 
     payload = {
@@ -54,14 +194,11 @@ def perplexity_search_trends(sector: str | None, tags: list, count: int = 3):
         ]
     }
 
-    r = requests.post(PERPLEXITY_ENDPOINT, json=payload, headers=headers, timeout=60)
-    r.raise_for_status()
-    data = r.json()
+    data = _perplexity_post(payload, timeout=60, use_cache=use_cache)
     content = data["choices"][0]["message"]["content"]
     
-    print(f"\n{'='*60}")
-    print(f"Searching for trending topics in {sector}...")
-    print(f"Raw response: {content[:200]}...")  # Debug
+    logger.info(f"Searching for trending topics in {sector}...")
+    logger.debug(f"Raw response: {content[:200]}...")
     
     # Parse topics from response
     lines = [line.strip() for line in content.split("\n") if line.strip()]
@@ -83,29 +220,22 @@ def perplexity_search_trends(sector: str | None, tags: list, count: int = 3):
             # Make sure it's not meta-commentary
             if not any(skip in cleaned.lower() for skip in ['here are', 'trending topics', 'let me', 'i will', 'based on']):
                 trending_topics.append(cleaned)
-                print(f"  ✓ Found: {cleaned}")
+                logger.info(f"Found topic: {cleaned}")
 
         if len(trending_topics) >= count:
             break
 
     # Return empty list if not enough valid topics found
     if len(trending_topics) < 2:
-        print(f"⚠️  Only found {len(trending_topics)} AI-related topics for {sector}, returning empty list")
+        logger.warning(f"Only found {len(trending_topics)} AI-related topics for {sector}, returning empty list")
         return []
     
-    print(f"✓ Found {len(trending_topics)} valid topics")
-    print('='*60 + "\n")
+    logger.info(f"Found {len(trending_topics)} valid topics for {sector}")
     
     return trending_topics[:count]
 
 # Find articles
-def perplexity_find_articles(query: str, count: int = 5):
-   
-    headers = {
-        "Authorization": f"Bearer {settings.PERPLEXITY_API_KEY}",
-        "Content-Type": "application/json"
-    }
-
+def perplexity_find_articles(query: str, count: int = 5, use_cache: bool = True):
     payload = {
         "model": "sonar-pro",
         "temperature": 0.1,
@@ -133,41 +263,37 @@ def perplexity_find_articles(query: str, count: int = 5):
         ]
     }
 
-    r = requests.post(PERPLEXITY_ENDPOINT, json=payload, headers=headers, timeout=60)
-    r.raise_for_status()
-    data = r.json()
+    data = _perplexity_post(payload, timeout=60, use_cache=use_cache)
 
-    # Extract articles from search_results
+    # Extract articles from search_results, one per page (variants of a URL are dropped)
+    trust_index = get_domain_trust_index()
     articles = []
+    seen_urls = set()
     search_results = data.get("search_results", [])
     
-    #temporary prints
-    print(f"\n{'='*80}")
-    print(f"{query[:60]}...")
-    print(f"  Requested: {count} articles")
-    print(f"  search_results returned: {len(search_results)} results")
+    logger.info(f"[{query[:40]}] Requested {count} articles, search_results returned {len(search_results)}")
     
     for result in search_results[:count]:
         url = result.get("url", "")
+        canonical_url = canonicalize_url(url)
+        if url and canonical_url in seen_urls:
+            continue
+        seen_urls.add(canonical_url)
         domain = extract_domain(url) if url else ""
-        is_trusted = domain in CREDIBLE_SOURCES if CREDIBLE_SOURCES else False
-        black_listed = domain in BLACKLISTED_SOURCES if BLACKLISTED_SOURCES else False
         
         articles.append({
             "title": result.get("title", ""),
             "url": url,
             "domain": domain,
-            "trusted": is_trusted,
-            "blacklisted": black_listed
+            **_trust_fields(trust_index, domain)
         })
     
-    print(f"  Articles from search_results: {len(articles)}")
+    logger.debug(f"[{query[:40]}] Articles from search_results: {len(articles)}")
     
     # Fallback: parse from content if search_results is empty
     if not articles:
-        print("  search_results was empty, trying content parsing...")
         content = data["choices"][0]["message"]["content"]
-        print(f"  Content length: {len(content)} chars")
+        logger.info(f"[{query[:40]}] search_results was empty, parsing {len(content)} chars of content...")
         
         # Split by commas to get individual URLs
         urls = [url.strip() for url in content.split(",")]
@@ -177,38 +303,30 @@ def perplexity_find_articles(query: str, count: int = 5):
             # Clean up any line breaks or extra characters
             url = url.split()[0] if url else ""
             
-            if url.startswith("http"):
+            canonical_url = canonicalize_url(url)
+            if url.startswith("http") and canonical_url not in seen_urls:
+                seen_urls.add(canonical_url)
                 domain = extract_domain(url)
-                is_trusted = domain in CREDIBLE_SOURCES if CREDIBLE_SOURCES else False   
-                black_listed = domain in BLACKLISTED_SOURCES if BLACKLISTED_SOURCES else False            
                 articles.append({
                     "title": "",  
                     "url": url,
                     "domain": domain,
-                    "trusted": is_trusted,
-                    "blacklisted": black_listed
+                    **_trust_fields(trust_index, domain)
                 })
             
             if len(articles) >= count:
                 break
         
-        print(f"  Articles from content parsing: {len(articles)}")
+        logger.info(f"[{query[:40]}] Articles from content parsing: {len(articles)}")
     
     # Summary of trusted vs uncertain
     trusted_count = sum(1 for a in articles if a.get("trusted", False))
-    print(f"  Trusted sources: {trusted_count}/{len(articles)}")
-    print(f"  TOTAL articles returned: {len(articles)}")
-    print('='*80 + "\n")
+    logger.info(f"[{query[:40]}] Returning {len(articles)} articles ({trusted_count} trusted)")
     
     return articles[:count]
 
     # Writes a summary about our trends using source articles we recieved
-def perplexity_summarize(query: str, trusted_articles: list, uncertain_articles: list | None = None):
-    headers = {
-        "Authorization": f"Bearer {settings.PERPLEXITY_API_KEY}",
-        "Content-Type": "application/json"
-    }
-
+def perplexity_summarize(query: str, trusted_articles: list, uncertain_articles: list | None = None, use_cache: bool = True):
     # Combine articles but mark which are trusted
     all_articles = []
     
@@ -219,7 +337,7 @@ def perplexity_summarize(query: str, trusted_articles: list, uncertain_articles:
         for article in uncertain_articles:
             all_articles.append({**article, "is_trusted": False})
     
-    print(f"Providing {len(all_articles)} numbered sources to Perplexity ({len(trusted_articles)} trusted, {len(uncertain_articles) if uncertain_articles else 0} uncertain)...")
+    logger.info(f"Providing {len(all_articles)} numbered sources to Perplexity ({len(trusted_articles)} trusted, {len(uncertain_articles) if uncertain_articles else 0} uncertain)...")
     
     # Build NUMBERED source list (prevents reordering)
     sources_text = ""
@@ -301,9 +419,7 @@ def perplexity_summarize(query: str, trusted_articles: list, uncertain_articles:
         ]
     }
 
-    r = requests.post(PERPLEXITY_ENDPOINT, json=payload, headers=headers, timeout=90)
-    r.raise_for_status()
-    data = r.json()
+    data = _perplexity_post(payload, timeout=90, use_cache=use_cache)
 
     content = data["choices"][0]["message"]["content"]
     
@@ -318,15 +434,14 @@ def perplexity_summarize(query: str, trusted_articles: list, uncertain_articles:
         raw_tags = tags_part.split(",")
         
         for tag in raw_tags:
-            cleaned = tag.strip()
-            cleaned = cleaned.strip('*#[]"\'')
-            if cleaned and 2 <= len(cleaned) <= 50:
+            cleaned = clean_tag(tag)
+            if cleaned:
                 tags.append(cleaned)
         
-        print(f"  📎 Extracted {len(tags)} tags")
+        logger.debug(f"Extracted {len(tags)} tags")
     else:
         main_content = content
-        print("No TAGS: found in response")
+        logger.warning("No TAGS: found in response")
     
     # Parse title and article
     lines = main_content.split("\n")  
@@ -364,11 +479,11 @@ def perplexity_summarize(query: str, trusted_articles: list, uncertain_articles:
         
         # Warn if different from what we provided
         if len(search_results) != len(all_articles):
-            print(f"WARNING: Perplexity used {len(search_results)} sources, we provided {len(all_articles)}")
+            logger.warning(f"Perplexity used {len(search_results)} sources, we provided {len(all_articles)}")
             if len(search_results) > len(all_articles):
-                print(f"Perplexity searched beyond our sources and found {len(search_results) - len(all_articles)} extra!")
+                logger.warning(f"Perplexity searched beyond our sources and found {len(search_results) - len(all_articles)} extra!")
         else:
-            print(f"  sources match: {len(sources)} sources used")
+            logger.debug(f"Sources match: {len(sources)} sources used")
     else:
         # No search_results, return our original sources
         sources = []
@@ -378,7 +493,7 @@ def perplexity_summarize(query: str, trusted_articles: list, uncertain_articles:
                 "url": article.get("url", ""),
                 "source": article.get("url", "").split("/")[2] if article.get("url") else ""
             })
-        print(f"  Using provided sources: {len(sources)}")
+        logger.debug(f"Using provided sources: {len(sources)}")
 
     return {
         "title": title,
@@ -389,51 +504,56 @@ def perplexity_summarize(query: str, trusted_articles: list, uncertain_articles:
         "created_at": datetime.datetime.now().isoformat()
     }
 
-    # Returns an impact score for our end article 
-def perplexity_impact_score(article_title: str, article_content: str, sector: str | None):
-    headers = {
-        "Authorization": f"Bearer {settings.PERPLEXITY_API_KEY}",
-        "Content-Type": "application/json"
-    }
+def _impact_scale(sector: str | None) -> str:
+    """Return the scoring scale and criteria shared by the impact scoring prompts."""
+    return (
+        f"SCORING SCALE:\n"
+        f"10/10 = Revolutionary change equivalent to industrial/agricultural revolution for {sector}\n"
+        f"Examples: First autonomous vehicles approved nationwide, AGI breakthrough, \n"
+        f"AI cures major disease, AI replaces entire job category\n"
+        f"9/10  = Transformational shift that will reshape the entire sector within 1-2 years\n"
+        f"8/10  = Major breakthrough that significantly changes industry practices\n"
+        f"7/10  = Important development with clear widespread adoption path\n"
+        f"6/10  = Significant progress that will affect many organizations\n"
+        f"5/10  = Notable advancement with medium-term implications\n"
+        f"4/10  = Interesting development with limited scope\n"
+        f"3/10  = Incremental improvement to existing technology\n"
+        f"2/10  = Minor update or niche application\n"
+        f"1/10  = Trivial news with no real impact\n"
+        f"0/10  = No importance, will be forgotten immediately\n\n"
+        f"EVALUATION CRITERIA:\n"
+        f"Consider:\n"
+        f"- Scale of impact (how many people/organizations affected?)\n"
+        f"- Timeline (immediate vs years away?)\n"
+        f"- Novelty (truly new or incremental?)\n"
+        f"- Adoption barriers (easy to implement or major obstacles?)\n"
+        f"- Permanence (lasting change or temporary trend?)\n"
+        f"- Competitive advantage (game-changer or table stakes?)\n\n"
+    )
 
+def _impact_system_prompt(sector: str | None) -> str:
+    """Return the system prompt shared by the impact scoring prompts."""
+    return (
+        f"You are an expert analyst evaluating the long-term impact and importance "
+        f"of AI developments in {sector}. You assess whether news represents "
+        f"transformational change or incremental updates."
+    )
+
+    # Returns an impact score for our end article 
+def perplexity_impact_score(article_title: str, article_content: str, sector: str | None, use_cache: bool = True):
     payload = {
         "model": "sonar-pro",
         "temperature": 0.1,
         "messages": [
             {
                 "role": "system",
-                "content": (
-                    f"You are an expert analyst evaluating the long-term impact and importance "
-                    f"of AI developments in {sector}. You assess whether news represents "
-                    f"transformational change or incremental updates."
-                )
+                "content": _impact_system_prompt(sector)
             },
             {
                 "role": "user",
                 "content": (
                     f"Evaluate the IMPACT SCORE (0-10) for this article about AI in {sector}.\n\n"
-                    f"SCORING SCALE:\n"
-                    f"10/10 = Revolutionary change equivalent to industrial/agricultural revolution for {sector}\n"
-                    f"Examples: First autonomous vehicles approved nationwide, AGI breakthrough, \n"
-                    f"AI cures major disease, AI replaces entire job category\n"
-                    f"9/10  = Transformational shift that will reshape the entire sector within 1-2 years\n"
-                    f"8/10  = Major breakthrough that significantly changes industry practices\n"
-                    f"7/10  = Important development with clear widespread adoption path\n"
-                    f"6/10  = Significant progress that will affect many organizations\n"
-                    f"5/10  = Notable advancement with medium-term implications\n"
-                    f"4/10  = Interesting development with limited scope\n"
-                    f"3/10  = Incremental improvement to existing technology\n"
-                    f"2/10  = Minor update or niche application\n"
-                    f"1/10  = Trivial news with no real impact\n"
-                    f"0/10  = No importance, will be forgotten immediately\n\n"
-                    f"EVALUATION CRITERIA:\n"
-                    f"Consider:\n"
-                    f"- Scale of impact (how many people/organizations affected?)\n"
-                    f"- Timeline (immediate vs years away?)\n"
-                    f"- Novelty (truly new or incremental?)\n"
-                    f"- Adoption barriers (easy to implement or major obstacles?)\n"
-                    f"- Permanence (lasting change or temporary trend?)\n"
-                    f"- Competitive advantage (game-changer or table stakes?)\n\n"
+                    + _impact_scale(sector) +
                     f"ARTICLE TO EVALUATE:\n"
                     f"Title: {article_title}\n\n"
                     f"Content: {article_content[:3000]}\n\n"
@@ -444,9 +564,7 @@ def perplexity_impact_score(article_title: str, article_content: str, sector: st
         ]
     }
 
-    r = requests.post(PERPLEXITY_ENDPOINT, json=payload, headers=headers, timeout=60)
-    r.raise_for_status()
-    data = r.json()
+    data = _perplexity_post(payload, timeout=60, use_cache=use_cache)
 
     content = data["choices"][0]["message"]["content"]
     
@@ -460,3 +578,121 @@ def perplexity_impact_score(article_title: str, article_content: str, sector: st
     
     # Clamp to 0-10
     return max(0, min(10, score))
+
+IMPACT_BATCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "scores": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "index": {"type": "integer"},
+                    "score": {"type": "integer", "minimum": 0, "maximum": 10},
+                },
+                "required": ["index", "score"],
+            },
+        },
+    },
+    "required": ["scores"],
+}
+
+def _parse_batch_scores(content: str, count: int) -> dict[int, int]:
+    """Extract valid ``{index: score}`` pairs from a batch scoring reply.
+
+    Entries with an index outside ``1..count``, a non-integer score or a
+    score outside ``0..10`` are dropped; the first entry for an index wins.
+
+    :param content: Model reply, expected to be the JSON described by ``IMPACT_BATCH_SCHEMA``.
+    :param count: Number of articles in the batch.
+    :returns: Mapping of 1-based article index to score (empty if unparseable).
+    """
+    text = content.strip()
+    fenced = re.match(r"^```(?:json)?\s*(.*?)\s*```$", text, re.DOTALL)
+    if fenced:
+        text = fenced.group(1)
+    try:
+        parsed = json.loads(text)
+    except ValueError:
+        return {}
+
+    entries = parsed.get("scores") if isinstance(parsed, dict) else None
+    if not isinstance(entries, list):
+        return {}
+
+    scores: dict[int, int] = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        index, score = entry.get("index"), entry.get("score")
+        if isinstance(score, float) and score.is_integer():
+            score = int(score)
+        if type(index) is not int or type(score) is not int:
+            continue
+        if 1 <= index <= count and 0 <= score <= 10:
+            scores.setdefault(index, score)
+    return scores
+
+def perplexity_impact_score_batch(articles: list[dict], sector: str | None, use_cache: bool = True) -> list[int | None]:
+    """Score several articles with one request per batch.
+
+    Articles are sent ``settings.IMPACT_BATCH_SIZE`` at a time with a JSON
+    schema ``response_format``. Every item of the reply is validated on its
+    own; items that are missing or invalid (or a whole batch whose request
+    fails) are re-scored individually with :func:`perplexity_impact_score`.
+
+    :param articles: Dicts with ``title`` and ``content`` keys.
+    :param sector: Sector the articles belong to.
+    :param use_cache: Read/write the response cache.
+    :returns: Scores (0-10) in input order; ``None`` where even the single fallback failed.
+    """
+    scores: list[int | None] = [None] * len(articles)
+    batch_size = max(1, settings.IMPACT_BATCH_SIZE)
+
+    for start in range(0, len(articles), batch_size):
+        batch = articles[start:start + batch_size]
+        parsed: dict[int, int] = {}
+
+        if len(batch) > 1:
+            listing = "\n\n".join(
+                f"[{i}] Title: {article['title']}\nContent: {article['content'][:3000]}"
+                for i, article in enumerate(batch, start=1)
+            )
+            payload = {
+                "model": "sonar-pro",
+                "temperature": 0.1,
+                "response_format": {"type": "json_schema", "json_schema": {"schema": IMPACT_BATCH_SCHEMA}},
+                "messages": [
+                    {"role": "system", "content": _impact_system_prompt(sector)},
+                    {
+                        "role": "user",
+                        "content": (
+                            f"Evaluate the IMPACT SCORES (0-10) for each of these {len(batch)} articles about AI in {sector}. "
+                            f"Score every article independently.\n\n"
+                            + _impact_scale(sector) +
+                            f"ARTICLES TO EVALUATE:\n\n{listing}\n\n"
+                            f"WHAT TO RETURN\n"
+                            f'JSON object {{"scores": [{{"index": <article number>, "score": <integer 0-10>}}, ...]}} '
+                            f"with exactly one entry per article"
+                        )
+                    }
+                ]
+            }
+            try:
+                data = _perplexity_post(payload, timeout=90, use_cache=use_cache)
+                parsed = _parse_batch_scores(data["choices"][0]["message"]["content"], len(batch))
+            except Exception as e:
+                logger.warning(f"Batch impact scoring failed for {len(batch)} article(s): {e}")
+
+        for i, article in enumerate(batch, start=1):
+            if i in parsed:
+                scores[start + i - 1] = parsed[i]
+                continue
+            if len(batch) > 1:
+                logger.warning(f"No valid batch score for '{article['title'][:40]}', scoring it individually")
+            try:
+                scores[start + i - 1] = perplexity_impact_score(article['title'], article['content'], sector, use_cache=use_cache)
+            except Exception as e:
+                logger.error(f"Impact scoring failed for '{article['title'][:40]}': {e}")
+
+    return scores
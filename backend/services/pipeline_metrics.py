@@ -0,0 +1,125 @@
+"""Per-stage metrics for ingest runs.
+
+Pipeline stages are wrapped in :class:`StageMetrics`, which times the
+stage and, through a context variable, collects the latency and token
+usage (the API ``usage`` field) of every upstream call made while it is
+active. The cron job stores each finished stage as a
+``pipeline_stage_events`` row, so run throughput and cost can be compared
+over time.
+
+Functions
+---------
+record_upstream_call
+    Add one upstream call to the stage active in the current context.
+"""
+
+import time
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Optional
+
+_current_stage: ContextVar[Optional["StageMetrics"]] = ContextVar("pipeline_stage", default=None)
+
+class StageMetrics:
+    """Timing, upstream usage and outcome of one pipeline stage.
+
+    Use as a context manager around the stage; an exception escaping the
+    block marks the stage as failed and is re-raised.
+
+    :ivar stage: Stage name, e.g. ``article_find`` or ``persist``.
+    :ivar duration_ms: Wall time of the stage.
+    :ivar upstream_calls: Upstream HTTP requests made (including retried attempts).
+    :ivar upstream_ms: Time spent waiting on those requests.
+    :ivar prompt_tokens: Prompt tokens reported by the provider.
+    :ivar completion_tokens: Completion tokens reported by the provider.
+    :ivar total_tokens: Total tokens reported by the provider.
+    :ivar sources_provided: Sources handed to the summarizer (``persist`` only).
+    :ivar sources_cited: Sources the article actually cites (``persist`` only).
+    :ivar sources_removed: Uncited sources dropped (``persist`` only).
+    :ivar outcome: ``ok``, ``skipped`` (finished without usable output) or ``error``.
+    :ivar error: Error message when the stage failed.
+    """
+
+    def __init__(self, stage: str):
+        """Create metrics for ``stage``; timing starts on ``__enter__``.
+
+        :param stage: Stage name.
+        """
+        self.stage = stage
+        self.started_at = datetime.now()
+        self.duration_ms = 0.0
+        self.upstream_calls = 0
+        self.upstream_ms = 0.0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.total_tokens = 0
+        self.sources_provided: Optional[int] = None
+        self.sources_cited: Optional[int] = None
+        self.sources_removed: Optional[int] = None
+        self.outcome = "ok"
+        self.error: Optional[str] = None
+        self._start = 0.0
+        self._token = None
+
+    def __enter__(self) -> "StageMetrics":
+        self.started_at = datetime.now()
+        self._start = time.perf_counter()
+        self._token = _current_stage.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration_ms = (time.perf_counter() - self._start) * 1000
+        _current_stage.reset(self._token)
+        if exc is not None:
+            self.fail(exc)
+        return False
+
+    def fail(self, error: Exception):
+        """Mark the stage as failed with ``error``."""
+        self.outcome = "error"
+        self.error = str(error)
+
+    def skip(self):
+        """Mark the stage as finished without usable output (e.g. too few trends found)."""
+        self.outcome = "skipped"
+
+    def add_call(self, latency_seconds: float, usage: Optional[dict] = None):
+        """Add one upstream call.
+
+        :param latency_seconds: Time the request took.
+        :param usage: The response's ``usage`` object, if it had one.
+        """
+        self.upstream_calls += 1
+        self.upstream_ms += latency_seconds * 1000
+        if usage:
+            self.prompt_tokens += usage.get("prompt_tokens") or 0
+            self.completion_tokens += usage.get("completion_tokens") or 0
+            self.total_tokens += usage.get("total_tokens") or 0
+
+    def as_row(self) -> dict:
+        """Return the column values of the matching ``pipeline_stage_events`` row."""
+        return {
+            "stage": self.stage,
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration_ms, 3),
+            "upstream_calls": self.upstream_calls,
+            "upstream_ms": round(self.upstream_ms, 3),
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "sources_provided": self.sources_provided,
+            "sources_cited": self.sources_cited,
+            "sources_removed": self.sources_removed,
+            "outcome": self.outcome,
+            "error": self.error,
+        }
+
+def record_upstream_call(latency_seconds: float, usage: Optional[dict] = None):
+    """Add an upstream call to the stage active in the current context (no-op outside a stage).
+
+    :param latency_seconds: Time the request took.
+    :param usage: The response's ``usage`` object, if it had one.
+    """
+    stage = _current_stage.get()
+    if stage is not None:
+        stage.add_call(latency_seconds, usage)
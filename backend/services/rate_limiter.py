@@ -0,0 +1,239 @@
+"""Token-bucket rate limiting for upstream LLM providers.
+
+Each provider (and optionally each model) gets two token buckets, one for
+requests per minute and one for tokens per minute. Callers reserve
+capacity before a request and sleep until the reservation is covered
+instead of bursting into HTTP 429s. Reservations are taken in arrival
+order, so waiting callers are spaced out at the refill rate and sustained
+throughput settles just under the configured limit (``RATE_LIMIT_HEADROOM``).
+
+Limits are configured with ``RATE_LIMITS``, a comma-separated list of
+``key=rpm/tpm`` entries (``0`` means unlimited)::
+
+    RATE_LIMITS=perplexity=50/0,openai=500/200000,perplexity:sonar-pro=40/0
+
+A ``provider:model`` entry gives that model its own buckets; a bare
+``provider`` entry is shared by the provider's other models.
+
+Bucket state is kept in process memory by default. With
+``RATE_LIMIT_BACKEND=database`` it lives in the ``rate_limit_buckets``
+table instead, so every worker process sharing the database draws from
+the same buckets.
+
+Functions
+---------
+parse_rate_limits
+    Parse a ``RATE_LIMITS`` specification.
+estimate_tokens
+    Estimate the tokens a chat/completions request will consume.
+get_rate_limiter
+    Return the shared limiter for a provider/model, or ``None`` if unlimited.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Optional
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Completion budget assumed for requests that do not set ``max_tokens``
+DEFAULT_COMPLETION_TOKENS = 1024
+
+def parse_rate_limits(spec: str) -> dict[str, tuple[float, float]]:
+    """Parse ``key=rpm/tpm`` entries into ``{key: (rpm, tpm)}``.
+
+    :param spec: Comma-separated entries, e.g. ``"perplexity=50/0,openai=500/200000"``.
+    :returns: Mapping of provider or ``provider:model`` key to its limits.
+    :raises ValueError: If an entry is malformed.
+    """
+    limits = {}
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        try:
+            key, values = entry.split("=", 1)
+            rpm, _, tpm = values.partition("/")
+            limits[key.strip()] = (float(rpm or 0), float(tpm or 0))
+        except ValueError:
+            raise ValueError(f"Invalid RATE_LIMITS entry '{entry}', expected key=rpm/tpm")
+    return limits
+
+def estimate_tokens(messages: list, max_tokens: Optional[int] = None) -> int:
+    """Estimate prompt plus completion tokens of a request (about 4 characters per token).
+
+    :param messages: Chat messages to be sent.
+    :param max_tokens: Completion limit of the request, if set.
+    :returns: Estimated total tokens.
+    """
+    prompt_chars = sum(len(str(m.get("content", ""))) for m in messages)
+    return prompt_chars // 4 + 4 * len(messages) + (max_tokens or DEFAULT_COMPLETION_TOKENS)
+
+class MemoryBucketStore:
+    """Bucket levels kept in this process (thread-safe)."""
+
+    blocking = False
+
+    def __init__(self):
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def take(self, key: str, amount: float, rate: float, capacity: float) -> float:
+        """Take ``amount`` from bucket ``key`` and return the seconds until it is covered.
+
+        The level may go negative; that debt is what later callers wait out.
+        A negative ``amount`` refunds capacity.
+
+        :param key: Bucket name.
+        :param amount: Units to take.
+        :param rate: Refill rate in units per second.
+        :param capacity: Maximum level (burst size).
+        :returns: Seconds to wait before the reservation may be used.
+        """
+        with self._lock:
+            now = time.monotonic()
+            level, updated = self._buckets.get(key, (capacity, now))
+            level = min(capacity, level + (now - updated) * rate) - amount
+            self._buckets[key] = (min(capacity, level), now)
+        return max(0.0, -level / rate)
+
+class DatabaseBucketStore:
+    """Bucket levels kept in the ``rate_limit_buckets`` table, shared across processes.
+
+    Each reservation locks the bucket row until it commits, so concurrent
+    workers serialize on it. Levels are refilled against wall clock time,
+    so hosts sharing buckets should keep their clocks in sync.
+    """
+
+    blocking = True
+
+    def take(self, key: str, amount: float, rate: float, capacity: float) -> float:
+        """Take ``amount`` from bucket ``key`` and return the seconds until it is covered.
+
+        :param key: Bucket name.
+        :param amount: Units to take.
+        :param rate: Refill rate in units per second.
+        :param capacity: Maximum level (burst size).
+        :returns: Seconds to wait before the reservation may be used.
+        """
+        from backend.db.database import SessionLocal
+        from backend.db.crud import take_rate_limit_tokens
+
+        db = SessionLocal()
+        try:
+            level = take_rate_limit_tokens(db, key, amount, rate, capacity, time.time())
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        return max(0.0, -level / rate)
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute buckets for one provider/model."""
+
+    def __init__(self, name: str, rpm: float, tpm: float, store, headroom: float = 1.0, burst_seconds: float = 10.0):
+        """Create a limiter.
+
+        :param name: Bucket key prefix, e.g. ``"perplexity:sonar-pro"``.
+        :param rpm: Requests per minute (``0`` for unlimited).
+        :param tpm: Tokens per minute (``0`` for unlimited).
+        :param store: :class:`MemoryBucketStore` or :class:`DatabaseBucketStore`.
+        :param headroom: Fraction of the limits to actually use.
+        :param burst_seconds: Seconds of capacity that may be spent at once.
+        """
+        self.name = name
+        self.store = store
+        # (bucket key, refill per second, capacity) for each limited dimension
+        self._rpm = self._bucket("rpm", rpm, headroom, burst_seconds)
+        self._tpm = self._bucket("tpm", tpm, headroom, burst_seconds)
+
+    def _bucket(self, unit: str, per_minute: float, headroom: float, burst_seconds: float) -> Optional[tuple[str, float, float]]:
+        """Return the bucket definition for a limit, or ``None`` if unlimited."""
+        if per_minute <= 0:
+            return None
+        rate = per_minute * headroom / 60
+        return f"{self.name}:{unit}", rate, max(1.0, rate * burst_seconds)
+
+    def _reserve(self, tokens: int) -> float:
+        """Reserve one request and ``tokens`` tokens; return the seconds to wait."""
+        wait = 0.0
+        if self._rpm is not None:
+            key, rate, capacity = self._rpm
+            wait = self.store.take(key, 1, rate, capacity)
+        if self._tpm is not None and tokens:
+            key, rate, capacity = self._tpm
+            wait = max(wait, self.store.take(key, tokens, rate, capacity))
+        if wait >= 1:
+            logger.info(f"{self.name}: at rate limit, waiting {wait:.1f}s")
+        return wait
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Block until a request of ``tokens`` estimated tokens fits under the limits.
+
+        :param tokens: Estimated tokens of the request (see :func:`estimate_tokens`).
+        :returns: Seconds spent waiting.
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self, tokens: int = 0) -> float:
+        """Async counterpart of :meth:`acquire`.
+
+        :param tokens: Estimated tokens of the request.
+        :returns: Seconds spent waiting.
+        """
+        wait = await asyncio.to_thread(self._reserve, tokens) if self.store.blocking else self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def settle(self, estimated: int, actual: Optional[int]):
+        """Correct the token bucket once the real usage of a request is known.
+
+        :param estimated: Tokens reserved by :meth:`acquire`.
+        :param actual: Tokens reported by the provider (``None`` if unknown).
+        """
+        if self._tpm is None or actual is None or actual == estimated:
+            return
+        key, rate, capacity = self._tpm
+        try:
+            self.store.take(key, actual - estimated, rate, capacity)
+        except Exception as e:
+            logger.warning(f"{self.name}: could not settle token usage: {e}")
+
+_limiters: dict[tuple[str, str], Optional[RateLimiter]] = {}
+_limiters_lock = threading.Lock()
+_store = None
+
+def _get_store():
+    """Return the process-wide bucket store selected by ``RATE_LIMIT_BACKEND``."""
+    global _store
+    if _store is None:
+        _store = DatabaseBucketStore() if settings.RATE_LIMIT_BACKEND == "database" else MemoryBucketStore()
+    return _store
+
+def get_rate_limiter(provider: str, model: str = "") -> Optional[RateLimiter]:
+    """Return the shared limiter for ``provider``/``model``.
+
+    :param provider: Provider name, e.g. ``"perplexity"`` or ``"openai"``.
+    :param model: Model name.
+    :returns: The :class:`RateLimiter`, or ``None`` if no limit is configured.
+    """
+    with _limiters_lock:
+        if (provider, model) not in _limiters:
+            limits = parse_rate_limits(settings.RATE_LIMITS)
+            name = f"{provider}:{model}" if f"{provider}:{model}" in limits else provider
+            if name in limits and any(limits[name]):
+                rpm, tpm = limits[name]
+                _limiters[(provider, model)] = RateLimiter(name, rpm, tpm, _get_store(), settings.RATE_LIMIT_HEADROOM, settings.RATE_LIMIT_BURST_SECONDS)
+            else:
+                _limiters[(provider, model)] = None
+        return _limiters[(provider, model)]
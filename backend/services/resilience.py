@@ -0,0 +1,233 @@
+"""Retry, backoff and circuit-breaker helpers for upstream API calls.
+
+Transient upstream failures (HTTP 429, 5xx, timeouts and connection
+errors) are retried with exponential backoff and full jitter, honouring
+the ``Retry-After`` header when the server sends one. Each upstream
+endpoint gets its own :class:`CircuitBreaker`: after repeated failures the
+circuit opens and calls fail fast with :class:`CircuitOpenError` instead of
+waiting out the full request timeout, until a trial call succeeds again.
+
+Functions
+---------
+get_breaker
+    Return the shared circuit breaker for an endpoint key.
+call_with_retry
+    Run a synchronous call with retries behind a circuit breaker.
+acall_with_retry
+    Async counterpart of :func:`call_with_retry`.
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import httpx
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because its circuit is open."""
+
+class CircuitBreaker:
+    """Thread-safe consecutive-failure circuit breaker.
+
+    States: ``closed`` (calls flow), ``open`` (calls rejected until
+    ``reset_timeout`` elapses) and ``half_open`` (a single trial call is let
+    through; success closes the circuit, failure re-opens it).
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        """Create a breaker.
+
+        :param name: Endpoint key used in log messages.
+        :param failure_threshold: Consecutive failures that open the circuit.
+        :param reset_timeout: Seconds to stay open before allowing a trial call.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """Check whether a call may proceed.
+
+        :raises CircuitOpenError: If the circuit is open (or a half-open trial is already running).
+        """
+        with self._lock:
+            if self.state == "open":
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    raise CircuitOpenError(f"Circuit '{self.name}' is open")
+                self.state = "half_open"
+                self._trial_in_flight = False
+            if self.state == "half_open":
+                if self._trial_in_flight:
+                    raise CircuitOpenError(f"Circuit '{self.name}' is half-open, trial call in progress")
+                self._trial_in_flight = True
+
+    def record_success(self):
+        """Record a successful call and close the circuit."""
+        with self._lock:
+            if self.state != "closed":
+                logger.info(f"Circuit '{self.name}' closed")
+            self.state = "closed"
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """Record a failed call, opening the circuit when the threshold is reached."""
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                if self.state != "open":
+                    logger.warning(f"Circuit '{self.name}' opened after {self.failures} failure(s)")
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+    def release(self):
+        """Release a half-open trial slot without recording an outcome."""
+        with self._lock:
+            self._trial_in_flight = False
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Return the process-wide breaker for ``name``, creating it if needed.
+
+    :param name: Endpoint key, e.g. ``"perplexity:sonar-pro"``.
+    :returns: Shared :class:`CircuitBreaker`.
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name, settings.CIRCUIT_FAILURE_THRESHOLD, settings.CIRCUIT_RESET_SECONDS)
+            _breakers[name] = breaker
+        return breaker
+
+def is_retryable(exc: Exception) -> bool:
+    """Return True for transient errors: 429, 5xx, timeouts and connection errors."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, httpx.TransportError)
+
+def _counts_as_failure(exc: Exception) -> bool:
+    """Return True if ``exc`` indicates a degraded upstream (429 only means slow down)."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+def retry_after_seconds(exc: Exception) -> Optional[float]:
+    """Parse the ``Retry-After`` header of a failed response, if present.
+
+    Supports both delta-seconds and HTTP-date forms.
+
+    :param exc: Exception raised by the call.
+    :returns: Seconds to wait, or ``None`` if no usable header was sent.
+    """
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return None
+    value = exc.response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+def backoff_delay(attempt: int, exc: Optional[Exception] = None) -> float:
+    """Compute the delay before retry number ``attempt`` (0-based).
+
+    Uses ``Retry-After`` when available (capped at ``API_BACKOFF_MAX``),
+    otherwise exponential backoff with full jitter.
+
+    :param attempt: Number of attempts already failed, minus one.
+    :param exc: The exception that triggered the retry.
+    :returns: Delay in seconds.
+    """
+    retry_after = retry_after_seconds(exc) if exc is not None else None
+    if retry_after is not None:
+        return min(retry_after, settings.API_BACKOFF_MAX)
+    return random.uniform(0, min(settings.API_BACKOFF_MAX, settings.API_BACKOFF_BASE * (2 ** attempt)))
+
+def _record(breaker: CircuitBreaker, exc: Exception):
+    """Update ``breaker`` for a failed call."""
+    if _counts_as_failure(exc):
+        breaker.record_failure()
+    else:
+        breaker.release()
+
+def call_with_retry(fn: Callable[[], T], breaker: CircuitBreaker, max_retries: Optional[int] = None) -> T:
+    """Run ``fn`` with retries on transient errors, guarded by ``breaker``.
+
+    :param fn: Zero-argument callable performing the request.
+    :param breaker: Circuit breaker for the endpoint.
+    :param max_retries: Retries after the first attempt (defaults to ``settings.API_MAX_RETRIES``).
+    :returns: The value returned by ``fn``.
+    :raises CircuitOpenError: If the circuit is open.
+    :raises Exception: The last error once retries are exhausted, or any non-retryable error.
+    """
+    retries = settings.API_MAX_RETRIES if max_retries is None else max_retries
+    attempt = 0
+    while True:
+        breaker.before_call()
+        try:
+            result = fn()
+        except Exception as e:
+            _record(breaker, e)
+            if not is_retryable(e) or attempt >= retries:
+                raise
+            delay = backoff_delay(attempt, e)
+            logger.warning(f"{breaker.name}: attempt {attempt + 1} failed ({e}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+            attempt += 1
+            continue
+        breaker.record_success()
+        return result
+
+async def acall_with_retry(fn: Callable[[], Awaitable[T]], breaker: CircuitBreaker, max_retries: Optional[int] = None) -> T:
+    """Async counterpart of :func:`call_with_retry`.
+
+    :param fn: Zero-argument callable returning an awaitable request.
+    :param breaker: Circuit breaker for the endpoint.
+    :param max_retries: Retries after the first attempt (defaults to ``settings.API_MAX_RETRIES``).
+    :returns: The value produced by ``fn``.
+    """
+    retries = settings.API_MAX_RETRIES if max_retries is None else max_retries
+    attempt = 0
+    while True:
+        breaker.before_call()
+        try:
+            result = await fn()
+        except Exception as e:
+            _record(breaker, e)
+            if not is_retryable(e) or attempt >= retries:
+                raise
+            delay = backoff_delay(attempt, e)
+            logger.warning(f"{breaker.name}: attempt {attempt + 1} failed ({e}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+            continue
+        breaker.record_success()
+        return result
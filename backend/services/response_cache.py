@@ -0,0 +1,189 @@
+"""Content-addressed on-disk cache for LLM API responses.
+
+Responses are keyed by a SHA-256 hash of the request identity
+``(endpoint, model, messages, temperature)`` and stored as zlib-compressed
+JSON files, sharded into sub-directories by the first two hex digits of
+the key. Entries expire after a TTL and the cache is kept under a size
+budget by evicting the least recently used files.
+
+The cache is optional: it is only active when ``LLM_CACHE_DIR`` is set,
+and every call site can bypass it per call.
+
+Functions
+---------
+make_cache_key
+    Hash a request identity into a cache key.
+get_response_cache
+    Return the configured process-wide cache, or ``None`` when disabled.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+def make_cache_key(endpoint: str, model: str, messages: list, temperature: Optional[float] = None) -> str:
+    """Return the content hash identifying a chat/completions request.
+
+    :param endpoint: Endpoint URL or logical name of the API.
+    :param model: Model name.
+    :param messages: Chat messages sent to the model.
+    :param temperature: Sampling temperature (``None`` if not set).
+    :returns: Hex-encoded SHA-256 digest.
+    """
+    identity = json.dumps(
+        {"endpoint": endpoint, "model": model, "messages": messages, "temperature": temperature},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+class ResponseCache:
+    """Size-bounded, TTL-expiring response cache stored on disk.
+
+    Safe to share between threads; concurrent processes may share the same
+    directory since writes are atomic renames.
+    """
+
+    SUFFIX = ".json.z"
+
+    def __init__(self, directory: str, ttl_seconds: float, max_bytes: int):
+        """Create a cache rooted at ``directory``.
+
+        :param directory: Cache directory (created if missing).
+        :param ttl_seconds: Age after which an entry is treated as missing.
+        :param max_bytes: Total size budget; least recently used entries are evicted beyond it.
+        """
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+
+    def _path(self, key: str) -> Path:
+        """Return the file path for ``key``."""
+        return self.directory / key[:2] / f"{key}{self.SUFFIX}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key``, or ``None`` if missing or expired.
+
+        A hit refreshes the entry's modification time, which is used as the
+        recency signal for eviction.
+
+        :param key: Cache key from :func:`make_cache_key`.
+        :returns: The decoded JSON value or ``None``.
+        """
+        path = self._path(key)
+        try:
+            stat = path.stat()
+            if time.time() - stat.st_mtime > self.ttl_seconds:
+                self._remove(path, stat.st_size)
+                return None
+            value = json.loads(zlib.decompress(path.read_bytes()))
+            os.utime(path)
+            return value
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, zlib.error) as e:
+            logger.warning(f"Discarding unreadable cache entry {path.name}: {e}")
+            self._remove(path, None)
+            return None
+
+    def set(self, key: str, value: Any):
+        """Store ``value`` (must be JSON-serializable) under ``key``.
+
+        :param key: Cache key from :func:`make_cache_key`.
+        :param value: Value to store.
+        """
+        path = self._path(key)
+        data = zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"), 6)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {path.name}: {e}")
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def clear(self):
+        """Remove every cache entry."""
+        with self._lock:
+            for path in self.directory.glob(f"*/*{self.SUFFIX}"):
+                path.unlink(missing_ok=True)
+            self._size = 0
+
+    def _remove(self, path: Path, size: Optional[int]):
+        """Delete ``path`` and update the size estimate."""
+        try:
+            size = path.stat().st_size if size is None else size
+            path.unlink()
+        except OSError:
+            return
+        with self._lock:
+            if self._size is not None:
+                self._size = max(0, self._size - size)
+
+    def _scan_size(self) -> int:
+        """Return the total size of all entries on disk."""
+        return sum(p.stat().st_size for p in self.directory.glob(f"*/*{self.SUFFIX}"))
+
+    def _evict(self):
+        """Evict least recently used entries until 90% of the budget is free. Caller holds the lock."""
+        entries = []
+        for path in self.directory.glob(f"*/*{self.SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        self._size = total
+        logger.info(f"Response cache evicted {removed} entries ({total} bytes remain)")
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the process-wide cache configured from settings.
+
+    :returns: The shared :class:`ResponseCache`, or ``None`` if ``LLM_CACHE_DIR`` is unset.
+    """
+    global _cache
+    from backend.config import settings
+
+    if not settings.LLM_CACHE_DIR:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache(settings.LLM_CACHE_DIR, settings.LLM_CACHE_TTL_SECONDS, settings.LLM_CACHE_MAX_BYTES)
+    return _cache
@@ -0,0 +1,236 @@
+"""Keyword-based sector classification of articles and sources.
+
+The per-sector keyword lists in ``SECTOR_CONFIG`` are compiled into one
+Aho–Corasick automaton over word tokens: the text is split into lowercase
+tokens once, and the automaton walks the token stream in a single pass,
+reporting every keyword (including multi-word ones such as
+``supply chain``) ending at each token. Working on tokens rather than
+characters means keywords only match whole words (``car`` does not match
+``card``), and the per-character work happens in the regular expression
+tokenizer. A token that is the plural of a keyword token (``schools``,
+``cars``, ``taxes``, ``batteries``) counts as that token; ``es`` is only
+stripped after a sibilant, so ``cares`` is not ``car``.
+
+Each sector scores ``FIELD_WEIGHTS[field]`` for every distinct keyword
+found in an article's title, tags and content. The sector the article was
+ingested under stays its primary sector; other sectors scoring at least
+``SECTOR_SECONDARY_MIN_SCORE`` become its secondary sectors.
+
+Functions
+---------
+tokenize
+    Split text into the lowercase word tokens the automaton reads.
+get_sector_classifier
+    Return the classifier compiled from ``SECTOR_CONFIG``.
+classify_article
+    Primary and secondary sectors of an article.
+classify_source
+    Best-matching sector of a source title.
+"""
+
+import re
+import threading
+from collections import deque
+from typing import Iterable, NamedTuple, Optional
+
+from backend.config import settings
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Stems that take "es" in the plural (tax -> taxes, switch -> switches)
+SIBILANT_ENDINGS = ("s", "x", "z", "ch", "sh")
+
+# Points per distinct keyword found in each field
+FIELD_WEIGHTS = {"title": 3, "tags": 2, "content": 1}
+
+def tokenize(text: str) -> list[str]:
+    """Split ``text`` into lowercase alphanumeric tokens (``e-commerce`` -> ``e``, ``commerce``)."""
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+class SectorMatch(NamedTuple):
+    """Sectors assigned to an article.
+
+    :ivar primary: Primary sector.
+    :ivar secondary: Other sectors scoring at least the threshold, best first.
+    :ivar scores: Score of every sector with at least one keyword match.
+    """
+    primary: str
+    secondary: list[str]
+    scores: dict[str, int]
+
+class SectorClassifier:
+    """Aho–Corasick automaton over the keyword tokens of all sectors.
+
+    State ``0`` is the root. ``_goto[state]`` maps a token to the next
+    state, ``_fail[state]`` is the state of the longest proper suffix that
+    is also a keyword prefix, and ``_output[state]`` lists the
+    ``(keyword, sectors)`` pairs of every keyword ending in that state
+    (fail-chain outputs are merged in at build time).
+    """
+
+    def __init__(self, keywords: dict[str, Iterable[str]]):
+        """Compile the automaton.
+
+        :param keywords: Mapping of sector name to its keywords.
+        """
+        sectors_by_keyword: dict[tuple[str, ...], list[str]] = {}
+        for sector, sector_keywords in keywords.items():
+            for keyword in sector_keywords:
+                tokens = tuple(tokenize(keyword))
+                if tokens and sector not in sectors_by_keyword.setdefault(tokens, []):
+                    sectors_by_keyword[tokens].append(sector)
+
+        self.sectors = list(keywords)
+        self._order = {sector: i for i, sector in enumerate(self.sectors)}
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[tuple[str, tuple[str, ...]]]] = [[]]
+        for tokens, sectors in sectors_by_keyword.items():
+            state = 0
+            for token in tokens:
+                next_state = self._goto[state].get(token)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][token] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append((" ".join(tokens), tuple(sectors)))
+
+        # Breadth-first, so every fail target is complete before it is used
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(token, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+        # Every token of any keyword; other tokens send the automaton back to the root
+        self._vocabulary = {token for tokens in sectors_by_keyword for token in tokens}
+        self._normalized: dict[str, Optional[str]] = {}
+
+    def _normalize(self, token: str) -> Optional[str]:
+        """Return the keyword token ``token`` stands for (plurals included), or ``None``."""
+        try:
+            return self._normalized[token]
+        except KeyError:
+            pass
+        normalized = None
+        if token in self._vocabulary:
+            normalized = token
+        elif token.endswith("ies") and token[:-3] + "y" in self._vocabulary:
+            normalized = token[:-3] + "y"
+        elif token.endswith("es") and token[:-2].endswith(SIBILANT_ENDINGS) and token[:-2] in self._vocabulary:
+            normalized = token[:-2]
+        elif token.endswith("s") and token[:-1] in self._vocabulary:
+            normalized = token[:-1]
+        # Bounded by the vocabulary of the texts seen; cleared if it grows too large
+        if len(self._normalized) > 200_000:
+            self._normalized = {}
+        self._normalized[token] = normalized
+        return normalized
+
+    def find(self, text: str) -> list[tuple[str, tuple[str, ...]]]:
+        """Return every keyword occurrence in ``text`` in one pass.
+
+        :param text: Text to scan.
+        :returns: ``(keyword, sectors)`` pairs in order of occurrence.
+        """
+        goto, fail, output, normalize = self._goto, self._fail, self._output, self._normalize
+        matches = []
+        state = 0
+        for token in tokenize(text):
+            token = normalize(token)
+            if token is None:
+                state = 0
+                continue
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if output[state]:
+                matches.extend(output[state])
+        return matches
+
+    def score(self, title: str = "", content: str = "", tags: Iterable[str] = ()) -> dict[str, int]:
+        """Score every sector against an article.
+
+        :param title: Article title.
+        :param content: Article body.
+        :param tags: Tag names.
+        :returns: Mapping of sector to score, for sectors with at least one match.
+        """
+        scores: dict[str, int] = {}
+        # Each tag is scanned on its own so a keyword cannot span two tags
+        for field, texts in (("title", (title,)), ("tags", tags), ("content", (content,))):
+            weight = FIELD_WEIGHTS[field]
+            found: dict[str, tuple[str, ...]] = {}
+            for text in texts:
+                found.update(self.find(text))
+            for sectors in found.values():
+                for sector in sectors:
+                    scores[sector] = scores.get(sector, 0) + weight
+        return scores
+
+    def classify(self, title: str = "", content: str = "", tags: Iterable[str] = (), primary: Optional[str] = None,
+                 min_score: Optional[int] = None, max_secondary: Optional[int] = None) -> SectorMatch:
+        """Assign primary and secondary sectors to an article.
+
+        :param title: Article title.
+        :param content: Article body.
+        :param tags: Tag names.
+        :param primary: Sector the article was ingested under; the best match (or ``General``) when ``None``.
+        :param min_score: Score a secondary sector needs (default ``settings.SECTOR_SECONDARY_MIN_SCORE``).
+        :param max_secondary: Most secondary sectors kept (default ``settings.SECTOR_SECONDARY_MAX``).
+        :returns: The :class:`SectorMatch`.
+        """
+        if min_score is None:
+            min_score = settings.SECTOR_SECONDARY_MIN_SCORE
+        if max_secondary is None:
+            max_secondary = settings.SECTOR_SECONDARY_MAX
+        scores = self.score(title, content, tags)
+        ranked = sorted(scores, key=lambda sector: (-scores[sector], self._order.get(sector, len(self._order))))
+        if primary is None:
+            primary = ranked[0] if ranked else "General"
+        secondary = [sector for sector in ranked if sector != primary and scores[sector] >= min_score][:max(max_secondary, 0)]
+        return SectorMatch(primary, secondary, scores)
+
+_classifier: Optional[SectorClassifier] = None
+_classifier_lock = threading.Lock()
+
+def get_sector_classifier() -> SectorClassifier:
+    """Return the classifier compiled from the enabled sectors of ``SECTOR_CONFIG`` (built once per process)."""
+    global _classifier
+    if _classifier is None:
+        from backend.services.sector_service import get_enabled_sectors, get_sector_tags
+
+        with _classifier_lock:
+            if _classifier is None:
+                _classifier = SectorClassifier({sector: get_sector_tags(sector) for sector in get_enabled_sectors()})
+    return _classifier
+
+def classify_article(title: str, content: str, tags: Iterable[str], primary: Optional[str] = None) -> SectorMatch:
+    """Assign primary and secondary sectors to an article with the shared classifier.
+
+    :param title: Article title.
+    :param content: Article body.
+    :param tags: Tag names.
+    :param primary: Sector the article was ingested under.
+    :returns: The :class:`SectorMatch`.
+    """
+    return get_sector_classifier().classify(title, content, tags, primary)
+
+def classify_source(title: Optional[str], fallback: str) -> str:
+    """Return the best-matching sector of a source title, or ``fallback`` if no keyword matches.
+
+    :param title: Source title.
+    :param fallback: Sector to use without a match (usually the article's).
+    """
+    scores = get_sector_classifier().score(title=title or "")
+    if not scores:
+        return fallback
+    return max(scores, key=lambda sector: (scores[sector], sector == fallback))
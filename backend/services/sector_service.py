@@ -1,11 +1,14 @@
 """Sector rotation utilities and configuration.
 
 This module exposes a manager class for persisting a rotating list of
-sectors to the database and utility functions for sector configuration.
+sectors to the database, the yield-weighted alternative to plain
+rotation (``SECTOR_SCHEDULER=yield``) and utility functions for sector
+configuration.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
+from sqlalchemy import case, func, select, update
 from sqlalchemy.orm import Session
 
 # Manages sector rotation state using database storage. State is stored in the database instead of a JSON file.
@@ -13,15 +16,19 @@ class SectorRotationManager:
     """Manages sector rotation state persisted in the database.
 
     This class maintains a queue of sectors and tracks which one should be
-    processed next in a round-robin fashion.
+    processed next in a round-robin fashion. The position lives in a
+    ``sector_rotation`` row that :meth:`claim_sectors` advances with one
+    atomic ``UPDATE ... RETURNING``.
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, name: str = "default"):
         """Initialize the manager with a database session.
 
         :param db: Active SQLAlchemy ``Session``.
+        :param name: Rotation name.
         """
         self.db = db
+        self.name = name
         self.state = self._load_state()
 
     def _load_state(self) -> dict:
@@ -30,80 +37,113 @@ class SectorRotationManager:
         :returns: State dict with current_index, sectors_queue, last_run, and cycle_count.
         """
         from backend.db import models
-        
-        # Get or create state record
-        state_record = self.db.query(models.SystemState).filter(
-            models.SystemState.key == "sector_rotation"
-        ).first()
-        
-        if state_record:
-            import json
-            return json.loads(state_record.value)
-        else:
-            # Create default state
-            return {
-                "current_index": 0,
-                "sectors_queue": [],
-                "last_run": None,
-                "cycle_count": 0
-            }
-    def _save_state(self):
-        """Persist rotation state to the database."""
-        from backend.db import models
-        import json
-        
-        state_record = self.db.query(models.SystemState).filter(
-            models.SystemState.key == "sector_rotation"
-        ).first()
-        
-        if state_record:
-            state_record.value = json.dumps(self.state)
-            state_record.updated_at = datetime.now()
-        else:
-            state_record = models.SystemState(
-                key="sector_rotation",
-                value=json.dumps(self.state)
-            )
-            self.db.add(state_record)
-        
-        self.db.commit()
-    
+
+        record = self.db.get(models.SectorRotation, self.name, populate_existing=True)
+        if record is None:
+            return {"current_index": 0, "sectors_queue": [], "last_run": None, "cycle_count": 0}
+        return self._as_state(record.sectors, record.current_index, record.cycle_count, record.last_run)
+
+    @staticmethod
+    def _as_state(sectors: list, current_index: int, cycle_count: int, last_run) -> dict:
+        """Return the state dict for the given column values."""
+        return {
+            "current_index": current_index,
+            "sectors_queue": list(sectors),
+            "last_run": last_run.isoformat() if last_run else None,
+            "cycle_count": cycle_count,
+        }
+
     def initialize_sectors(self, sectors: list):
         """Initialize or reset the sectors queue.
 
+        The position is reset only when the set of sectors changes.
+
         :param sectors: List of sector names to cycle through.
         """
-        if not self.state["sectors_queue"] or set(sectors) != set(self.state["sectors_queue"]):
-            self.state["sectors_queue"] = sectors.copy()
-            self.state["current_index"] = 0
-            self._save_state()
+        from backend.db import models
+
+        if self.state["sectors_queue"] and set(sectors) == set(self.state["sectors_queue"]):
+            return
+        record = self.db.get(models.SectorRotation, self.name)
+        if record is None:
+            record = models.SectorRotation(name=self.name)
+            self.db.add(record)
+        record.sectors = list(sectors)
+        record.sector_count = len(sectors)
+        record.current_index = 0
+        self.db.commit()
+        self.state = self._load_state()
 
     def get_next_sectors(self) -> Optional[str]:
         """Get the next sector in rotation and advance the pointer.
 
         :returns: The next sector name, or ``None`` if no sectors configured.
         """
-        if not self.state["sectors_queue"]:
-            return None
-        
-        # Get current sector
-        sector = self.state["sectors_queue"][self.state["current_index"]]
-        
-        # Move to next index
-        self.state["current_index"] += 1
-        
-        # Reset if we've gone through all sectors
-        if self.state["current_index"] >= len(self.state["sectors_queue"]):
-            self.state["current_index"] = 0
-            self.state["cycle_count"] += 1
-        
-        # Update last run time
-        self.state["last_run"] = datetime.now().isoformat()
-        
-        self._save_state()
-        
-        return sector
+        sectors = self.claim_sectors(count=1)
+        return sectors[0] if sectors else None
+
+    def claim_sectors(self, count: int = 1) -> list[str]:
+        """Atomically claim the next ``count`` sectors and advance the pointer.
+
+        A single ``UPDATE ... RETURNING`` advances the index (wrapping and
+        counting completed cycles in the database), so overlapping runners
+        serialize on the row and never receive the same position twice. At
+        most one full cycle is claimed.
+
+        :param count: Number of sectors to claim.
+        :returns: Claimed sector names in rotation order (empty if none configured).
+        """
+        from backend.db import models
+
+        rotation = models.SectorRotation
+        step = case((rotation.sector_count < max(count, 1), rotation.sector_count), else_=max(count, 1))
+        advanced = rotation.current_index + step
+        row = self.db.execute(
+            update(rotation)
+            .where(rotation.name == self.name, rotation.sector_count > 0)
+            .values(current_index=advanced % rotation.sector_count, cycle_count=rotation.cycle_count + advanced // rotation.sector_count, last_run=func.now())
+            .returning(rotation.sectors, rotation.sector_count, rotation.current_index, rotation.cycle_count, rotation.last_run)
+        ).first()
+        # Commit releases the row lock
+        self.db.commit()
+        if row is None:
+            return []
+
+        sectors, sector_count, current_index, cycle_count, last_run = row
+        self.state = self._as_state(sectors, current_index, cycle_count, last_run)
+        claimed = min(max(count, 1), sector_count)
+        first = (current_index - claimed) % sector_count
+        return [sectors[(first + i) % sector_count] for i in range(claimed)]
     
+    def claim_sectors_by_yield(self, sectors: list[str], count: int, lookback_days: float, revisit_seconds: float) -> list[str]:
+        """Claim the ``count`` sectors with the best recent yield.
+
+        Sectors are ranked with :func:`rank_sectors_by_yield` on the run
+        history of the last ``lookback_days``; a sector not claimed in that
+        window counts as overdue for a revisit. The rotation row stays locked
+        until the caller commits, so record the claim (the run's
+        ``pipeline_runs`` row) before committing; overlapping runners then
+        see each other's claims.
+
+        :param sectors: Enabled sector names.
+        :param count: Number of sectors to claim.
+        :param lookback_days: Days of run history used to score sectors (at least the revisit interval).
+        :param revisit_seconds: Longest a sector may go unclaimed (measured on the database clock).
+        :returns: Claimed sector names, best first (empty if none configured).
+        """
+        from backend.db import models
+        from backend.db.crud import get_sector_yield_stats
+
+        # A no-op UPDATE takes the row lock on every backend (SQLite ignores FOR UPDATE)
+        rotation = models.SectorRotation
+        self.db.execute(update(rotation).where(rotation.name == self.name).values(last_run=func.now()))
+        # Run and trend times are written by the database's now(), so waits are measured on its clock.
+        # PostgreSQL returns it in the session time zone, the wall time naive TIMESTAMP columns store.
+        now = self.db.execute(select(func.now())).scalar().replace(tzinfo=None)
+        lookback = timedelta(days=lookback_days)
+        stats = get_sector_yield_stats(self.db, now - lookback, host_since=datetime.now() - lookback)
+        return rank_sectors_by_yield(sectors, stats, count, now, revisit_seconds)
+
     # Get current rotation state
     def get_current_state(self) -> dict:
         """Get current rotation state information.
@@ -122,9 +162,11 @@ class SectorRotationManager:
     # Reset rotation to beginning
     def reset(self):
         """Reset rotation to the beginning (index 0, cycle_count 0)."""
-        self.state["current_index"] = 0
-        self.state["cycle_count"] = 0
-        self._save_state()
+        from backend.db import models
+
+        self.db.execute(update(models.SectorRotation).where(models.SectorRotation.name == self.name).values(current_index=0, cycle_count=0))
+        self.db.commit()
+        self.state = self._load_state()
 
 # Define all sectors with their search tags/keywords
 SECTOR_CONFIG = {
@@ -287,3 +329,63 @@ def get_sector_config(sector):
     :returns: Configuration mapping for the sector, or empty dict if unknown.
     """
     return SECTOR_CONFIG.get(sector, {})
+
+# Pseudo-counts blending a sector's own history with the all-sector average,
+# so sectors with little history are neither starved nor over-trusted
+YIELD_PRIOR_CALLS = 20
+YIELD_PRIOR_ARTICLES = 3
+YIELD_PRIOR_SEARCHES = 2
+
+def score_sector_yield(stats: dict, baseline: dict) -> float:
+    """Return the expected impact-weighted articles per upstream call of a sector.
+
+    The score multiplies the articles persisted per upstream call, the
+    average impact score (as a 0-1 fraction) and the share of trend
+    searches that found enough topics. Each factor is smoothed towards the
+    ``baseline`` value with a few pseudo-counts.
+
+    :param stats: The sector's entry from :func:`backend.db.crud.get_sector_yield_stats`.
+    :param baseline: Dict with the all-sector ``articles_per_call``, ``impact`` and ``skip_rate``.
+    :returns: Non-negative score; higher is better.
+    """
+    articles_per_call = (stats["articles"] + YIELD_PRIOR_CALLS * baseline["articles_per_call"]) / (stats["upstream_calls"] + YIELD_PRIOR_CALLS)
+    impact = (stats["impact_sum"] + YIELD_PRIOR_ARTICLES * baseline["impact"]) / (stats["articles"] + YIELD_PRIOR_ARTICLES)
+    skip_rate = (stats["skipped"] + YIELD_PRIOR_SEARCHES * baseline["skip_rate"]) / (stats["searches"] + YIELD_PRIOR_SEARCHES)
+    return articles_per_call * (impact / 10) * (1 - skip_rate)
+
+def rank_sectors_by_yield(sectors: list[str], stats: dict[str, dict], count: int, now: datetime, revisit_seconds: float) -> list[str]:
+    """Pick the ``count`` sectors to claim next.
+
+    Sectors not claimed for ``revisit_seconds`` (or never) come first,
+    longest-waiting first, so no sector is starved. The remaining slots go
+    to the highest :func:`score_sector_yield` scores; ties prefer the
+    sector claimed longest ago.
+
+    :param sectors: Enabled sector names.
+    :param stats: Per-sector history from :func:`backend.db.crud.get_sector_yield_stats`.
+    :param count: Number of sectors to pick (capped at ``len(sectors)``).
+    :param now: Current time on the clock that wrote ``last_claimed`` (the database's).
+    :param revisit_seconds: Longest a sector may go unclaimed.
+    :returns: Picked sector names in claim order.
+    """
+    empty = {"searches": 0, "skipped": 0, "upstream_calls": 0, "articles": 0, "impact_sum": 0, "last_claimed": None}
+    history = {sector: stats.get(sector, empty) for sector in sectors}
+
+    totals = {key: sum(entry[key] for entry in history.values()) for key in ("searches", "skipped", "upstream_calls", "articles", "impact_sum")}
+    baseline = {
+        "articles_per_call": totals["articles"] / totals["upstream_calls"] if totals["upstream_calls"] else 0.25,
+        "impact": totals["impact_sum"] / totals["articles"] if totals["articles"] else 5.0,
+        "skip_rate": totals["skipped"] / totals["searches"] if totals["searches"] else 0.0,
+    }
+
+    def waited(sector: str) -> float:
+        last_claimed = history[sector]["last_claimed"]
+        return (now - last_claimed).total_seconds() if last_claimed else float("inf")
+
+    overdue = sorted((sector for sector in sectors if waited(sector) >= revisit_seconds), key=waited, reverse=True)
+    rest = sorted(
+        (sector for sector in sectors if waited(sector) < revisit_seconds),
+        key=lambda sector: (score_sector_yield(history[sector], baseline), waited(sector)),
+        reverse=True,
+    )
+    return (overdue + rest)[:max(count, 1)]
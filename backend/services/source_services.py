@@ -1,13 +1,15 @@
 """Utilities for working with source URLs and article citations.
 
-This module provides helpers to extract a domain from a URL and to
-filter/renumber citations in an article so that only cited sources are
-kept and citation numbers are sequential.
+This module provides helpers to extract a domain from a URL, to reduce a
+URL to the canonical form used to identify a source, and to
+filter/renumber citations in an article (or a batch of articles) so that
+only cited sources are kept and citation numbers are sequential.
 """
 
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urlsplit, urlunsplit, parse_qsl, urlencode
 import logging
 import re
+from typing import Iterable, Optional
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -27,21 +29,125 @@ def extract_domain(url: str) -> str:
         return domain
     except Exception:
         return ""
-    
+
+# Query parameters that only track the referrer and never change the page
+TRACKING_PARAM_PREFIXES = ("utm_", "mc_", "pk_", "hsa_")
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "gbraid", "wbraid", "msclkid", "yclid", "twclid", "igshid",
+    "_ga", "_gl", "ref", "ref_src", "ref_url", "cmpid", "ocid", "sr_share", "amp", "outputtype",
+}
+
+def canonicalize_url(url: str) -> str:
+    """Reduce ``url`` to the canonical form used to identify a source.
+
+    Variants of the same page map to one string: the scheme becomes
+    ``https``, the host is lower-cased without ``www.``/``amp.``/``m.``
+    prefixes or default ports, Google AMP cache URLs are unwrapped, AMP path
+    segments, fragments, tracking parameters and trailing slashes are
+    dropped, and the remaining query parameters are sorted.
+
+    :param url: Raw URL as returned by the search API.
+    :returns: Canonical URL, or the stripped input if it is not an http(s) URL.
+    """
+    url = (url or "").strip()
+    try:
+        parts = urlsplit(url)
+        hostname = parts.hostname or ""
+        port = parts.port
+    except ValueError:
+        return url
+    if parts.scheme.lower() not in ("http", "https") or not hostname:
+        return url
+
+    path = parts.path
+
+    # https://example-com.cdn.ampproject.org/c/s/example.com/page -> https://example.com/page
+    if hostname.endswith(".cdn.ampproject.org"):
+        match = re.match(r"^/[a-z]/(?:s/)?([^/]+)(/.*)?$", path)
+        if match:
+            hostname, path, port = match.group(1).lower(), match.group(2) or "", None
+
+    for prefix in ("www.", "amp.", "m."):
+        if hostname.startswith(prefix) and hostname.count(".") > 1:
+            hostname = hostname[len(prefix):]
+            break
+    netloc = hostname if port in (None, 80, 443) else f"{hostname}:{port}"
+
+    path = re.sub(r"/{2,}", "/", path)
+    path = re.sub(r"^/amp(?=/)", "", path)
+    path = re.sub(r"/amp(?:\.html)?/?$", "", path)
+    path = path.rstrip("/")
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+    )
+
+    return urlunsplit(("https", netloc, path, urlencode(query), ""))
+
+# A citation group: ``[3]``, ``[2, 4]``, ``[2-4]`` or ``[1, 3-5]``. Adjacent
+# groups such as ``[1][3]`` are separate matches.
+CITATION_PATTERN = re.compile(r"\[(\d+(?:\s*[-\u2013]\s*\d+)?(?:\s*,\s*\d+(?:\s*[-\u2013]\s*\d+)?)*)\]")
+CITATION_NUMBER_PATTERN = re.compile(r"\d+")
+CITATION_RANGE_PATTERN = re.compile(r"(\d+)\s*[-\u2013]\s*(\d+)")
+
+def _citation_numbers(group: str, source_count: int) -> Optional[set]:
+    """Return the citation numbers referenced by the inside of one citation group.
+
+    Every number and range bound is checked against ``source_count`` before
+    any range is expanded, so text like ``[2019-20241231]`` costs nothing.
+
+    :param group: Text between the brackets, e.g. ``"2, 4-6"``.
+    :param source_count: Number of provided sources.
+    :returns: Set of cited numbers with ranges expanded, or ``None`` if a
+        number is outside ``1..source_count`` or a range is reversed (``[4-2]``).
+    """
+    numbers = {int(n) for n in CITATION_NUMBER_PATTERN.findall(group)}
+    if min(numbers) < 1 or max(numbers) > source_count:
+        return None
+    ranges = [(int(first), int(last)) for first, last in CITATION_RANGE_PATTERN.findall(group)]
+    if any(first > last for first, last in ranges):
+        return None
+    for first, last in ranges:
+        numbers.update(range(first + 1, last))
+    return numbers
+
 def filter_and_renumber_sources(article_text: str, sources: list, sources_provided_count: int) -> tuple:
     """Filter provided sources to only those cited in ``article_text`` and
     renumber citation indices to be sequential.
 
+    Citations may be single (``[3]``), adjacent (``[1][3]``), grouped
+    (``[2, 4]``) or ranges (``[2-4]``, every number in the range counts as
+    cited); lists naming a number outside ``sources`` and reversed ranges
+    (``[4-2]``) are left untouched. The text is tokenized once and rebuilt
+    from its slices, so the cost is linear in the article length regardless
+    of how many sources are cited.
+
     :param article_text: Article content containing citation markers like ``[1]``.
     :param sources: List of source dicts in the original order provided.
     :param sources_provided_count: Count of sources originally provided (for stats).
     :returns: Tuple of ``(renumbered_text, filtered_sources, stats_dict)``.
     """
-    # Extract all citation numbers from article
-    citations = re.findall(r'\[(\d+)\]', article_text)
-    
-    # Convert to integers and get unique citation numbers (sorted)
-    cited_numbers = sorted(set(int(c) for c in citations))
+    # Single pass: collect every citation group and the numbers it cites.
+    # Lists and ranges only count when every number names a provided source,
+    # so bracketed text like "[1999-2024]" is left alone.
+    groups = []
+    cited = set()
+    for match in CITATION_PATTERN.finditer(article_text):
+        group = match.group(1)
+        if group.isdigit():
+            # Plain "[n]" citations are kept as ints and renumbered by lookup
+            group = int(group)
+            cited.add(group)
+        else:
+            numbers = _citation_numbers(group, len(sources))
+            if numbers is None:
+                continue
+            cited |= numbers
+        groups.append((match.start(), match.end(), group))
+
+    # Unique citation numbers (sorted)
+    cited_numbers = sorted(cited)
     
     if not cited_numbers:
         # No citations found, return as-is
@@ -72,21 +178,21 @@ def filter_and_renumber_sources(article_text: str, sources: list, sources_provid
         else:
             logger.warning(f"Citation [{cite_num}] found but source not in list (have {len(sources)} sources)")
     
-    renumbered_text = article_text
-    
-    # Step 1: Replace all citations with unique placeholders
-    # Example: [2] -> __CITE_2__, [3] -> __CITE_3__, etc.
-    for old_num in citation_mapping.keys():
-        pattern = r'\[' + str(old_num) + r'\]'
-        placeholder = f'__CITE_{old_num}__'
-        renumbered_text = re.sub(pattern, placeholder, renumbered_text)
-    
-    # Step 2: Replace placeholders with new citation numbers
-    # Example: __CITE_2__ -> [1], __CITE_3__ -> [2], etc.
-    for old_num, new_num in citation_mapping.items():
-        placeholder = f'__CITE_{old_num}__'
-        replacement = f'[{new_num}]'
-        renumbered_text = renumbered_text.replace(placeholder, replacement)
+    # Rebuild the text from the slices between citation groups. The mapping
+    # keeps order and every number inside a range is cited, so renumbered
+    # ranges stay contiguous.
+    def renumber(match):
+        return str(citation_mapping[int(match.group())])
+
+    single = {old_num: f"[{new_num}]" for old_num, new_num in citation_mapping.items()}
+    pieces = []
+    position = 0
+    for start, end, group in groups:
+        pieces.append(article_text[position:start])
+        pieces.append(single[group] if type(group) is int else f"[{CITATION_NUMBER_PATTERN.sub(renumber, group)}]")
+        position = end
+    pieces.append(article_text[position:])
+    renumbered_text = "".join(pieces)
     
     # Calculate statistics
     extra_sources_added = len(sources) > sources_provided_count
@@ -99,7 +205,7 @@ def filter_and_renumber_sources(article_text: str, sources: list, sources_provid
         "sources_removed": len(sources) - len(cited_numbers),
         "cited_numbers_original": cited_numbers,
         "citation_mapping": citation_mapping,
-        "unused_numbers": [i for i in range(1, len(sources) + 1) if i not in cited_numbers],
+        "unused_numbers": [i for i in range(1, len(sources) + 1) if i not in cited],
         "extra_sources_added": extra_sources_added,
         "extra_sources_count": len(sources) - sources_provided_count if extra_sources_added else 0,
         "removal_percentage": round((len(sources) - len(cited_numbers)) / len(sources) * 100, 1) if sources else 0
@@ -107,6 +213,14 @@ def filter_and_renumber_sources(article_text: str, sources: list, sources_provid
     
     return renumbered_text, filtered_sources, stats
 
+def filter_and_renumber_sources_batch(articles: Iterable[tuple[str, list, int]]) -> list[tuple]:
+    """Run :func:`filter_and_renumber_sources` over many articles.
+
+    :param articles: ``(article_text, sources, sources_provided_count)`` tuples.
+    :returns: One ``(renumbered_text, filtered_sources, stats_dict)`` tuple per article, in order.
+    """
+    return [filter_and_renumber_sources(text, sources, provided) for text, sources, provided in articles]
+
 CREDIBLE_SOURCES = {
  "abcnews.go.com",
     "academic.oup.com",
@@ -0,0 +1,138 @@
+"""Micro-benchmark for citation filtering and renumbering.
+
+Times :func:`backend.services.source_services.filter_and_renumber_sources_batch`
+on synthetic articles against the previous implementation (one ``re.sub``
+plus one ``str.replace`` per cited number, and a list membership test per
+source), which is kept here as the baseline::
+
+    python -m backend.util_scripts.bench_citations --articles 10000 --repeat 3 --output citations.json
+
+Articles only use single ``[n]`` citations by default, so both
+implementations must produce identical text and the benchmark reports any
+mismatch. ``--grouped`` also mixes in ``[1][3]``, ``[2, 4]`` and ``[2-4]``
+citations, which only the current implementation understands.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from backend.util_scripts.bench_pipeline import git_commit, percentile
+
+WORDS = "model agents inference data compute training policy market deployment safety latency chips cloud".split()
+
+def legacy_filter_and_renumber(article_text: str, sources: list) -> tuple[str, list, list]:
+    """Previous renumbering algorithm, returning ``(text, filtered_sources, unused_numbers)``."""
+    cited_numbers = sorted(set(int(c) for c in re.findall(r'\[(\d+)\]', article_text)))
+    if not cited_numbers:
+        return article_text, sources, list(range(1, len(sources) + 1))
+    citation_mapping = {old_num: new_num for new_num, old_num in enumerate(cited_numbers, start=1)}
+    filtered_sources = [sources[n - 1] for n in cited_numbers if 0 <= n - 1 < len(sources)]
+    text = article_text
+    for old_num in citation_mapping:
+        text = re.sub(r'\[' + str(old_num) + r'\]', f'__CITE_{old_num}__', text)
+    for old_num, new_num in citation_mapping.items():
+        text = text.replace(f'__CITE_{old_num}__', f'[{new_num}]')
+    unused = [i for i in range(1, len(sources) + 1) if i not in cited_numbers]
+    return text, filtered_sources, unused
+
+def build_articles(count: int, sources_per_article: int, grouped: bool, seed: int) -> list[tuple[str, list, int]]:
+    """Return ``count`` synthetic ``(text, sources, sources_provided_count)`` tuples.
+
+    :param count: Number of articles.
+    :param sources_per_article: Sources attached to each article.
+    :param grouped: Also use adjacent, list and range citations.
+    :param seed: Random seed, so runs are comparable.
+    """
+    rng = random.Random(seed)
+    sources = [{"title": f"Source {i}", "url": f"https://example.com/{i}"} for i in range(1, sources_per_article + 1)]
+    articles = []
+    for _ in range(count):
+        # Cite roughly two thirds of the sources so renumbering has gaps to close
+        cited = sorted(rng.sample(range(1, sources_per_article + 1), k=max(1, sources_per_article * 2 // 3)))
+        sentences = []
+        for _ in range(40):
+            sentence = " ".join(rng.choices(WORDS, k=14))
+            n = rng.choice(cited)
+            if grouped and rng.random() < 0.3:
+                m = rng.choice(cited)
+                citation = rng.choice((f"[{n}][{m}]", f"[{min(n, m)}, {max(n, m)}]", f"[{min(n, m)}-{max(n, m)}]"))
+            else:
+                citation = f"[{n}]"
+            sentences.append(f"{sentence}{citation}.")
+        articles.append((" ".join(sentences), sources, sources_per_article))
+    return articles
+
+def main() -> None:
+    """Parse options, run the benchmark and report results."""
+    parser = argparse.ArgumentParser(description="Benchmark citation filtering and renumbering.")
+    parser.add_argument("--articles", type=int, default=10_000, help="Synthetic articles per pass.")
+    parser.add_argument("--sources", type=int, default=20, help="Sources attached to each article.")
+    parser.add_argument("--grouped", action="store_true", help="Mix in [1][3], [2, 4] and [2-4] citations.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes per implementation.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write results JSON to this path.")
+    args = parser.parse_args()
+
+    # Settings are read on first import; only placeholder values are needed here
+    os.environ.setdefault("DATABASE_URL", "sqlite://")
+    os.environ.setdefault("PERPLEXITY_API_KEY", "bench")
+    os.environ.setdefault("OPENAI_API_KEY", "bench")
+
+    from backend.services.source_services import filter_and_renumber_sources_batch
+
+    articles = build_articles(args.articles, args.sources, args.grouped, args.seed)
+    chars = sum(len(text) for text, _, _ in articles)
+
+    timings = {"legacy": [], "current": []}
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        legacy = [legacy_filter_and_renumber(text, sources) for text, sources, _ in articles]
+        timings["legacy"].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        current = filter_and_renumber_sources_batch(articles)
+        timings["current"].append(time.perf_counter() - start)
+
+    mismatches = sum(
+        (text, filtered, unused) != (result[0], result[1], result[2]["unused_numbers"])
+        for (text, filtered, unused), result in zip(legacy, current)
+    )
+
+    results = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "config": {
+            "articles": args.articles,
+            "sources_per_article": args.sources,
+            "grouped_citations": args.grouped,
+            "mean_article_chars": round(chars / len(articles)) if articles else 0,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "implementations": {
+            name: {
+                "p50_seconds": round(percentile(values, 50), 4),
+                "us_per_article": round(percentile(values, 50) / max(1, args.articles) * 1e6, 2),
+            }
+            for name, values in timings.items()
+        },
+        "speedup": round(percentile(timings["legacy"], 50) / percentile(timings["current"], 50), 2),
+        "mismatches": mismatches,
+    }
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"Results written to {args.output}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Micro-benchmark for source domain classification.
+
+Compares three ways of deciding whether a source domain is trusted or
+blacklisted:
+
+- ``exact``       -> exact set membership (the previous behaviour)
+- ``suffix_walk`` -> set membership of every parent domain, most specific first
+- ``trie``        -> :class:`backend.services.domain_trust.DomainTrustIndex`
+
+The workload mixes listed domains, subdomains of listed domains (``m.``,
+``news.``, ``foo.``, shared-hosting tenants) and unlisted domains. For each
+approach the time per lookup is reported, together with the number of
+domains it classifies differently from the trie::
+
+    python -m backend.util_scripts.bench_domain_trust --domains 200000 --repeat 5 --output trust.json
+
+Settings are read from the environment when :mod:`backend.config` is first
+imported, so placeholder values are set before importing any other backend
+module.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from backend.util_scripts.bench_pipeline import git_commit, percentile
+
+def build_workload(trusted: set[str], blacklisted: set[str], count: int, seed: int) -> list[str]:
+    """Return ``count`` domains to classify.
+
+    :param trusted: Trusted domains.
+    :param blacklisted: Blacklisted domains.
+    :param count: Number of domains to generate.
+    :param seed: Random seed, so runs are comparable.
+    :returns: Domains in random order.
+    """
+    rng = random.Random(seed)
+    listed = sorted(trusted | blacklisted)
+    domains = []
+    for i in range(count):
+        kind = i % 4
+        if kind == 0:
+            domains.append(rng.choice(listed))
+        elif kind == 1:
+            domains.append(f"{rng.choice(('m', 'news', 'foo', 'blog.eu'))}.{rng.choice(listed)}")
+        elif kind == 2:
+            domains.append(f"site{rng.randrange(10_000)}.{rng.choice(('blogspot.com', 'github.io', 'substack.com'))}")
+        else:
+            domains.append(f"unlisted{rng.randrange(100_000)}.{rng.choice(('com', 'org', 'co.uk', 'io'))}")
+    rng.shuffle(domains)
+    return domains
+
+def exact_classifier(trusted: set[str], blacklisted: set[str]) -> Callable[[str], tuple[bool, bool]]:
+    """Return the exact set lookup used before the trust index."""
+    def classify(domain: str) -> tuple[bool, bool]:
+        return domain in trusted, domain in blacklisted
+    return classify
+
+def suffix_walk_classifier(trusted: set[str], blacklisted: set[str]) -> Callable[[str], tuple[bool, bool]]:
+    """Return a lookup that checks each parent domain against the sets (no public-suffix handling)."""
+    def classify(domain: str) -> tuple[bool, bool]:
+        labels = domain.split(".")
+        for i in range(len(labels) - 1):
+            candidate = ".".join(labels[i:])
+            if candidate in blacklisted:
+                return False, True
+            if candidate in trusted:
+                return True, False
+        return False, False
+    return classify
+
+def time_lookups(classify: Callable[[str], tuple[bool, bool]], domains: list[str], repeat: int) -> list[float]:
+    """Return nanoseconds per lookup for each of ``repeat`` passes over ``domains``."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for domain in domains:
+            classify(domain)
+        timings.append((time.perf_counter_ns() - start) / len(domains))
+    return timings
+
+def main() -> None:
+    """Parse options, run the benchmark and report results."""
+    parser = argparse.ArgumentParser(description="Benchmark source domain trust classification.")
+    parser.add_argument("--domains", type=int, default=100_000, help="Domains classified per pass.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed passes per approach.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--trust-file", help="JSON rules file to use instead of the built-in lists.")
+    parser.add_argument("--output", help="Write results JSON to this path.")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DATABASE_URL", "sqlite://")
+    os.environ.setdefault("PERPLEXITY_API_KEY", "bench")
+    os.environ.setdefault("OPENAI_API_KEY", "bench")
+
+    from backend.services.domain_trust import DomainTrustIndex, normalize_host
+    from backend.services.source_services import CREDIBLE_SOURCES, BLACKLISTED_SOURCES
+
+    trusted, blacklisted = set(CREDIBLE_SOURCES), set(BLACKLISTED_SOURCES)
+    if args.trust_file:
+        data = json.loads(Path(args.trust_file).read_text())
+        trusted, blacklisted = set(data.get("trusted", [])), set(data.get("blacklisted", []))
+    trusted = {normalize_host(d) for d in trusted}
+    blacklisted = {normalize_host(d) for d in blacklisted}
+
+    build_start = time.perf_counter()
+    index = DomainTrustIndex(trusted, blacklisted)
+    build_ms = (time.perf_counter() - build_start) * 1000
+
+    domains = build_workload(trusted, blacklisted, args.domains, args.seed)
+    approaches = {
+        "exact": exact_classifier(trusted, blacklisted),
+        "suffix_walk": suffix_walk_classifier(trusted, blacklisted),
+        "trie": index.classify,
+    }
+
+    reference = [index.classify(d) for d in domains]
+    approach_results = {}
+    for name, classify in approaches.items():
+        timings = time_lookups(classify, domains, args.repeat)
+        verdicts = [classify(d) for d in domains]
+        approach_results[name] = {
+            "ns_per_lookup_p50": round(percentile(timings, 50), 1),
+            "ns_per_lookup_min": round(min(timings), 1),
+            "trusted": sum(t for t, _ in verdicts),
+            "blacklisted": sum(b for _, b in verdicts),
+            "differs_from_trie": sum(v != r for v, r in zip(verdicts, reference)),
+        }
+
+    results = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "config": {
+            "domains": args.domains,
+            "repeat": args.repeat,
+            "seed": args.seed,
+            "trusted_rules": len(trusted),
+            "blacklisted_rules": len(blacklisted),
+        },
+        "trie_build_ms": round(build_ms, 3),
+        "approaches": approach_results,
+    }
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"Results written to {args.output}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""End-to-end benchmark for the ingest pipeline.
+
+Drives :func:`backend.util_scripts.cronjob.main` against a stub upstream
+(:mod:`backend.util_scripts.fake_llm_server`, started in-process unless
+``--upstream`` points at one that is already running) and a seeded
+database (a throwaway SQLite file by default, or ``--database-url``).
+
+Each pipeline stage is timed and the SQL statements it issues are counted:
+
+- ``trend_search``     -> ``perplexity_search_trends``
+- ``article_find``     -> ``perplexity_find_articles``
+- ``summarize``        -> ``perplexity_summarize``
+- ``impact_score``     -> ``perplexity_impact_score``
+- ``impact_score_batch`` -> ``perplexity_impact_score_batch``
+- ``filter_renumber``  -> ``filter_and_renumber_sources``
+- ``persist``          -> ``create_article_with_sources_and_tags``
+
+Results (per-stage p50/p95 latency, statement counts, articles per minute
+and the git commit) are printed and optionally saved as JSON so runs can be
+compared across commits::
+
+    python -m backend.util_scripts.bench_pipeline --sectors 4 --runs 3 --latency lognormal:0.3,0.5 --output bench.json
+
+Settings are read from the environment when :mod:`backend.config` is first
+imported, so this script configures the environment before importing any
+other backend module.
+"""
+
+import argparse
+import contextlib
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+STAGES = {
+    "trend_search": "perplexity_search_trends",
+    "article_find": "perplexity_find_articles",
+    "summarize": "perplexity_summarize",
+    "impact_score": "perplexity_impact_score",
+    "impact_score_batch": "perplexity_impact_score_batch",
+    "filter_renumber": "filter_and_renumber_sources",
+    "persist": "create_article_with_sources_and_tags",
+}
+
+def percentile(values: list[float], pct: float) -> Optional[float]:
+    """Return the nearest-rank percentile of ``values`` (``None`` if empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+def git_commit() -> Optional[str]:
+    """Return the current git commit hash, if available."""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+class StageRecorder:
+    """Collects per-stage durations and SQL statement counts across threads."""
+
+    def __init__(self):
+        self.durations: dict[str, list[float]] = defaultdict(list)
+        self.statements: dict[str, int] = defaultdict(int)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def wrap(self, stage: str, fn):
+        """Return ``fn`` wrapped to time it and attribute its SQL to ``stage``."""
+        def timed(*args, **kwargs):
+            previous = getattr(self._local, "stage", None)
+            self._local.stage = stage
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self._local.stage = previous
+                with self._lock:
+                    self.durations[stage].append(elapsed)
+        return timed
+
+    def on_statement(self, *_args, **_kwargs):
+        """SQLAlchemy ``before_cursor_execute`` listener."""
+        stage = getattr(self._local, "stage", None) or "other"
+        with self._lock:
+            self.statements[stage] += 1
+
+    def summary(self) -> dict:
+        """Return per-stage statistics in milliseconds."""
+        result = {}
+        for stage in list(STAGES) + ["other"]:
+            durations = self.durations.get(stage, [])
+            if not durations and not self.statements.get(stage):
+                continue
+            result[stage] = {
+                "calls": len(durations),
+                "p50_ms": round(percentile(durations, 50) * 1000, 2) if durations else None,
+                "p95_ms": round(percentile(durations, 95) * 1000, 2) if durations else None,
+                "mean_ms": round(sum(durations) / len(durations) * 1000, 2) if durations else None,
+                "db_statements": self.statements.get(stage, 0),
+            }
+        return result
+
+def seed_database(count: int):
+    """Create the schema and insert ``count`` synthetic articles with sources and tags.
+
+    :param count: Number of articles to seed.
+    """
+    from sqlalchemy import insert
+    from backend.db.database import Base, engine
+    from backend.db import models
+    from backend.services.sector_service import get_enabled_sectors
+
+    Base.metadata.create_all(bind=engine)
+    if count <= 0:
+        return
+
+    sectors = get_enabled_sectors()
+    with engine.begin() as conn:
+        if conn.execute(models.Article.__table__.select().limit(1)).first():
+            return
+        conn.execute(insert(models.Tag), [{"id": i + 1, "name": f"Seed Tag {i}"} for i in range(200)])
+        conn.execute(insert(models.Source), [
+            {"id": i + 1, "title": f"Seed source {i}", "url": f"https://seed{i % 50}.example.com/article-{i}", "canonical_url": f"https://seed{i % 50}.example.com/article-{i}", "domain": f"seed{i % 50}.example.com", "sector": sectors[i % len(sectors)]}
+            for i in range(count * 3)
+        ])
+        conn.execute(insert(models.Article), [
+            {"id": i + 1, "title": f"Seeded article {i} about AI in {sectors[i % len(sectors)]}", "content": "Seed content[1][2][3]. " * 40, "impact_score": i % 11, "sector": sectors[i % len(sectors)]}
+            for i in range(count)
+        ])
+        conn.execute(insert(models.source_articles), [
+            {"article_id": i + 1, "source_id": i * 3 + k + 1, "position": k + 1} for i in range(count) for k in range(3)
+        ])
+        conn.execute(insert(models.article_tags), [
+            {"article_id": i + 1, "tag_id": (i * 7 + k) % 200 + 1} for i in range(count) for k in range(3)
+        ])
+
+def main() -> None:
+    """Parse options, run the benchmark and report results."""
+    parser = argparse.ArgumentParser(description="Benchmark the ingest pipeline against a stub upstream.")
+    parser.add_argument("--database-url", help="Database to use (default: throwaway SQLite file).")
+    parser.add_argument("--seed-articles", type=int, default=500, help="Synthetic articles to seed before running.")
+    parser.add_argument("--upstream", help="Base URL of an already running fake_llm_server.")
+    parser.add_argument("--latency", default="lognormal:0.2,0.5", help="Latency spec for the in-process stub.")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--fixtures", help="Recorded JSONL fixtures for the in-process stub.")
+    parser.add_argument("--sectors", type=int, default=2, help="Sectors claimed per run.")
+    parser.add_argument("--runs", type=int, default=1, help="Number of cron runs to execute.")
+    parser.add_argument("--workers", type=int, help="Override INGEST_WORKERS.")
+    parser.add_argument("--output", help="Write results JSON to this path.")
+    args = parser.parse_args()
+
+    server = None
+    if args.upstream:
+        upstream = args.upstream.rstrip("/")
+    else:
+        from backend.util_scripts.fake_llm_server import FakeServerConfig, serve_in_thread
+        upstream, server = serve_in_thread(FakeServerConfig(latency=args.latency, error_rate=args.error_rate, fixtures=args.fixtures))
+
+    workdir = tempfile.mkdtemp(prefix="bench-pipeline-")
+    database_url = args.database_url or f"sqlite:///{Path(workdir) / 'bench.db'}"
+    os.environ.update({
+        "DATABASE_URL": database_url,
+        "PERPLEXITY_API_KEY": os.getenv("PERPLEXITY_API_KEY") or "bench",
+        "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY") or "bench",
+        "PERPLEXITY_ENDPOINT": f"{upstream}/chat/completions",
+        "OPENAI_BASE_URL": f"{upstream}/v1",
+        "LLM_CACHE_DIR": "",
+    })
+    if not args.upstream:
+        # The in-process stub has no rate limits to stay under
+        os.environ["RATE_LIMITS"] = ""
+    if args.workers:
+        os.environ["INGEST_WORKERS"] = str(args.workers)
+
+    from sqlalchemy import event, func, select
+    from backend.config import settings
+    from backend.db.database import engine
+    from backend.db import models
+    from backend.util_scripts import cronjob
+
+    seed_database(args.seed_articles)
+
+    def article_count() -> int:
+        with engine.connect() as conn:
+            return conn.execute(select(func.count()).select_from(models.Article)).scalar_one()
+
+    articles_before = article_count()
+
+    recorder = StageRecorder()
+    event.listen(engine, "before_cursor_execute", recorder.on_statement)
+    for stage, name in STAGES.items():
+        if hasattr(cronjob, name):
+            setattr(cronjob, name, recorder.wrap(stage, getattr(cronjob, name)))
+
+    # Keep stdout for the results JSON
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(sys.stderr):
+        for _ in range(args.runs):
+            cronjob.main(sectors_per_run=args.sectors)
+    elapsed = time.perf_counter() - start
+
+    articles = article_count() - articles_before
+    results = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "config": {
+            "database": engine.dialect.name,
+            "seed_articles": args.seed_articles,
+            "upstream": "external" if args.upstream else f"in-process ({args.latency}, error_rate={args.error_rate})",
+            "sectors_per_run": args.sectors,
+            "runs": args.runs,
+            "ingest_workers": settings.INGEST_WORKERS,
+        },
+        "wall_seconds": round(elapsed, 3),
+        "articles": articles,
+        "articles_per_minute": round(articles / elapsed * 60, 2) if elapsed else None,
+        "db_statements": sum(recorder.statements.values()),
+        "stages": recorder.summary(),
+    }
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"Results written to {args.output}", file=sys.stderr)
+
+    if server is not None:
+        server.should_exit = True
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""Simulation comparing the sector schedulers.
+
+Replays weeks of ingest runs against synthetic sectors whose hidden yield
+differs (how often the trend search finds enough topics, how often a
+trend becomes an article and how high those articles score) and compares
+``rotation`` with ``yield`` scheduling
+(:func:`backend.services.sector_service.rank_sectors_by_yield`)::
+
+    python -m backend.util_scripts.bench_scheduler --days 90 --sectors-per-run 1 --output scheduler.json
+
+Each claimed sector costs one trend search call; when enough topics are
+found, every trend costs an article search and a summarize call, and the
+sector's articles share one impact scoring call. Both schedulers see the
+same sectors and random draws. The report gives articles and publishable
+articles (impact at or above ``--publishable``) per 100 upstream calls,
+and the longest gap between two claims of any sector.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from backend.util_scripts.bench_pipeline import git_commit
+
+TRENDS_PER_SEARCH = 3
+
+def build_sectors(names: list[str], seed: int) -> dict[str, dict]:
+    """Return hidden yield parameters for each sector.
+
+    :param names: Sector names.
+    :param seed: Random seed, so runs are comparable.
+    """
+    rng = random.Random(seed)
+    return {
+        name: {
+            "p_topics": rng.uniform(0.2, 1.0),
+            "p_article": rng.uniform(0.3, 0.95),
+            "impact": rng.uniform(2, 9),
+        }
+        for name in names
+    }
+
+def simulate(scheduler: str, sectors: dict[str, dict], args: argparse.Namespace) -> dict:
+    """Run ``args.days`` of runs with ``scheduler`` and return the totals.
+
+    :param scheduler: ``rotation`` or ``yield``.
+    :param sectors: Hidden parameters from :func:`build_sectors`.
+    :param args: Parsed command line options.
+    """
+    from backend.services.sector_service import rank_sectors_by_yield
+
+    rng = random.Random(args.seed + 1)
+    names = list(sectors)
+    start = datetime(2026, 1, 1)
+    interval = timedelta(hours=args.interval_hours)
+    revisit_seconds = args.revisit_days * 86400
+    lookback = timedelta(days=args.lookback_days)
+    events = []
+    last_claimed: dict[str, datetime] = {}
+    max_gap = 0.0
+    position = 0
+    totals = {"runs": 0, "claims": 0, "skipped": 0, "upstream_calls": 0, "articles": 0, "publishable": 0}
+
+    now = start
+    while now < start + timedelta(days=args.days):
+        count = args.sectors_per_run or len(names)
+        if scheduler == "yield":
+            stats = {}
+            for at, sector, calls, articles, impact_sum, skipped in events:
+                if at < now - lookback:
+                    continue
+                entry = stats.setdefault(sector, {"searches": 0, "skipped": 0, "upstream_calls": 0, "articles": 0, "impact_sum": 0, "last_claimed": None})
+                entry["searches"] += 1
+                entry["skipped"] += skipped
+                entry["upstream_calls"] += calls
+                entry["articles"] += articles
+                entry["impact_sum"] += impact_sum
+            for sector, at in last_claimed.items():
+                if at >= now - lookback:
+                    stats.setdefault(sector, {"searches": 0, "skipped": 0, "upstream_calls": 0, "articles": 0, "impact_sum": 0, "last_claimed": None})["last_claimed"] = at
+            claimed = rank_sectors_by_yield(names, stats, count, now, revisit_seconds)
+        else:
+            claimed = [names[(position + i) % len(names)] for i in range(min(count, len(names)))]
+            position = (position + len(claimed)) % len(names)
+
+        for sector in claimed:
+            if sector in last_claimed:
+                max_gap = max(max_gap, (now - last_claimed[sector]).total_seconds())
+            last_claimed[sector] = now
+            params = sectors[sector]
+            calls, articles, publishable, impact_sum, skipped = 1, 0, 0, 0, 0
+            if rng.random() < params["p_topics"]:
+                calls += 2 * TRENDS_PER_SEARCH
+                for _ in range(TRENDS_PER_SEARCH):
+                    if rng.random() < params["p_article"]:
+                        impact = max(0, min(10, round(rng.gauss(params["impact"], 1.5))))
+                        articles += 1
+                        impact_sum += impact
+                        publishable += impact >= args.publishable
+                if articles:
+                    calls += 1
+            else:
+                skipped = 1
+            events.append((now, sector, calls, articles, impact_sum, skipped))
+            totals["claims"] += 1
+            totals["skipped"] += skipped
+            totals["upstream_calls"] += calls
+            totals["articles"] += articles
+            totals["publishable"] += publishable
+        totals["runs"] += 1
+        now += interval
+
+    end = now
+    # Sectors still waiting at the end count towards the longest gap too
+    for sector in names:
+        max_gap = max(max_gap, (end - last_claimed.get(sector, start)).total_seconds())
+
+    calls = max(1, totals["upstream_calls"])
+    return {
+        **totals,
+        "articles_per_100_calls": round(totals["articles"] * 100 / calls, 2),
+        "publishable_per_100_calls": round(totals["publishable"] * 100 / calls, 2),
+        "skip_rate": round(totals["skipped"] / max(1, totals["claims"]), 3),
+        "max_revisit_gap_days": round(max_gap / 86400, 2),
+    }
+
+def main() -> None:
+    """Parse options, run the simulation and report results."""
+    parser = argparse.ArgumentParser(description="Compare rotation and yield-weighted sector scheduling.")
+    parser.add_argument("--days", type=int, default=90, help="Simulated days.")
+    parser.add_argument("--interval-hours", type=float, default=6, help="Hours between runs.")
+    parser.add_argument("--sectors-per-run", type=int, default=1, help="Sectors claimed per run (0 = all).")
+    parser.add_argument("--lookback-days", type=float, default=30, help="History scored by the yield scheduler.")
+    parser.add_argument("--revisit-days", type=float, default=7, help="Longest a sector may go unclaimed.")
+    parser.add_argument("--publishable", type=int, default=5, help="Impact score an article needs to count as publishable.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write results JSON to this path.")
+    args = parser.parse_args()
+
+    # Settings are read on first import; only placeholder values are needed here
+    os.environ.setdefault("DATABASE_URL", "sqlite://")
+    os.environ.setdefault("PERPLEXITY_API_KEY", "bench")
+    os.environ.setdefault("OPENAI_API_KEY", "bench")
+
+    from backend.services.sector_service import get_enabled_sectors
+
+    sectors = build_sectors(get_enabled_sectors(), args.seed)
+    schedulers = {name: simulate(name, sectors, args) for name in ("rotation", "yield")}
+
+    results = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "config": {
+            "sectors": len(sectors),
+            "days": args.days,
+            "interval_hours": args.interval_hours,
+            "sectors_per_run": args.sectors_per_run,
+            "lookback_days": args.lookback_days,
+            "revisit_days": args.revisit_days,
+            "publishable_impact": args.publishable,
+            "seed": args.seed,
+        },
+        "schedulers": schedulers,
+        "publishable_per_call_gain": round(
+            schedulers["yield"]["publishable_per_100_calls"] / max(0.01, schedulers["rotation"]["publishable_per_100_calls"]), 2
+        ),
+    }
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"Results written to {args.output}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""Benchmark for keyword sector classification over the article archive.
+
+Scores every stored article (title, tag names and content) against the
+sector keywords with two matchers and reports throughput and whether they
+agree:
+
+- ``per_keyword`` -> one compiled regular expression per keyword, searched in turn
+- ``automaton``   -> :class:`backend.services.sector_classifier.SectorClassifier`
+
+::
+
+    python -m backend.util_scripts.bench_sector_classifier --repeat 3 --output sectors.json
+    python -m backend.util_scripts.bench_sector_classifier --synthetic 20000
+
+Articles are read from ``DATABASE_URL`` in id order. ``--synthetic N``
+(or an empty archive) uses generated articles instead. The report also
+gives how many articles receive secondary sectors.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from backend.util_scripts.bench_pipeline import git_commit, percentile
+
+FILLER = "model agents inference data compute training policy market deployment safety latency chips report week".split()
+
+def load_archive(limit: int, batch_size: int = 1000) -> list[tuple[str, str, list[str], str]]:
+    """Return ``(title, content, tag_names, sector)`` for stored articles in id order.
+
+    :param limit: Maximum articles to read (``0`` reads all).
+    :param batch_size: Rows fetched per round trip.
+    """
+    from sqlalchemy import select
+
+    from backend.db.database import SessionLocal
+    from backend.db import models
+
+    db = SessionLocal()
+    try:
+        articles = []
+        last_id = 0
+        while not limit or len(articles) < limit:
+            rows = db.execute(
+                select(models.Article.id, models.Article.title, models.Article.content, models.Article.sector)
+                .where(models.Article.id > last_id).order_by(models.Article.id).limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            links = models.article_tags.c
+            tags = {row.id: [] for row in rows}
+            for article_id, name in db.execute(
+                select(links.article_id, models.Tag.name).join(models.Tag, models.Tag.id == links.tag_id).where(links.article_id.in_(list(tags)))
+            ):
+                tags[article_id].append(name)
+            articles += [(row.title or "", row.content or "", tags[row.id], row.sector) for row in rows]
+            last_id = rows[-1].id
+        return articles[:limit] if limit else articles
+    finally:
+        db.close()
+
+def build_articles(keywords: dict[str, list[str]], count: int, seed: int) -> list[tuple[str, str, list[str], str]]:
+    """Return ``count`` synthetic articles mentioning a main sector and a few others.
+
+    :param keywords: Mapping of sector to keywords.
+    :param count: Number of articles.
+    :param seed: Random seed, so runs are comparable.
+    """
+    rng = random.Random(seed)
+    sectors = list(keywords)
+    articles = []
+    for _ in range(count):
+        sector = rng.choice(sectors)
+        others = rng.sample(sectors, k=2)
+        sentences = []
+        for _ in range(30):
+            words = rng.choices(FILLER, k=16)
+            pool = keywords[sector] if rng.random() < 0.3 else keywords[rng.choice(others)] if rng.random() < 0.1 else ()
+            if pool:
+                words[rng.randrange(len(words))] = rng.choice(pool) + rng.choice(("", "", "s"))
+            sentences.append(" ".join(words).capitalize() + ".")
+        title = f"{rng.choice(keywords[sector]).title()} {' '.join(rng.choices(FILLER, k=6))}"
+        tags = rng.sample(keywords[sector], k=min(2, len(keywords[sector]))) + rng.sample(FILLER, k=2)
+        articles.append((title, " ".join(sentences), tags, sector))
+    return articles
+
+def _token_pattern(token: str) -> str:
+    """Regular expression for one keyword token and its plurals."""
+    from backend.services.sector_classifier import SIBILANT_ENDINGS
+
+    if token.endswith("y"):
+        return re.escape(token[:-1]) + "(?:y|ies|ys)"
+    if token.endswith(SIBILANT_ENDINGS):
+        return re.escape(token) + "(?:s|es)?"
+    return re.escape(token) + "s?"
+
+def keyword_pattern(keyword: str) -> str:
+    """Whole-word regular expression for ``keyword`` matching what the automaton matches."""
+    from backend.services.sector_classifier import tokenize
+
+    return r"(?<![a-z0-9])" + r"[^a-z0-9]+".join(_token_pattern(token) for token in tokenize(keyword)) + r"(?![a-z0-9])"
+
+def per_keyword_matcher(keywords: dict[str, list[str]]) -> Callable[[str], set[str]]:
+    """Return a matcher searching each keyword's compiled expression in turn."""
+    from backend.services.sector_classifier import tokenize
+
+    patterns = {" ".join(tokenize(keyword)): re.compile(keyword_pattern(keyword)) for sector_keywords in keywords.values() for keyword in sector_keywords}
+
+    def match(text: str) -> set[str]:
+        text = text.lower()
+        return {keyword for keyword, pattern in patterns.items() if pattern.search(text)}
+    return match
+
+def automaton_matcher(classifier) -> Callable[[str], set[str]]:
+    """Return a matcher running the compiled automaton."""
+    def match(text: str) -> set[str]:
+        return {keyword for keyword, _ in classifier.find(text)}
+    return match
+
+def score(match: Callable[[str], set[str]], sectors_by_keyword: dict[str, list[str]], article: tuple) -> dict[str, int]:
+    """Score one article with ``match`` using the classifier's field weights."""
+    from backend.services.sector_classifier import FIELD_WEIGHTS
+
+    title, content, tags, _ = article
+    scores: dict[str, int] = {}
+    for field, texts in (("title", (title,)), ("tags", tags), ("content", (content,))):
+        for keyword in set().union(*(match(text) for text in texts)):
+            for sector in sectors_by_keyword[keyword]:
+                scores[sector] = scores.get(sector, 0) + FIELD_WEIGHTS[field]
+    return scores
+
+def main() -> None:
+    """Parse options, run the benchmark and report results."""
+    parser = argparse.ArgumentParser(description="Benchmark keyword sector classification.")
+    parser.add_argument("--limit", type=int, default=0, help="Articles read from the archive (0 = all).")
+    parser.add_argument("--synthetic", type=int, default=0, help="Use this many generated articles instead of the archive.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes per matcher.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write results JSON to this path.")
+    args = parser.parse_args()
+
+    # Settings are read on first import; only the database URL matters here
+    os.environ.setdefault("PERPLEXITY_API_KEY", "bench")
+    os.environ.setdefault("OPENAI_API_KEY", "bench")
+    if args.synthetic:
+        os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+    from backend.services.sector_classifier import get_sector_classifier, tokenize
+    from backend.services.sector_service import get_enabled_sectors, get_sector_tags
+
+    keywords = {sector: get_sector_tags(sector) for sector in get_enabled_sectors()}
+    classifier = get_sector_classifier()
+    sectors_by_keyword: dict[str, list[str]] = {}
+    for sector, sector_keywords in keywords.items():
+        for keyword in sector_keywords:
+            sectors_by_keyword.setdefault(" ".join(tokenize(keyword)), []).append(sector)
+
+    source = "synthetic"
+    articles = [] if args.synthetic else load_archive(args.limit)
+    if articles:
+        source = "archive"
+    else:
+        articles = build_articles(keywords, args.synthetic or 10_000, args.seed)
+    chars = sum(len(title) + len(content) + sum(len(tag) for tag in tags) for title, content, tags, _ in articles)
+
+    matchers = {
+        "per_keyword": per_keyword_matcher(keywords),
+        "automaton": automaton_matcher(classifier),
+    }
+    timings = {name: [] for name in matchers}
+    results_by_matcher = {}
+    for _ in range(args.repeat):
+        for name, match in matchers.items():
+            start = time.perf_counter()
+            results_by_matcher[name] = [score(match, sectors_by_keyword, article) for article in articles]
+            timings[name].append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    assigned = [classifier.classify(title, content, tags, primary=sector) for title, content, tags, sector in articles]
+    classify_seconds = time.perf_counter() - start
+    secondary_counts = Counter(len(match.secondary) for match in assigned)
+
+    results = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "config": {
+            "source": source,
+            "articles": len(articles),
+            "mean_article_chars": round(chars / len(articles)) if articles else 0,
+            "sectors": len(keywords),
+            "keywords": len(sectors_by_keyword),
+            "repeat": args.repeat,
+        },
+        "matchers": {
+            name: {
+                "p50_seconds": round(percentile(values, 50), 4),
+                "us_per_article": round(percentile(values, 50) / max(1, len(articles)) * 1e6, 1),
+                "mb_per_second": round(chars / 1e6 / percentile(values, 50), 2) if percentile(values, 50) else None,
+            }
+            for name, values in timings.items()
+        },
+        "speedup": round(percentile(timings["per_keyword"], 50) / percentile(timings["automaton"], 50), 2),
+        "score_mismatches": sum(a != b for a, b in zip(results_by_matcher["per_keyword"], results_by_matcher["automaton"])),
+        "classify_us_per_article": round(classify_seconds / max(1, len(articles)) * 1e6, 1),
+        "secondary_sectors": {str(count): articles_with for count, articles_with in sorted(secondary_counts.items())},
+    }
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"Results written to {args.output}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
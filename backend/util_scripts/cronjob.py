@@ -3,135 +3,569 @@
 This script is intended to be run from a scheduler (cron, task scheduler)
 or invoked manually. It rotates through enabled sectors and uses Perplexity
 and other helpers to build and store article summaries.
+
+Trends within a sector are researched (article search and summary)
+concurrently on a thread pool (``settings.INGEST_WORKERS`` workers), then
+scored together in batched requests, then persisted. The pipeline is
+dominated by slow upstream calls, so a run takes roughly as long as its
+slowest trend.
+
+A run may claim several sectors at once (``settings.SECTORS_PER_RUN`` or
+``--sectors N``); they are claimed atomically from the rotation and then
+processed in parallel (``settings.SECTOR_WORKERS`` at a time). Using
+``--sectors 0`` claims a full rotation.
+
+Before any per-trend API call, trends that closely rephrase an article
+published in the last ``settings.DEDUP_LOOKBACK_DAYS`` days (or another
+trend accepted earlier in the same run) are skipped; see
+:mod:`backend.services.dedup_service`.
+
+Every run is recorded in ``pipeline_runs`` and each trend's stage outputs
+(found articles, summary, impact score) are checkpointed in
+``pipeline_trends`` as soon as they are available. ``--resume`` finishes
+the trends that earlier runs left unfinished, reusing the checkpointed
+outputs instead of repeating those upstream calls. The article and the
+final ``done`` checkpoint are committed together, so retrying a trend
+never creates a second article.
+
+``pipeline_trends`` also serves as a durable job queue. Trends processed
+in-line are created already claimed by this process. With
+``--discover-only`` the run only finds and enqueues trends, and any number
+of :mod:`backend.util_scripts.worker` processes claim and summarize them.
+Claims expire after ``settings.QUEUE_VISIBILITY_TIMEOUT``; failed jobs are
+retried with a growing delay and dead-lettered after
+``settings.QUEUE_MAX_ATTEMPTS`` attempts.
 """
 
-from backend.services.perplexity_service import perplexity_search_trends, perplexity_find_articles, perplexity_summarize, perplexity_impact_score
+import argparse
+import os
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from backend.services.perplexity_service import perplexity_search_trends, perplexity_find_articles, perplexity_summarize, perplexity_impact_score, perplexity_impact_score_batch
 from backend.services.source_services import extract_domain, filter_and_renumber_sources
+from backend.config import settings
 from backend.db.database import SessionLocal
-from backend.db.crud import create_article_with_sources_and_tags
+from backend.db.crud import create_article_with_sources_and_tags, create_pipeline_run, create_pipeline_trends, finish_pipeline_run, claim_pipeline_trends, save_pipeline_trend_progress, complete_pipeline_trend, fail_pipeline_trend, add_pipeline_stage_event
+from backend.db.models import PipelineTrend
 from backend.services.sector_service import SectorRotationManager, get_enabled_sectors, get_sector_tags
+from backend.services.dedup_service import TrendDeduplicator
+from backend.services.pipeline_metrics import StageMetrics
+from backend.services.sector_classifier import classify_article, classify_source
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def main():
-    """Main entrypoint for the cron job flow.
+# Identifies this process as the holder of claimed trend jobs
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
 
-    Orchestrates sector rotation, topic discovery, article search, summary
-    generation and persistence. Intended for use by a scheduler.
+class ClaimLostError(RuntimeError):
+    """Raised when a trend job's claim expired and another worker took it over."""
+
+def _save_checkpoint(db, checkpoint: Optional[PipelineTrend], owner: Optional[str], stage: Optional[StageMetrics] = None, **fields):
+    """Store stage outputs and metrics on ``checkpoint`` (if there is one), extend its claim and commit.
+
+    :raises ClaimLostError: If ``owner`` no longer holds the job; nothing is written.
     """
-    logger.info("Starting cron job...")
-    db = SessionLocal()
+    if checkpoint is None:
+        return
+    if stage is not None:
+        add_pipeline_stage_event(db, checkpoint.run_id, checkpoint.sector, stage, checkpoint.id)
+    if not save_pipeline_trend_progress(db, checkpoint.id, owner, fields, settings.QUEUE_VISIBILITY_TIMEOUT):
+        db.rollback()
+        raise ClaimLostError(f"Claim on trend job {checkpoint.id} was lost to another worker")
+    db.commit()
 
+def _record_stage(run_id: Optional[int], sector: str, stage: StageMetrics):
+    """Store the metrics of a stage that is not specific to one trend."""
+    if run_id is None:
+        return
+    db = SessionLocal()
     try:
-        # Get enabled sectors
-        enabled_sectors = get_enabled_sectors()
-        
-        # Create rotation manager with database
-        manager = SectorRotationManager(db=db)
-        manager.initialize_sectors(enabled_sectors)
+        add_pipeline_stage_event(db, run_id, sector, stage)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"Could not record {stage.stage} metrics for run {run_id}: {e}")
+    finally:
+        db.close()
 
-        # Get current sector in rotation
-        sector = manager.get_next_sectors()
+def _record_failure(trend: str, checkpoint_id: Optional[int], owner: Optional[str], error: Exception, stage: Optional[StageMetrics] = None):
+    """Log a failed trend, record the failed stage and release (or dead-letter) its checkpoint.
 
-        # Get tags
-        tags = get_sector_tags(sector)
+    The checkpoint is only released while ``owner`` (the claim holder when
+    the work started) still holds it.
+    """
+    logger.error(f"Error on trend '{trend}': {error}, skipping...")
+    if checkpoint_id is None:
+        return
+    db = SessionLocal()
+    try:
+        checkpoint = db.get(PipelineTrend, checkpoint_id)
+        if checkpoint is not None:
+            if stage is not None:
+                stage.fail(error)
+                add_pipeline_stage_event(db, checkpoint.run_id, checkpoint.sector, stage, checkpoint.id)
+            attempts = checkpoint.attempts
+            status = fail_pipeline_trend(db, checkpoint_id, owner, str(error), settings.QUEUE_MAX_ATTEMPTS, settings.QUEUE_RETRY_DELAY)
+            if status is None:
+                logger.warning(f"[{trend[:40]}] Claim was lost to another worker, leaving the job to it")
+            elif status == "dead":
+                logger.error(f"[{trend[:40]}] Giving up after {attempts} attempt(s), job dead-lettered")
+    except Exception as checkpoint_error:
+        db.rollback()
+        logger.error(f"[{trend[:40]}] Could not record error on checkpoint: {checkpoint_error}")
+    finally:
+        db.close()
 
-        logger.info(f"Current sector: {sector}")
+def research_trend(trend: str, sector: str, checkpoint_id: Optional[int] = None) -> Optional[dict]:
+    """Run the article search and summarize stages for a single trend.
 
-        # Find trending topics
-        trending_topics = perplexity_search_trends(sector, tags, count=3)
+    Opens (and closes) its own database session so that it can safely run
+    on a worker thread alongside other trends. With a checkpoint, stages
+    whose output is already stored are skipped and every newly completed
+    stage is saved before the next one starts.
 
-        if not trending_topics or len(trending_topics) < 2:
-            logger.warning(f"Not enough valid AI-related topics found for {sector} ({len(trending_topics) if trending_topics else 0}/3)")
-            logger.warning("Skipping to next sector. Sector already advanced in rotation.")
-            return
+    :param trend: Trending topic title.
+    :param sector: Sector the trend was discovered in.
+    :param checkpoint_id: Id of the trend's :class:`PipelineTrend` checkpoint.
+    :returns: Research state for :func:`persist_trend` (``article_id`` is set
+        if the trend was already persisted), or ``None`` if the trend failed.
+    """
+    db = SessionLocal()
+    checkpoint = db.get(PipelineTrend, checkpoint_id) if checkpoint_id is not None else None
+    # Holder of the claim when we started; the final write only succeeds if it still holds it
+    owner = checkpoint.locked_by if checkpoint is not None else None
+    research = {"trend": trend, "sector": sector, "checkpoint_id": checkpoint_id, "owner": owner, "article_id": None, "impact_score": None,
+                "run_id": checkpoint.run_id if checkpoint is not None else None}
+    stage = None
+    try:
+        if checkpoint is not None and checkpoint.status == "done":
+            logger.info(f"[{trend[:40]}] Already persisted as article {checkpoint.article_id}, skipping")
+            research["article_id"] = checkpoint.article_id
+            return research
 
-        for trend in trending_topics:
-            try:
+        if checkpoint is not None and checkpoint.found_articles is not None:
+            articles = checkpoint.found_articles
+            logger.info(f"[{trend[:40]}] Resuming with {len(articles)} checkpointed sources")
+        else:
+            with StageMetrics("article_find") as stage:
                 articles = perplexity_find_articles(trend, count=20)
-                
-                # Remove blacklisted entirely
-                valid_articles = [a for a in articles if not a.get("blacklisted", False)]
+            _save_checkpoint(db, checkpoint, owner, stage, status="found", found_articles=articles)
+
+        # Remove blacklisted entirely
+        valid_articles = [a for a in articles if not a.get("blacklisted", False)]
+
+        # Filter to trusted (higher trust weight first) and uncertain
+        trusted_articles = sorted((a for a in valid_articles if a.get("trusted", False)), key=lambda a: -a.get("trust_weight", 1.0))
+        uncertain_articles = [a for a in valid_articles if not a.get("trusted", False)]
 
-                # Filter to trusted and uncertain
-                trusted_articles = [a for a in valid_articles if a.get("trusted", False)]
-                uncertain_articles = [a for a in valid_articles if not a.get("trusted", False)]
+        # Track how many sources we're providing
+        research["sources_provided_count"] = len(trusted_articles) + len(uncertain_articles)
 
-                # Track how many sources we're providing
-                sources_provided_count = len(trusted_articles) + len(uncertain_articles)
+        # Log source distribution
+        logger.info(f"[{trend[:40]}] Sources found: {len(trusted_articles)} trusted, {len(uncertain_articles)} uncertain (total: {research['sources_provided_count']})")
 
-                # Log source distribution
-                logger.info(f"Sources found: {len(trusted_articles)} trusted, {len(uncertain_articles)} uncertain (total: {sources_provided_count})")
+        if checkpoint is not None and checkpoint.summary is not None:
+            research["result"] = checkpoint.summary
+            logger.info(f"[{trend[:40]}] Resuming with checkpointed summary")
+        else:
+            query = f"Write an article summarizing and explaining {trend}"
+            logger.info(f"Searching for: {query}")
 
-                query = f"Write an article summarizing and explaining {trend}"
-                logger.info(f"Searching for: {query}")
+            with StageMetrics("summarize") as stage:
+                research["result"] = perplexity_summarize(query, trusted_articles, uncertain_articles)
+            _save_checkpoint(db, checkpoint, owner, stage, status="summarized", summary=research["result"])
 
-                result = perplexity_summarize(query, trusted_articles, uncertain_articles)
-                
-                impact_score = perplexity_impact_score(
+        if checkpoint is not None:
+            research["impact_score"] = checkpoint.impact_score
+        return research
+
+    except Exception as e:
+        db.rollback()
+        _record_failure(trend, checkpoint_id, owner, e, stage)
+        return None
+    finally:
+        db.close()
+
+def persist_trend(research: dict, deduper: Optional[TrendDeduplicator] = None) -> Optional[int]:
+    """Filter and renumber citations and persist a researched, scored trend.
+
+    :param research: State returned by :func:`research_trend` with ``impact_score`` set
+        (and the scoring stage's metrics in ``score_stage``, if it was scored on its own).
+    :param deduper: Near-duplicate index to register the new article with.
+    :returns: The id of the created article, or ``None`` if the trend failed.
+    """
+    trend, sector, result = research["trend"], research["sector"], research["result"]
+    impact_score = research["impact_score"]
+    db = SessionLocal()
+    checkpoint = db.get(PipelineTrend, research["checkpoint_id"]) if research["checkpoint_id"] is not None else None
+    stage = None
+    try:
+        if checkpoint is not None and checkpoint.impact_score is None:
+            _save_checkpoint(db, checkpoint, research["owner"], research.get("score_stage"), status="scored", impact_score=impact_score)
+
+        with StageMetrics("persist") as stage:
+            # Filter unused sources AND renumber citations
+            renumbered_article, filtered_sources_list, filter_stats = filter_and_renumber_sources(
+                article_text=result['article'],
+                sources=result['sources'],
+                sources_provided_count=research["sources_provided_count"]
+            )
+
+            # Log filtering results
+            logger.info(f"[{trend[:40]}] Citations: {filter_stats['cited_numbers_original']} -> {list(range(1, len(filter_stats['cited_numbers_original']) + 1))}")
+
+            if filter_stats['citation_mapping'] != {i: i for i in filter_stats['cited_numbers_original']}:
+                logger.info(f"[{trend[:40]}] Renumbered citations: {filter_stats['citation_mapping']}")
+
+            # Check if Perplexity added extra sources
+            if filter_stats['extra_sources_added']:
+                logger.warning(f"[{trend[:40]}] Perplexity added {filter_stats['extra_sources_count']} extra source(s)!")
+                logger.warning(f"[{trend[:40]}] Provided {filter_stats['total_sources_provided']}, returned {filter_stats['total_sources_returned']}")
+
+            logger.info(f"[{trend[:40]}] Source usage: {filter_stats['sources_filtered']}/{filter_stats['total_sources_returned']} (removed {filter_stats['sources_removed']} unused)")
+
+            if filter_stats['sources_removed'] > 0 and filter_stats['unused_numbers']:
+                logger.info(f"[{trend[:40]}] Removed sources at positions: {filter_stats['unused_numbers']}")
+
+            # Keyword match on title, tags and text; the run's sector stays primary
+            sectors = classify_article(trend, renumbered_article, result['tags'], primary=sector)
+            if sectors.secondary:
+                logger.info(f"[{trend[:40]}] Secondary sectors: {', '.join(sectors.secondary)}")
+
+            # Build final sources list for database (only cited sources, in citation order)
+            sources = []
+            for source in filtered_sources_list:
+                source_name = source.get("title")
+                source_url = source["url"]
+
+                sources.append({
+                    "title": source_name,
+                    "url": source_url,
+                    "domain": extract_domain(source_url),
+                    "sector": classify_source(source_name, sector)
+                })
+
+            # Create article with renumbered citations and filtered sources; the
+            # checkpoint is marked done in the same transaction
+            article = create_article_with_sources_and_tags(
+                db=db,
+                title=trend,
+                content=renumbered_article,
+                sources=sources,
+                tags=result['tags'],
+                impact_score=impact_score,
+                sector=sector,
+                secondary_sectors=sectors.secondary,
+                commit=checkpoint is None
+            )
+        stage.sources_provided = research["sources_provided_count"]
+        stage.sources_cited = filter_stats['sources_filtered']
+        stage.sources_removed = filter_stats['sources_removed']
+
+        if checkpoint is not None:
+            add_pipeline_stage_event(db, checkpoint.run_id, sector, stage, checkpoint.id)
+            if not complete_pipeline_trend(db, checkpoint.id, article.id, research["owner"]):
+                db.rollback()
+                logger.warning(f"[{trend[:40]}] Claim was lost to another worker, discarding this result")
+                return None
+            db.commit()
+
+        logger.info(f"Article ID {article.id}: Impact {impact_score}/10, Sources: {len(sources)}")
+        if deduper is not None:
+            deduper.add(article.id, trend, result['tags'])
+            deduper.discard(trend)
+        return article.id
+
+    except Exception as e:
+        db.rollback()
+        _record_failure(trend, research["checkpoint_id"], research["owner"], e, stage)
+        return None
+    finally:
+        db.close()
+
+def process_trend(trend: str, sector: str, deduper: Optional[TrendDeduplicator] = None, checkpoint_id: Optional[int] = None) -> Optional[int]:
+    """Find sources for, summarize, score and persist a single trend.
+
+    Scores the trend on its own; :func:`process_trends` batches scoring
+    across trends instead.
+
+    :param trend: Trending topic title.
+    :param sector: Sector the trend was discovered in.
+    :param deduper: Near-duplicate index to register the new article with.
+    :param checkpoint_id: Id of the trend's :class:`PipelineTrend` checkpoint.
+    :returns: The id of the created article, or ``None`` if the trend failed.
+    """
+    research = research_trend(trend, sector, checkpoint_id)
+    if research is None or research["article_id"] is not None:
+        if research is None and deduper is not None:
+            deduper.discard(trend)
+        return research["article_id"] if research else None
+
+    if research["impact_score"] is None:
+        research["score_stage"] = stage = StageMetrics("impact_score")
+        try:
+            with stage:
+                research["impact_score"] = perplexity_impact_score(
                     article_title=trend,
-                    article_content=result['article'],
+                    article_content=research["result"]['article'],
                     sector=sector
                 )
-                
-                # Filter unused sources AND renumber citations
-                renumbered_article, filtered_sources_list, filter_stats = filter_and_renumber_sources(
-                    article_text=result['article'],
-                    sources=result['sources'],
-                    sources_provided_count=sources_provided_count
-                )
-                
-                # Log filtering results
-                logger.info(f"Citations: {filter_stats['cited_numbers_original']} -> {list(range(1, len(filter_stats['cited_numbers_original']) + 1))}")
-                
-                if filter_stats['citation_mapping'] != {i: i for i in filter_stats['cited_numbers_original']}:
-                    logger.info(f"Renumbered citations: {filter_stats['citation_mapping']}")
-                
-                # Check if Perplexity added extra sources
-                if filter_stats['extra_sources_added']:
-                    logger.warning(f"Perplexity added {filter_stats['extra_sources_count']} extra source(s)!")
-                    logger.warning(f"Provided {filter_stats['total_sources_provided']}, returned {filter_stats['total_sources_returned']}")
-                
-                logger.info(f"Source usage: {filter_stats['sources_filtered']}/{filter_stats['total_sources_returned']} (removed {filter_stats['sources_removed']} unused)")
-                
-                if filter_stats['sources_removed'] > 0 and filter_stats['unused_numbers']:
-                    logger.info(f"Removed sources at positions: {filter_stats['unused_numbers']}")
-                
-                # Build final sources list for database (only cited sources, in citation order)
-                sources = []
-                for source in filtered_sources_list:
-                    source_name = source.get("title") 
-                    source_url = source["url"]
-                    
-                    sources.append({
-                        "title": source_name,
-                        "url": source_url,
-                        "domain": extract_domain(source_url),
-                        "sector": sector
-                    })
-                
-                # Create article with renumbered citations and filtered sources
-                article = create_article_with_sources_and_tags(
-                    db=db,
-                    title=trend,
-                    content=renumbered_article,
-                    sources=sources,
-                    tags=result['tags'],
-                    impact_score=impact_score,
+        except Exception as e:
+            _record_failure(trend, checkpoint_id, research["owner"], e, stage)
+            if deduper is not None:
+                deduper.discard(trend)
+            return None
+
+    article_id = persist_trend(research, deduper)
+    if article_id is None and deduper is not None:
+        deduper.discard(trend)
+    return article_id
+
+def process_trends(trends: list[str], sector: str, max_workers: Optional[int] = None, deduper: Optional[TrendDeduplicator] = None, checkpoint_ids: Optional[list[int]] = None) -> list[int]:
+    """Process every trend of a sector in three phases.
+
+    1. Article search and summarization run concurrently on a thread pool.
+    2. All summaries without a checkpointed score are scored together with
+       :func:`perplexity_impact_score_batch` (one request per batch, and
+       one call per run when resuming trends of several runs).
+    3. Articles are persisted concurrently.
+
+    :param trends: Trending topic titles to process.
+    :param sector: Sector the trends were discovered in.
+    :param max_workers: Worker count (defaults to ``settings.INGEST_WORKERS``).
+    :param deduper: Near-duplicate index passed on to :func:`persist_trend`; trends that fail are discarded from it.
+    :param checkpoint_ids: Checkpoint id for each trend (same order), if checkpointing.
+    :returns: Ids of the articles that were created successfully.
+    """
+    if not trends:
+        return []
+
+    checkpoint_ids = checkpoint_ids or [None] * len(trends)
+    workers = max(1, min(max_workers or settings.INGEST_WORKERS, len(trends)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="trend") as pool:
+        researched = [r for r in pool.map(lambda item: research_trend(item[0], sector, item[1]), zip(trends, checkpoint_ids)) if r is not None]
+
+        article_ids = [r["article_id"] for r in researched if r["article_id"] is not None]
+        pending = [r for r in researched if r["article_id"] is None]
+
+        to_score: dict[Optional[int], list[dict]] = {}
+        for research in pending:
+            if research["impact_score"] is None:
+                to_score.setdefault(research["run_id"], []).append(research)
+        for run_id, batch in to_score.items():
+            with StageMetrics("impact_score_batch") as stage:
+                scores = perplexity_impact_score_batch(
+                    [{"title": r["trend"], "content": r["result"]['article']} for r in batch],
                     sector=sector
                 )
+            _record_stage(run_id, sector, stage)
+            for research, score in zip(batch, scores):
+                research["impact_score"] = score
+
+        scored = []
+        for research in pending:
+            if research["impact_score"] is None:
+                _record_failure(research["trend"], research["checkpoint_id"], research["owner"], RuntimeError("Impact scoring failed"))
+            else:
+                scored.append(research)
+
+        persisted = list(pool.map(lambda research: persist_trend(research, deduper), scored))
+        article_ids += [article_id for article_id in persisted if article_id is not None]
+
+    if deduper is not None:
+        # Release failed trends so a later run can pick them up again
+        succeeded = {r["trend"] for r in researched if r["article_id"] is not None}
+        succeeded |= {research["trend"] for research, article_id in zip(scored, persisted) if article_id is not None}
+        for trend in set(trends) - succeeded:
+            deduper.discard(trend)
+    return article_ids
+
+def process_sector(sector: str, deduper: Optional[TrendDeduplicator] = None, run_id: Optional[int] = None, discover_only: bool = False) -> list[int]:
+    """Discover trending topics for ``sector`` and process them.
+
+    :param sector: Sector name claimed from the rotation.
+    :param deduper: Near-duplicate index; matching trends are skipped before any API call.
+    :param run_id: Run to checkpoint the sector's trends under.
+    :param discover_only: Only enqueue the trends for workers (requires ``run_id``).
+    :returns: Ids of the articles created for the sector.
+    """
+    # Get tags
+    tags = get_sector_tags(sector)
+
+    logger.info(f"Current sector: {sector}")
+
+    stage = StageMetrics("trend_search")
+    try:
+        # Find trending topics
+        with stage:
+            trending_topics = perplexity_search_trends(sector, tags, count=3)
+        if not trending_topics or len(trending_topics) < 2:
+            stage.skip()
+    except Exception as e:
+        logger.error(f"Trend search failed for {sector}: {e}, skipping...")
+        return []
+    finally:
+        _record_stage(run_id, sector, stage)
+
+    if stage.outcome == "skipped":
+        logger.warning(f"Not enough valid AI-related topics found for {sector} ({len(trending_topics) if trending_topics else 0}/3)")
+        logger.warning("Skipping to next sector. Sector already advanced in rotation.")
+        return []
+
+    if deduper is not None:
+        trending_topics, skipped = deduper.filter_trends(trending_topics)
+        for trend, matched_title, score in skipped:
+            logger.info(f"[{trend[:40]}] Skipping near-duplicate of '{matched_title}' (similarity {score})")
+
+    checkpoint_ids = None
+    if run_id is not None and trending_topics:
+        db = SessionLocal()
+        try:
+            checkpoints = create_pipeline_trends(
+                db, run_id, sector, trending_topics,
+                locked_by=None if discover_only else WORKER_ID,
+                visibility_timeout=settings.QUEUE_VISIBILITY_TIMEOUT,
+            )
+            checkpoint_ids = [checkpoint.id for checkpoint in checkpoints]
+        except Exception as e:
+            db.rollback()
+            if discover_only:
+                logger.error(f"Could not enqueue trends for {sector}: {e}")
+                return []
+            logger.warning(f"Could not checkpoint trends for {sector}: {e}, continuing without checkpoints")
+        finally:
+            db.close()
+
+    if discover_only:
+        logger.info(f"Queued {len(checkpoint_ids or [])} trend(s) for {sector}")
+        return []
+
+    article_ids = process_trends(trending_topics, sector, deduper=deduper, checkpoint_ids=checkpoint_ids)
+    logger.info(f"Created {len(article_ids)}/{len(trending_topics)} articles for {sector}")
+    return article_ids
+
+def resume_runs() -> list[int]:
+    """Finish the trends that earlier runs left unfinished.
+
+    Every open job that no live worker holds is claimed (including failed
+    jobs still waiting out their retry delay), so resuming is safe while
+    workers or other runs are active. Stage outputs already checkpointed
+    are reused, so only the missing upstream calls are made. Runs with no
+    open trends left are marked ``completed``.
+
+    :returns: Ids of the articles created while resuming.
+    """
+    logger.info("Resuming unfinished ingest runs...")
+    db = SessionLocal()
+
+    try:
+        checkpoints = claim_pipeline_trends(
+            db, WORKER_ID, limit=None,
+            visibility_timeout=settings.QUEUE_VISIBILITY_TIMEOUT,
+            max_attempts=settings.QUEUE_MAX_ATTEMPTS,
+            include_delayed=True,
+        )
+        if not checkpoints:
+            logger.info("Nothing to resume.")
+            return []
 
-                logger.info(f"Article ID {article.id}: Impact {impact_score}/10, Sources: {len(sources)}")
-            
-            except Exception as e:
-                logger.error(f"Error on trend '{trend}': {e}, skipping...")
-                continue
+        by_sector: dict[str, list[tuple[str, int]]] = {}
+        for checkpoint in checkpoints:
+            by_sector.setdefault(checkpoint.sector, []).append((checkpoint.trend, checkpoint.id))
+        run_ids = sorted({checkpoint.run_id for checkpoint in checkpoints})
+        logger.info(f"Resuming {len(checkpoints)} trend(s) from {len(run_ids)} run(s)")
+
+        deduper = TrendDeduplicator.from_db(db)
+        article_ids = []
+        for sector, items in by_sector.items():
+            article_ids += process_trends([trend for trend, _ in items], sector, deduper=deduper, checkpoint_ids=[checkpoint_id for _, checkpoint_id in items])
+
+        for run_id in run_ids:
+            finish_pipeline_run(db, run_id)
+
+        logger.info(f"Resume finished: {len(article_ids)}/{len(checkpoints)} trend(s) persisted")
+        return article_ids
+
+    finally:
+        db.close()
+
+def main(sectors_per_run: Optional[int] = None, resume: bool = False, discover_only: bool = False) -> list[int]:
+    """Main entrypoint for the cron job flow.
+
+    Orchestrates sector rotation, topic discovery, article search, summary
+    generation and persistence. Intended for use by a scheduler.
+
+    :param sectors_per_run: Number of sectors to claim this run (defaults to
+        ``settings.SECTORS_PER_RUN``; ``0`` claims every enabled sector).
+    :param resume: Only finish the trends earlier runs left unfinished (see :func:`resume_runs`).
+    :param discover_only: Only discover and enqueue trends for :mod:`backend.util_scripts.worker`.
+    :returns: Ids of the articles created by the run.
+    """
+    if resume:
+        return resume_runs()
+
+    logger.info("Starting cron job...")
+    db = SessionLocal()
+    run_id = None
+
+    try:
+        # Get enabled sectors
+        enabled_sectors = get_enabled_sectors()
         
+        # Create rotation manager with database
+        manager = SectorRotationManager(db=db)
+        manager.initialize_sectors(enabled_sectors)
+
+        if sectors_per_run is None:
+            sectors_per_run = settings.SECTORS_PER_RUN
+
+        count = sectors_per_run or len(enabled_sectors)
+        if settings.SECTOR_SCHEDULER == "yield":
+            # Best recent yield first; the claim is held until the run row is committed
+            sectors = manager.claim_sectors_by_yield(enabled_sectors, count, settings.SECTOR_YIELD_LOOKBACK_DAYS, settings.SECTOR_REVISIT_SECONDS)
+        else:
+            # Claim the next sector(s) in rotation under a row lock
+            sectors = manager.claim_sectors(count=count)
+        if not sectors:
+            logger.warning("No sectors configured, nothing to do.")
+            return []
+
+        logger.info(f"Claimed {len(sectors)} sector(s): {', '.join(sectors)}")
+        run_id = create_pipeline_run(db, sectors).id
+
+        # Index recent articles so near-duplicate trends can be skipped
+        deduper = TrendDeduplicator.from_db(db)
+
+        workers = max(1, min(settings.SECTOR_WORKERS, len(sectors)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sector") as pool:
+            results = list(pool.map(lambda sector: process_sector(sector, deduper, run_id, discover_only), sectors))
+
+        run = finish_pipeline_run(db, run_id)
+        if discover_only:
+            logger.info(f"Run {run_id} queued its trends for the workers")
+        elif run is not None and run.status != "completed":
+            logger.warning(f"Run {run_id} is {run.status}; finish it later with --resume")
+
+        article_ids = [article_id for ids in results for article_id in ids]
+        logger.info(f"Cron job finished: {len(article_ids)} articles across {len(sectors)} sector(s), {deduper.skipped_count} near-duplicate trend(s) skipped")
+        return article_ids
+
     except Exception as e:
         logger.error(f"Cron job failed: {e}")
+        if run_id is not None:
+            db.rollback()
+            finish_pipeline_run(db, run_id, failed=True)
         raise
+    finally:
+        db.close()
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Run one ingest cycle.")
+    parser.add_argument("--sectors", type=int, default=None, help="Sectors to claim this run (0 = full rotation).")
+    parser.add_argument("--resume", action="store_true", help="Finish trends left unfinished by earlier runs instead of claiming new sectors.")
+    parser.add_argument("--discover-only", action="store_true", help="Only discover trends and enqueue them for backend.util_scripts.worker.")
+    args = parser.parse_args()
+    main(sectors_per_run=args.sectors, resume=args.resume, discover_only=args.discover_only)
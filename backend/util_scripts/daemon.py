@@ -0,0 +1,246 @@
+"""Long-running ingest daemon with an in-process scheduler.
+
+Runs :func:`backend.util_scripts.cronjob.main` on a fixed cadence
+(``settings.DAEMON_INTERVAL_SECONDS`` plus up to
+``settings.DAEMON_JITTER_SECONDS`` of random delay) inside one process, so
+settings, the database engine and connection pool, and the pooled HTTP
+clients are created once and stay warm between runs::
+
+    python -m backend.util_scripts.daemon
+    python -m backend.util_scripts.daemon --interval 3600 --sectors 2
+
+On start-up, trends left unfinished by earlier runs are resumed first.
+A small HTTP endpoint on ``settings.DAEMON_HEALTH_PORT`` serves
+``/health`` (JSON) and ``/metrics`` (Prometheus text format). SIGTERM or
+SIGINT stops the scheduler after the current run finishes; a second
+signal exits immediately.
+"""
+
+import argparse
+import json
+import logging
+import random
+import signal
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from backend.config import settings
+from backend.db.database import engine
+from backend.services.http_client import close_clients
+from backend.util_scripts import cronjob
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class DaemonMetrics:
+    """Thread-safe counters describing the daemon's runs."""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.runs_total = 0
+        self.run_failures_total = 0
+        self.articles_total = 0
+        self.running = False
+        self.last_run_seconds: Optional[float] = None
+        self.last_success_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.next_run_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def run_started(self):
+        """Record that a run began."""
+        with self._lock:
+            self.running = True
+            self.next_run_at = None
+
+    def run_finished(self, seconds: float, articles: int = 0, error: Optional[str] = None):
+        """Record the outcome of a run.
+
+        :param seconds: Wall time of the run.
+        :param articles: Articles the run created.
+        :param error: Error message if the run failed.
+        """
+        with self._lock:
+            self.running = False
+            self.runs_total += 1
+            self.last_run_seconds = seconds
+            self.articles_total += articles
+            if error is None:
+                self.last_success_at = time.time()
+            else:
+                self.run_failures_total += 1
+            self.last_error = error
+
+    def snapshot(self) -> dict:
+        """Return a consistent copy of the counters."""
+        with self._lock:
+            return {
+                "uptime_seconds": round(time.time() - self.started_at, 1),
+                "running": self.running,
+                "runs_total": self.runs_total,
+                "run_failures_total": self.run_failures_total,
+                "articles_total": self.articles_total,
+                "last_run_seconds": self.last_run_seconds,
+                "last_success_at": self.last_success_at,
+                "last_error": self.last_error,
+                "next_run_at": self.next_run_at,
+            }
+
+    def prometheus(self) -> str:
+        """Render the counters in the Prometheus text exposition format."""
+        snap = self.snapshot()
+        lines = [
+            "# TYPE ingest_up gauge",
+            "ingest_up 1",
+            "# TYPE ingest_run_in_progress gauge",
+            f"ingest_run_in_progress {int(snap['running'])}",
+            "# TYPE ingest_runs_total counter",
+            f"ingest_runs_total {snap['runs_total']}",
+            "# TYPE ingest_run_failures_total counter",
+            f"ingest_run_failures_total {snap['run_failures_total']}",
+            "# TYPE ingest_articles_total counter",
+            f"ingest_articles_total {snap['articles_total']}",
+        ]
+        if snap["last_run_seconds"] is not None:
+            lines += ["# TYPE ingest_last_run_duration_seconds gauge", f"ingest_last_run_duration_seconds {snap['last_run_seconds']:.3f}"]
+        if snap["last_success_at"] is not None:
+            lines += ["# TYPE ingest_last_success_timestamp_seconds gauge", f"ingest_last_success_timestamp_seconds {snap['last_success_at']:.0f}"]
+        return "\n".join(lines) + "\n"
+
+class IngestDaemon:
+    """Scheduler loop that runs the ingest job on a cadence with jitter."""
+
+    def __init__(self, interval: float, jitter: float, sectors_per_run: Optional[int] = None, resume_on_start: bool = True):
+        """Configure the daemon.
+
+        :param interval: Seconds between the start of consecutive runs.
+        :param jitter: Maximum random delay (seconds) added to each interval.
+        :param sectors_per_run: Sectors claimed per run (defaults to ``settings.SECTORS_PER_RUN``).
+        :param resume_on_start: Finish trends left over by earlier runs before the first run.
+        """
+        self.interval = interval
+        self.jitter = jitter
+        self.sectors_per_run = sectors_per_run
+        self.resume_on_start = resume_on_start
+        self.metrics = DaemonMetrics()
+        self.stop_event = threading.Event()
+
+    def next_delay(self, elapsed: float) -> float:
+        """Return the seconds to wait after a run that took ``elapsed`` seconds."""
+        return max(0.0, self.interval - elapsed) + random.uniform(0, self.jitter)
+
+    def run_once(self):
+        """Execute one ingest run and record its outcome (never raises)."""
+        self.metrics.run_started()
+        start = time.perf_counter()
+        try:
+            article_ids = cronjob.main(sectors_per_run=self.sectors_per_run)
+        except Exception as e:
+            logger.error(f"Ingest run failed: {e}")
+            self.metrics.run_finished(time.perf_counter() - start, error=str(e))
+            return
+        elapsed = time.perf_counter() - start
+        self.metrics.run_finished(elapsed, articles=len(article_ids))
+        logger.info(f"Ingest run took {elapsed:.1f}s")
+
+    def serve_forever(self):
+        """Run until :meth:`stop` is called, sleeping between runs."""
+        if self.resume_on_start and not self.stop_event.is_set():
+            try:
+                cronjob.resume_runs()
+            except Exception as e:
+                logger.error(f"Resuming unfinished runs failed: {e}")
+
+        while not self.stop_event.is_set():
+            start = time.monotonic()
+            self.run_once()
+            if self.stop_event.is_set():
+                break
+            delay = self.next_delay(time.monotonic() - start)
+            self.metrics.next_run_at = time.time() + delay
+            logger.info(f"Next ingest run in {delay / 60:.1f} min")
+            self.stop_event.wait(delay)
+
+        logger.info("Scheduler stopped")
+
+    def stop(self):
+        """Ask the scheduler to exit once the current run (if any) finishes."""
+        self.stop_event.set()
+
+def make_health_server(metrics: DaemonMetrics, stop_event: threading.Event, port: int, host: str = "0.0.0.0") -> ThreadingHTTPServer:
+    """Create the HTTP server exposing ``/health`` and ``/metrics``.
+
+    ``/health`` answers 503 once shutdown has begun so orchestrators stop
+    routing to (or restarting) a draining daemon.
+
+    :param metrics: Counters to expose.
+    :param stop_event: Set when the daemon is shutting down.
+    :param port: Port to bind (``0`` picks a free one).
+    :param host: Interface to bind.
+    :returns: The bound (not yet serving) server.
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/health":
+                status = 503 if stop_event.is_set() else 200
+                body = json.dumps({"status": "stopping" if stop_event.is_set() else "ok", **metrics.snapshot()}).encode()
+                content_type = "application/json"
+            elif self.path == "/metrics":
+                status, body, content_type = 200, metrics.prometheus().encode(), "text/plain; version=0.0.4"
+            else:
+                status, body, content_type = 404, b"not found\n", "text/plain"
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug(format % args)
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+def main() -> None:
+    """Parse options and run the daemon until it is signalled to stop."""
+    parser = argparse.ArgumentParser(description="Run the ingest job on a schedule in a long-lived process.")
+    parser.add_argument("--interval", type=float, default=settings.DAEMON_INTERVAL_SECONDS, help="Seconds between runs.")
+    parser.add_argument("--jitter", type=float, default=settings.DAEMON_JITTER_SECONDS, help="Maximum random extra delay per interval.")
+    parser.add_argument("--sectors", type=int, default=None, help="Sectors to claim per run (0 = full rotation).")
+    parser.add_argument("--port", type=int, default=settings.DAEMON_HEALTH_PORT, help="Health/metrics port (0 disables).")
+    parser.add_argument("--host", default="0.0.0.0", help="Health/metrics bind address.")
+    parser.add_argument("--no-resume", action="store_true", help="Do not resume unfinished runs on start-up.")
+    args = parser.parse_args()
+
+    daemon = IngestDaemon(args.interval, args.jitter, sectors_per_run=args.sectors, resume_on_start=not args.no_resume)
+
+    def handle_signal(signum, _frame):
+        if daemon.stop_event.is_set():
+            logger.warning("Second signal received, exiting immediately")
+            raise SystemExit(1)
+        logger.info(f"Received {signal.Signals(signum).name}, stopping after the current run...")
+        daemon.stop()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    server = None
+    if args.port:
+        server = make_health_server(daemon.metrics, daemon.stop_event, args.port, args.host)
+        threading.Thread(target=server.serve_forever, name="health", daemon=True).start()
+        logger.info(f"Health and metrics on http://{args.host}:{server.server_address[1]}/health and /metrics")
+
+    logger.info(f"Ingest daemon started: every {args.interval:g}s (+ up to {args.jitter:g}s jitter)")
+    try:
+        daemon.serve_forever()
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+        close_clients()
+        engine.dispose()
+        logger.info("Ingest daemon stopped")
+
+if __name__ == "__main__":
+    main()
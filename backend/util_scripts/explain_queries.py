@@ -0,0 +1,262 @@
+"""Check that the API's queries are served by indexes.
+
+Runs the data access behind each API endpoint (and the reverse lookups
+by tag, source, domain and sector), captures every ``SELECT`` it issues
+and asks the database for its plan:
+
+- PostgreSQL: ``EXPLAIN (FORMAT JSON)`` with ``enable_seqscan`` off, so a
+  sequential scan in the plan means no usable index exists.
+- SQLite: ``EXPLAIN QUERY PLAN``. A ``SCAN <table>`` without an index or
+  a temporary B-tree for ``ORDER BY`` is a miss.
+
+A check fails when a plan scans a table that the check does not
+explicitly allow (e.g. the unanchored ``ILIKE`` of the article search)::
+
+    python -m backend.util_scripts.explain_queries                      # throwaway seeded SQLite
+    python -m backend.util_scripts.explain_queries --database-url postgresql+psycopg://... --verbose
+
+The exit status is 1 if any check fails, so it can run in CI after
+``alembic upgrade head``.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+SQLITE_FULL_SCAN = re.compile(r"^SCAN (\w+)(?: AS \w+)?$")
+
+class Check(NamedTuple):
+    """One query path to explain.
+
+    :ivar name: Short name used in the report.
+    :ivar run: Runs the queries given a session and ids of existing rows.
+    :ivar allowed_scans: Tables the path may scan in full, with the reason.
+    """
+    name: str
+    run: Callable
+    allowed_scans: dict[str, str] = {}
+
+def _list_articles(db, ids: dict):
+    from backend.db.crud import get_all_articles
+    from backend.db.schemas import ArticleListSchema
+
+    articles, _ = get_all_articles(db, limit=20, offset=0)
+    # Serializing loads each article's tags, as the endpoint does
+    [ArticleListSchema.model_validate(article) for article in articles]
+
+def _search_articles(db, ids: dict):
+    from backend.db.crud import get_all_articles
+    from backend.db.schemas import ArticleListSchema
+
+    articles, _ = get_all_articles(db, search="ai", limit=20, offset=0)
+    [ArticleListSchema.model_validate(article) for article in articles]
+
+def _article_detail(db, ids: dict):
+    from backend.db.crud import get_article_by_id
+    from backend.db.schemas import ArticleSchema
+
+    ArticleSchema.model_validate(get_article_by_id(db, ids["article"]))
+
+def _pipeline_runs(db, ids: dict):
+    from backend.db.crud import get_pipeline_run_summaries
+
+    get_pipeline_run_summaries(db, limit=20, offset=0)
+
+def _source_trust(db, ids: dict):
+    from backend.db.crud import list_source_trust
+
+    list_source_trust(db, limit=50, offset=0)
+
+def _articles_by_tag(db, ids: dict):
+    from sqlalchemy import select
+    from backend.db import models
+
+    db.execute(select(models.article_tags.c.article_id).where(models.article_tags.c.tag_id == ids["tag"])).all()
+
+def _articles_by_source(db, ids: dict):
+    from sqlalchemy import select
+    from backend.db import models
+
+    db.execute(select(models.source_articles.c.article_id).where(models.source_articles.c.source_id == ids["source"])).all()
+
+def _sources_by_domain(db, ids: dict):
+    from sqlalchemy import select
+    from backend.db import models
+
+    db.execute(select(models.Source.id).where(models.Source.domain == ids["domain"])).all()
+
+def _articles_by_sector(db, ids: dict):
+    from sqlalchemy import select
+    from backend.db import models
+
+    db.execute(
+        select(models.Article.id).where(models.Article.sector == ids["sector"]).order_by(models.Article.created_at.desc()).limit(20)
+    ).all()
+
+ROW_ORDER_SCAN = "walks the primary key in id order, bounded by LIMIT"
+SEARCH_SCAN = "unanchored ILIKE '%...%' cannot use a b-tree index"
+
+CHECKS = [
+    Check("list_articles", _list_articles),
+    Check("search_articles", _search_articles, {"articles": SEARCH_SCAN, "tags": SEARCH_SCAN}),
+    Check("article_detail", _article_detail),
+    Check("pipeline_runs", _pipeline_runs, {"pipeline_runs": ROW_ORDER_SCAN}),
+    Check("source_trust", _source_trust),
+    Check("articles_by_tag", _articles_by_tag),
+    Check("articles_by_source", _articles_by_source),
+    Check("sources_by_domain", _sources_by_domain),
+    Check("articles_by_sector", _articles_by_sector),
+]
+
+def sqlite_misses(conn, statement: str, parameters) -> tuple[list[str], list[str]]:
+    """Return ``(plan_lines, scanned_tables)`` of a statement on SQLite."""
+    plan = [row[3] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+    misses = []
+    for detail in plan:
+        match = SQLITE_FULL_SCAN.match(detail)
+        if match:
+            misses.append(match.group(1))
+        elif detail == "USE TEMP B-TREE FOR ORDER BY":
+            misses.append("ORDER BY")
+    return plan, misses
+
+def postgresql_misses(conn, statement: str, parameters) -> tuple[list[str], list[str]]:
+    """Return ``(plan_lines, scanned_tables)`` of a statement on PostgreSQL."""
+    plan_json = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+    if isinstance(plan_json, str):
+        plan_json = json.loads(plan_json)
+    lines, misses = [], []
+
+    def walk(node: dict, depth: int):
+        relation = node.get("Relation Name")
+        lines.append("  " * depth + node["Node Type"] + (f" on {relation}" if relation else "") + (f" using {node['Index Name']}" if node.get("Index Name") else ""))
+        if node["Node Type"] == "Seq Scan":
+            misses.append(relation)
+        for child in node.get("Plans", []):
+            walk(child, depth + 1)
+
+    walk(plan_json[0]["Plan"], 0)
+    return lines, misses
+
+def seed_pipeline_run():
+    """Add one finished run with a trend and a stage event, so the run report queries execute."""
+    from datetime import datetime
+    from backend.db.database import SessionLocal
+    from backend.db import models
+
+    db = SessionLocal()
+    try:
+        if db.query(models.PipelineRun.id).first() is None:
+            run = models.PipelineRun(status="completed", sectors=["Education"], finished_at=datetime.now())
+            db.add(run)
+            db.flush()
+            db.add(models.PipelineTrend(run_id=run.id, sector="Education", trend="Seed trend", status="done"))
+            db.add(models.PipelineStageEvent(run_id=run.id, sector="Education", stage="trend_search", started_at=datetime.now(), duration_ms=1.0, outcome="ok"))
+            db.commit()
+    finally:
+        db.close()
+
+def main() -> None:
+    """Parse options, explain every check and report misses."""
+    parser = argparse.ArgumentParser(description="Check that API queries use indexes.")
+    parser.add_argument("--database-url", help="Database to check (default: DATABASE_URL, or a throwaway seeded SQLite file).")
+    parser.add_argument("--seed-articles", type=int, default=None, help="Create the schema and seed this many articles first (default 200 for the throwaway database).")
+    parser.add_argument("--verbose", action="store_true", help="Print every statement and its plan.")
+    parser.add_argument("--output", help="Write results JSON to this path.")
+    args = parser.parse_args()
+
+    database_url = args.database_url or os.getenv("DATABASE_URL")
+    seed = args.seed_articles
+    if not database_url:
+        database_url = f"sqlite:///{Path(tempfile.mkdtemp(prefix='explain-')) / 'explain.db'}"
+        seed = 200 if seed is None else seed
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("PERPLEXITY_API_KEY", "explain")
+    os.environ.setdefault("OPENAI_API_KEY", "explain")
+
+    from sqlalchemy import event, select
+    from backend.db.database import SessionLocal, engine
+    from backend.db import models
+    from backend.util_scripts.bench_pipeline import seed_database
+
+    if seed:
+        seed_database(seed)
+        seed_pipeline_run()
+
+    db = SessionLocal()
+    try:
+        ids = {
+            "article": db.execute(select(models.Article.id).limit(1)).scalar(),
+            "tag": db.execute(select(models.Tag.id).limit(1)).scalar(),
+            "source": db.execute(select(models.Source.id).limit(1)).scalar(),
+            "domain": db.execute(select(models.Source.domain).limit(1)).scalar() or "example.com",
+            "sector": db.execute(select(models.Article.sector).limit(1)).scalar() or "General",
+        }
+    finally:
+        db.close()
+    if ids["article"] is None:
+        print("No articles in the database; run with --seed-articles N against a throwaway database.", file=sys.stderr)
+        sys.exit(2)
+
+    dialect = engine.dialect.name
+    if dialect not in ("postgresql", "sqlite"):
+        print(f"EXPLAIN checks are not implemented for {dialect}", file=sys.stderr)
+        sys.exit(2)
+    explain = postgresql_misses if dialect == "postgresql" else sqlite_misses
+
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and not executemany:
+            captured.append((statement, parameters))
+
+    results = []
+    failed = False
+    for check in CHECKS:
+        captured.clear()
+        db = SessionLocal()
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            check.run(db, ids)
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+            db.close()
+
+        statements = []
+        with engine.connect() as conn:
+            if dialect == "postgresql":
+                conn.exec_driver_sql("SET enable_seqscan = off")
+            for statement, parameters in captured:
+                plan, misses = explain(conn, statement, parameters)
+                unexpected = [table for table in misses if table not in check.allowed_scans]
+                statements.append({"sql": " ".join(statement.split()), "plan": plan, "full_scans": misses, "unexpected": unexpected})
+            conn.rollback()
+
+        ok = not any(entry["unexpected"] for entry in statements)
+        failed |= not ok
+        results.append({"check": check.name, "ok": ok, "statements": statements, "allowed_scans": check.allowed_scans})
+
+        print(f"{'ok  ' if ok else 'FAIL'}  {check.name:<20} {len(statements)} statement(s)")
+        for entry in statements:
+            if args.verbose or entry["unexpected"]:
+                print(f"      {entry['sql'][:160]}")
+                for line in entry["plan"]:
+                    print(f"        {line}")
+                if entry["unexpected"]:
+                    print(f"        -> no index used for: {', '.join(entry['unexpected'])}")
+        for table, reason in check.allowed_scans.items():
+            if any(table in entry["full_scans"] for entry in statements):
+                print(f"      (allowed scan of {table}: {reason})")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({"dialect": dialect, "checks": results}, indent=2))
+        print(f"Results written to {args.output}", file=sys.stderr)
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,364 @@
+"""Local stand-in for the Perplexity and OpenAI chat/completions APIs.
+
+Runs a small FastAPI app that speaks the ``/chat/completions`` request and
+response shape used by :mod:`backend.services.perplexity_service` and
+:mod:`backend.services.openai_service` (including ``search_results``,
+``usage`` and SSE streaming), so the ingest pipeline and chat endpoint can
+run without keys or network access and our own code can be measured in
+isolation.
+
+Responses come from, in order of preference:
+
+1. recorded fixtures (``--fixtures``, JSONL lines of ``{"request": ..., "response": ...}``),
+2. a response cache captured from a live run (``--replay-cache``, the ``LLM_CACHE_DIR`` of that run),
+3. canned responses generated from the prompt, deterministic per request and ``--seed``.
+
+Latency is drawn from a configurable distribution and a fraction of
+requests can fail with configurable status codes (429s carry ``Retry-After``).
+
+Usage (from the project root)::
+
+    python -m backend.util_scripts.fake_llm_server --port 8089 --latency lognormal:1.5,0.6 --error-rate 0.05
+
+then point the backend at it::
+
+    PERPLEXITY_ENDPOINT=http://127.0.0.1:8089/chat/completions
+    OPENAI_BASE_URL=http://127.0.0.1:8089/v1
+
+This module does not import :mod:`backend.config`, so it runs without
+any credentials configured.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from backend.services.response_cache import ResponseCache, make_cache_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPLAY_ENDPOINT = "https://api.perplexity.ai/chat/completions"
+
+TOPIC_SUBJECTS = [
+    "Generative AI assistants", "Large language model copilots", "AI-driven predictive analytics",
+    "Autonomous AI agents", "Multimodal foundation models", "Edge AI inference chips",
+    "AI governance frameworks", "Synthetic data pipelines", "Computer vision inspection systems",
+    "Retrieval-augmented generation platforms", "AI safety evaluations", "Open-weight AI models",
+]
+TOPIC_ACTIONS = [
+    "reshape", "accelerate adoption across", "face new regulatory scrutiny in", "cut operating costs for",
+    "raise privacy concerns across", "unlock new revenue streams in", "transform hiring practices in",
+]
+TOPIC_QUALIFIERS = [
+    "as major vendors ship enterprise releases", "following a wave of new pilot programs",
+    "after record venture funding this quarter", "amid growing public debate over accountability",
+    "as governments publish fresh guidance", "with early results showing measurable gains",
+]
+SOURCE_DOMAINS = [
+    "reuters.com", "apnews.com", "nature.com", "technologyreview.com", "wired.com", "ft.com",
+    "news.mit.edu", "arstechnica.com", "theverge.com", "example-blog.net", "medium.com", "youtube.com",
+]
+TAG_POOL = [
+    "Artificial Intelligence", "Machine Learning", "OpenAI", "Google", "Microsoft", "Regulation",
+    "Automation", "Data Privacy", "GPT-4", "Startups", "Cloud Computing", "Ethics", "Nvidia", "Policy",
+]
+
+@dataclass
+class FakeServerConfig:
+    """Behaviour knobs for the stand-in server.
+
+    :ivar latency: Latency spec, e.g. ``none``, ``constant:0.5``, ``uniform:0.2,2``,
+        ``normal:1,0.3`` or ``lognormal:1.5,0.6`` (median seconds, sigma).
+    :ivar error_rate: Fraction of requests that fail (0-1).
+    :ivar error_statuses: Status codes to pick failures from.
+    :ivar retry_after: ``Retry-After`` seconds sent with 429 responses.
+    :ivar seed: Seed for canned content and error injection.
+    :ivar fixtures: Path to a JSONL file of recorded request/response pairs.
+    :ivar replay_cache: Directory of a response cache captured from a live run.
+    :ivar replay_endpoint: Endpoint the replayed cache entries were keyed with.
+    """
+    latency: str = "none"
+    error_rate: float = 0.0
+    error_statuses: list[int] = field(default_factory=lambda: [429, 500, 503])
+    retry_after: float = 1.0
+    seed: int = 0
+    fixtures: Optional[str] = None
+    replay_cache: Optional[str] = None
+    replay_endpoint: str = DEFAULT_REPLAY_ENDPOINT
+
+def parse_latency(spec: str):
+    """Turn a latency spec into a zero-argument sampler returning seconds.
+
+    :param spec: ``kind[:a[,b]]`` as documented on :class:`FakeServerConfig`.
+    :returns: Callable producing a non-negative delay.
+    :raises ValueError: On an unknown distribution.
+    """
+    kind, _, args = spec.partition(":")
+    params = [float(a) for a in args.split(",") if a]
+    rng = random.Random()
+    if kind in ("", "none"):
+        return lambda: 0.0
+    if kind == "constant":
+        return lambda: params[0]
+    if kind == "uniform":
+        return lambda: rng.uniform(params[0], params[1])
+    if kind == "normal":
+        return lambda: max(0.0, rng.gauss(params[0], params[1]))
+    if kind == "lognormal":
+        mu = math.log(params[0])
+        return lambda: rng.lognormvariate(mu, params[1])
+    raise ValueError(f"Unknown latency distribution: {kind}")
+
+def _request_key(payload: dict, endpoint: str = "") -> str:
+    """Content hash of the parts of ``payload`` that determine the response."""
+    return make_cache_key(endpoint, payload.get("model", ""), payload.get("messages", []), payload.get("temperature"))
+
+def _prompt_text(messages: list) -> str:
+    """Concatenate all message contents."""
+    return "\n".join(str(m.get("content", "")) for m in messages)
+
+def _usage(prompt: str, completion: str) -> dict:
+    """Rough token usage (4 chars per token), shaped like the real APIs."""
+    prompt_tokens = max(1, len(prompt) // 4)
+    completion_tokens = max(1, len(completion) // 4)
+    return {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens, "total_tokens": prompt_tokens + completion_tokens}
+
+def _canned_trends(rng: random.Random, prompt: str) -> str:
+    """Topic titles, one per line."""
+    match = re.search(r"top (\d+) trending AI topics in (.+?) right now", prompt)
+    count = int(match.group(1)) if match else 3
+    sector = match.group(2) if match else "Technology"
+    lines = []
+    for _ in range(count):
+        lines.append(f"{rng.choice(TOPIC_SUBJECTS)} {rng.choice(TOPIC_ACTIONS)} {sector.lower()} {rng.choice(TOPIC_QUALIFIERS)}")
+    return "\n".join(lines)
+
+def _canned_search_results(rng: random.Random, prompt: str) -> list[dict]:
+    """Search results for an article search prompt."""
+    match = re.search(r"Find (\d+) recent, high-quality articles about: (.+)", prompt)
+    count = int(match.group(1)) if match else 5
+    topic = match.group(2).strip() if match else "AI"
+    results = []
+    for i in range(rng.randint(max(1, count // 2), count)):
+        domain = rng.choice(SOURCE_DOMAINS)
+        slug = "-".join(topic.lower().split()[:6]) or "ai"
+        results.append({
+            "title": f"{topic[:60]} ({domain}, report {i + 1})",
+            "url": f"https://www.{domain}/{rng.randint(2024, 2026)}/{slug}-{rng.randint(1000, 9999)}",
+            "date": f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        })
+    return results
+
+def _canned_article(rng: random.Random, prompt: str) -> str:
+    """An article citing a subset of the numbered sources, followed by tags."""
+    source_numbers = [int(n) for n in re.findall(r"^\[(\d+)\] \[(?:TRUSTED|UNCERTAIN)\]", prompt, re.MULTILINE)] or [1]
+    match = re.search(r"Write an article summarizing and explaining (.+)", prompt)
+    topic = match.group(1).strip() if match else "AI developments"
+    cited = sorted(rng.sample(source_numbers, k=max(1, int(len(source_numbers) * 0.7))))
+
+    paragraphs = []
+    for section in ("Background", "Key Developments", "Implications", "Conclusion"):
+        sentences = []
+        for _ in range(rng.randint(3, 5)):
+            sentences.append(f"Analysts tracking {topic.lower()} report measurable changes in adoption and outcomes[{rng.choice(cited)}].")
+        paragraphs.append(f"**{section}**\n\n" + " ".join(sentences))
+
+    tags = rng.sample(TAG_POOL, k=rng.randint(5, 8))
+    return f"{topic}\n\n" + "\n\n".join(paragraphs) + f"\n\nTAGS: {', '.join(tags)}"
+
+def canned_response(payload: dict, seed: int = 0) -> dict:
+    """Build a deterministic chat/completions response for ``payload``.
+
+    The prompt is inspected to recognise the trend search, article search,
+    summarization and (single or batch) impact scoring prompts used by the
+    pipeline; anything else gets a generic chat reply.
+
+    :param payload: Chat/completions request body.
+    :param seed: Seed mixed into the per-request RNG.
+    :returns: Response body dict.
+    """
+    messages = payload.get("messages", [])
+    prompt = _prompt_text(messages)
+    rng = random.Random(f"{seed}:{_request_key(payload)}")
+    search_results: list[dict] = []
+
+    if "trending AI topics" in prompt:
+        content = _canned_trends(rng, prompt)
+    elif "high-quality articles about:" in prompt:
+        search_results = _canned_search_results(rng, prompt)
+        content = "\n".join(f"{r['title']} | {r['url']}" for r in search_results)
+    elif "SOURCES (cite using the exact numbers shown)" in prompt:
+        content = _canned_article(rng, prompt)
+    elif "IMPACT SCORES" in prompt:
+        count = len(re.findall(r"^\[\d+\] Title:", prompt, re.MULTILINE))
+        content = json.dumps({"scores": [{"index": i, "score": rng.randint(2, 9)} for i in range(1, count + 1)]})
+    elif "IMPACT SCORE" in prompt:
+        content = str(rng.randint(2, 9))
+    else:
+        last_user = next((m.get("content", "") for m in reversed(messages) if m.get("role") == "user"), "")
+        content = f"This is a simulated analyst reply about: {str(last_user)[:200]}"
+
+    body = {
+        "id": f"fake-{uuid.uuid4().hex[:12]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": payload.get("model", "fake"),
+        "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+        "usage": _usage(prompt, content),
+    }
+    if search_results:
+        body["search_results"] = search_results
+        body["citations"] = [r["url"] for r in search_results]
+    return body
+
+def _stream_chunks(body: dict, chunk_chars: int = 80):
+    """Yield SSE lines that re-assemble into ``body`` as a streamed completion."""
+    content = body["choices"][0]["message"]["content"]
+    base = {"id": body["id"], "object": "chat.completion.chunk", "created": body["created"], "model": body["model"]}
+    extras = {k: body[k] for k in ("search_results", "citations") if k in body}
+
+    pieces = [content[i:i + chunk_chars] for i in range(0, len(content), chunk_chars)] or [""]
+    for i, piece in enumerate(pieces):
+        delta = {"role": "assistant", "content": piece} if i == 0 else {"content": piece}
+        chunk = {**base, **extras, "choices": [{"index": 0, "delta": delta, "finish_reason": None}]}
+        yield f"data: {json.dumps(chunk)}\n\n"
+    final = {**base, **extras, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}], "usage": body.get("usage")}
+    yield f"data: {json.dumps(final)}\n\n"
+    yield "data: [DONE]\n\n"
+
+def _load_fixtures(path: str) -> dict[str, dict]:
+    """Load recorded request/response pairs keyed by request content hash."""
+    fixtures = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                fixtures[_request_key(record["request"])] = record["response"]
+    logger.info(f"Loaded {len(fixtures)} recorded responses from {path}")
+    return fixtures
+
+def create_app(config: Optional[FakeServerConfig] = None) -> FastAPI:
+    """Create the stand-in server application.
+
+    :param config: Server behaviour; defaults to no latency and no errors.
+    :returns: FastAPI app exposing ``/chat/completions``, ``/v1/chat/completions``,
+        ``/health`` and ``/stats``.
+    """
+    config = config or FakeServerConfig()
+    sample_latency = parse_latency(config.latency)
+    error_rng = random.Random(config.seed)
+    fixtures = _load_fixtures(config.fixtures) if config.fixtures else {}
+    replay = ResponseCache(config.replay_cache, ttl_seconds=float("inf"), max_bytes=2**62) if config.replay_cache else None
+    stats: Counter = Counter()
+
+    app = FastAPI(title="Fake LLM upstream")
+
+    def lookup(payload: dict) -> dict:
+        recorded = fixtures.get(_request_key(payload))
+        if recorded is not None:
+            stats["fixture_hits"] += 1
+            return recorded
+        if replay is not None:
+            cached = replay.get(_request_key(payload, config.replay_endpoint))
+            if cached is not None:
+                stats["replay_hits"] += 1
+                return cached
+        stats["canned"] += 1
+        return canned_response(payload, config.seed)
+
+    async def chat_completions(request: Request):
+        payload = await request.json()
+        stats["requests"] += 1
+        await asyncio.sleep(sample_latency())
+
+        if config.error_rate and error_rng.random() < config.error_rate:
+            status = error_rng.choice(config.error_statuses)
+            stats[f"errors_{status}"] += 1
+            headers = {"Retry-After": str(config.retry_after)} if status == 429 else None
+            return JSONResponse({"error": {"message": "Injected failure", "code": status}}, status_code=status, headers=headers)
+
+        body = lookup(payload)
+        if payload.get("stream"):
+            return StreamingResponse(_stream_chunks(body), media_type="text/event-stream")
+        return JSONResponse(body)
+
+    app.add_api_route("/chat/completions", chat_completions, methods=["POST"])
+    app.add_api_route("/v1/chat/completions", chat_completions, methods=["POST"])
+
+    @app.get("/health")
+    def health():
+        return {"status": "ok"}
+
+    @app.get("/stats")
+    def get_stats():
+        return dict(stats)
+
+    return app
+
+def serve_in_thread(config: Optional[FakeServerConfig] = None, host: str = "127.0.0.1", port: int = 0):
+    """Start the server on a background thread (used by benchmarks).
+
+    :param config: Server behaviour.
+    :param host: Interface to bind.
+    :param port: Port to bind (``0`` picks a free port).
+    :returns: Tuple of ``(base_url, server)``; call ``server.should_exit = True`` to stop it.
+    """
+    import socket
+    import uvicorn
+
+    if port == 0:
+        with socket.socket() as sock:
+            sock.bind((host, 0))
+            port = sock.getsockname()[1]
+
+    server = uvicorn.Server(uvicorn.Config(create_app(config), host=host, port=port, log_level="warning"))
+    threading.Thread(target=server.run, name="fake-llm-server", daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return f"http://{host}:{port}", server
+
+def main() -> None:
+    """Parse command-line options and run the server in the foreground."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Local stand-in for the Perplexity/OpenAI chat completions APIs.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", default="none", help="none | constant:S | uniform:A,B | normal:MEAN,STD | lognormal:MEDIAN,SIGMA")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-statuses", default="429,500,503", help="Comma-separated status codes for injected failures.")
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fixtures", help="JSONL file of recorded {request, response} pairs.")
+    parser.add_argument("--replay-cache", help="LLM_CACHE_DIR captured from a live run.")
+    parser.add_argument("--replay-endpoint", default=DEFAULT_REPLAY_ENDPOINT)
+    args = parser.parse_args()
+
+    config = FakeServerConfig(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        error_statuses=[int(s) for s in args.error_statuses.split(",") if s],
+        retry_after=args.retry_after,
+        seed=args.seed,
+        fixtures=args.fixtures,
+        replay_cache=args.replay_cache,
+        replay_endpoint=args.replay_endpoint,
+    )
+    logging.basicConfig(level=logging.INFO)
+    uvicorn.run(create_app(config), host=args.host, port=args.port)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+"""Backfill tool re-applying parsing logic to stored rows.
+
+When citation, domain or tag handling changes, existing rows keep the
+output of the old logic. This script streams a table in primary-key
+order, fans batches out to a process pool and writes the changed rows
+back with batched statements::
+
+    python -m backend.util_scripts.reprocess citations
+    python -m backend.util_scripts.reprocess domains tags --workers 8 --batch-size 1000
+    python -m backend.util_scripts.reprocess citations --dry-run
+    python -m backend.util_scripts.reprocess sectors source_sectors
+
+Operations
+----------
+citations
+    Re-run :func:`filter_and_renumber_sources` on each article's content.
+    The linked sources are numbered by their stored citation position
+    (``source_articles.position``). Changed text and positions are written
+    back and sources the text no longer cites are unlinked. Articles whose
+    links have no complete positions (stored before positions were
+    recorded) are never rewritten; those whose citations are not exactly
+    ``[1]`` to ``[k]`` for their ``k`` sources are logged for review.
+domains
+    Recompute ``sources.domain`` with :func:`extract_domain`.
+tags
+    Re-apply :func:`clean_tag` to tag names. A tag whose cleaned name
+    already exists is merged into that tag.
+sectors
+    Recompute ``articles.secondary_sectors`` from each article's title,
+    tags and content with :func:`classify_article`; the stored sector
+    stays primary.
+source_sectors
+    Set ``sources.sector`` to the sector matching the source title
+    (:func:`classify_source`); sources without a match keep theirs.
+
+Rows are read in chunks of ``--batch-size`` x ``--workers`` x 2 with
+``yield_per``. Each chunk's cursor is closed before its batches are written,
+so no cursor stays open across commits. Every batch is committed together
+with a checkpoint (``SystemState`` key ``reprocess:<op>``), so an
+interrupted run continues after the last written batch. ``--restart``
+ignores the checkpoint. A run that completed starts over from the
+beginning.
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from typing import Callable, NamedTuple, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.db.database import SessionLocal, engine
+from backend.db import models
+from backend.db.crud import bulk_update_by_id, unlink_article_sources, set_article_source_positions, rename_tags, get_system_state, set_system_state
+from backend.services.perplexity_service import clean_tag
+from backend.services.sector_classifier import classify_article, classify_source
+from backend.services.source_services import extract_domain, filter_and_renumber_sources
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Seconds between progress log lines
+PROGRESS_INTERVAL = 5.0
+
+def renumber_citations(batch: list[tuple[int, str, list[tuple[int, Optional[int]]]]]) -> list[tuple[int, Optional[str], list[int], dict[int, int]]]:
+    """Renumber the citations of a batch of articles.
+
+    Only articles whose links are numbered ``1..k`` by position are
+    renumbered. Without positions the source cited as ``[n]`` is unknown,
+    so such articles are left as they are and logged if their citations
+    are not exactly ``[1]`` to ``[k]``.
+
+    :param batch: ``(article_id, content, links)`` tuples, ``links`` being ``(source_id, position)`` pairs ordered by position.
+    :returns: ``(article_id, new_content or None if unchanged, source_ids_to_unlink, {source_id: new_position}
+        for moved sources)`` for changed articles.
+    """
+    changes = []
+    for article_id, content, links in batch:
+        content = content or ""
+        source_ids = [source_id for source_id, _ in links]
+        expected = list(range(1, len(links) + 1))
+        if [position for _, position in links] != expected:
+            _, _, stats = filter_and_renumber_sources(content, source_ids, len(source_ids))
+            if stats["cited_numbers_original"] != expected:
+                logger.warning(f"Article {article_id}: cites {stats['cited_numbers_original']} but has {len(links)} source(s) without citation positions, left unchanged")
+            continue
+        text, kept, _ = filter_and_renumber_sources(content, source_ids, len(source_ids))
+        positions = {source_id: position for position, source_id in enumerate(kept, start=1)}
+        removed = [source_id for source_id in source_ids if source_id not in positions]
+        stored = dict(links)
+        moved = {source_id: position for source_id, position in positions.items() if position != stored[source_id]}
+        if text != content or removed or moved:
+            changes.append((article_id, text if text != content else None, removed, moved))
+    return changes
+
+def extract_domains(batch: list[tuple[int, str, Optional[str]]]) -> list[tuple[int, str]]:
+    """Recompute the domain of a batch of sources.
+
+    :param batch: ``(source_id, url, domain)`` tuples.
+    :returns: ``(source_id, new_domain)`` for sources whose domain changed.
+    """
+    changes = []
+    for source_id, url, domain in batch:
+        new_domain = extract_domain(url)
+        if new_domain != domain:
+            changes.append((source_id, new_domain))
+    return changes
+
+def normalize_tags(batch: list[tuple[int, str]]) -> list[tuple[int, str]]:
+    """Re-clean a batch of tag names.
+
+    Names the cleaner rejects are left as they are.
+
+    :param batch: ``(tag_id, name)`` tuples.
+    :returns: ``(tag_id, new_name)`` for tags whose name changed.
+    """
+    changes = []
+    for tag_id, name in batch:
+        cleaned = clean_tag(name)
+        if cleaned and cleaned != name:
+            changes.append((tag_id, cleaned))
+    return changes
+
+def assign_sectors(batch: list[tuple[int, str, str, str, list[str], list[str]]]) -> list[tuple[int, list[str]]]:
+    """Recompute the secondary sectors of a batch of articles.
+
+    :param batch: ``(article_id, title, content, sector, secondary_sectors, tag_names)`` tuples.
+    :returns: ``(article_id, new_secondary_sectors)`` for articles whose secondary sectors changed.
+    """
+    changes = []
+    for article_id, title, content, sector, secondary, tags in batch:
+        match = classify_article(title or "", content or "", tags, primary=sector)
+        if match.secondary != list(secondary or []):
+            changes.append((article_id, match.secondary))
+    return changes
+
+def assign_source_sectors(batch: list[tuple[int, Optional[str], Optional[str]]]) -> list[tuple[int, str]]:
+    """Reclassify a batch of sources by title.
+
+    :param batch: ``(source_id, title, sector)`` tuples.
+    :returns: ``(source_id, new_sector)`` for sources whose sector changed.
+    """
+    changes = []
+    for source_id, title, sector in batch:
+        new_sector = classify_source(title, sector or "General")
+        if new_sector != sector:
+            changes.append((source_id, new_sector))
+    return changes
+
+def _load_citations(db: Session, rows: list) -> list[tuple[int, str, list[tuple[int, Optional[int]]]]]:
+    """Attach each article's ``(source_id, position)`` links (by position, missing positions last) to its row."""
+    links = models.source_articles.c
+    article_links = {row[0]: [] for row in rows}
+    for article_id, source_id, position in db.execute(
+        select(links.article_id, links.source_id, links.position).where(links.article_id.in_(list(article_links)))
+        .order_by(links.article_id, links.position.is_(None), links.position, links.source_id)
+    ):
+        article_links[article_id].append((source_id, position))
+    return [(article_id, content, article_links[article_id]) for article_id, content in rows]
+
+def _load_tags(db: Session, rows: list) -> list[tuple]:
+    """Attach each article's tag names to its row."""
+    links = models.article_tags.c
+    names = {row[0]: [] for row in rows}
+    for article_id, name in db.execute(
+        select(links.article_id, models.Tag.name).join(models.Tag, models.Tag.id == links.tag_id).where(links.article_id.in_(list(names)))
+    ):
+        names[article_id].append(name)
+    return [(*row, names[row[0]]) for row in rows]
+
+def _write_citations(db: Session, changes: list) -> int:
+    """Write renumbered article text and positions and unlink uncited sources."""
+    bulk_update_by_id(db, models.Article, [{"id": article_id, "content": text} for article_id, text, _, _ in changes if text is not None])
+    unlink_article_sources(db, [(article_id, source_id) for article_id, _, removed, _ in changes for source_id in removed])
+    set_article_source_positions(db, [(article_id, source_id, position) for article_id, _, _, moved in changes for source_id, position in moved.items()])
+    return len(changes)
+
+def _write_domains(db: Session, changes: list) -> int:
+    """Write recomputed source domains."""
+    bulk_update_by_id(db, models.Source, [{"id": source_id, "domain": domain} for source_id, domain in changes])
+    return len(changes)
+
+def _write_sectors(db: Session, changes: list) -> int:
+    """Write recomputed secondary sectors."""
+    bulk_update_by_id(db, models.Article, [{"id": article_id, "secondary_sectors": secondary} for article_id, secondary in changes])
+    return len(changes)
+
+def _write_source_sectors(db: Session, changes: list) -> int:
+    """Write reclassified source sectors."""
+    bulk_update_by_id(db, models.Source, [{"id": source_id, "sector": sector} for source_id, sector in changes])
+    return len(changes)
+
+def _write_tags(db: Session, changes: list) -> int:
+    """Rename (or merge) re-cleaned tags."""
+    rename_tags(db, dict(changes))
+    return len(changes)
+
+class Operation(NamedTuple):
+    """One reprocessing operation.
+
+    :ivar model: Table streamed in primary-key order.
+    :ivar columns: Columns read per row (the primary key first).
+    :ivar transform: Picklable function run in the pool on a batch.
+    :ivar write: Writes a batch of changes; returns the number of changed rows.
+    :ivar load: Optionally enriches a batch of rows before it is sent to the pool.
+    """
+    model: type
+    columns: tuple
+    transform: Callable[[list], list]
+    write: Callable[[Session, list], int]
+    load: Optional[Callable[[Session, list], list]] = None
+
+OPERATIONS = {
+    "citations": Operation(models.Article, (models.Article.id, models.Article.content), renumber_citations, _write_citations, _load_citations),
+    "domains": Operation(models.Source, (models.Source.id, models.Source.url, models.Source.domain), extract_domains, _write_domains),
+    "tags": Operation(models.Tag, (models.Tag.id, models.Tag.name), normalize_tags, _write_tags),
+    "sectors": Operation(
+        models.Article,
+        (models.Article.id, models.Article.title, models.Article.content, models.Article.sector, models.Article.secondary_sectors),
+        assign_sectors, _write_sectors, _load_tags,
+    ),
+    "source_sectors": Operation(models.Source, (models.Source.id, models.Source.title, models.Source.sector), assign_source_sectors, _write_source_sectors),
+}
+
+def _read_chunk(db: Session, op: Operation, after_id: int, batch_size: int, batches: int) -> list[list]:
+    """Read up to ``batches`` batches of rows with ids above ``after_id``.
+
+    The rows are streamed with ``yield_per`` and the cursor is exhausted
+    before returning, so the caller can commit on the same session.
+    """
+    id_column = op.columns[0]
+    stmt = (
+        select(*op.columns).where(id_column > after_id).order_by(id_column)
+        .limit(batch_size * batches).execution_options(yield_per=batch_size)
+    )
+    chunk = []
+    for partition in db.execute(stmt).partitions():
+        rows = [tuple(row) for row in partition]
+        chunk.append(op.load(db, rows) if op.load else rows)
+    return chunk
+
+def _submit(executor: Optional[ProcessPoolExecutor], fn: Callable, batch: list) -> Future:
+    """Run ``fn(batch)`` in the pool, or inline when there is no pool."""
+    if executor is not None:
+        return executor.submit(fn, batch)
+    future = Future()
+    future.set_result(fn(batch))
+    return future
+
+def reprocess(op_name: str, batch_size: int = 500, workers: int = 0, restart: bool = False, dry_run: bool = False) -> dict:
+    """Run one operation over its whole table.
+
+    :param op_name: Key of :data:`OPERATIONS`.
+    :param batch_size: Rows per batch sent to a worker and per write.
+    :param workers: Worker processes (``0`` runs batches in this process).
+    :param restart: Ignore the checkpoint and start from the first row.
+    :param dry_run: Compute changes without writing them or the checkpoint.
+    :returns: Dict with ``processed``, ``changed``, ``last_id`` and ``seconds``.
+    """
+    op = OPERATIONS[op_name]
+    key = f"reprocess:{op_name}"
+    db = SessionLocal()
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
+    try:
+        state = json.loads(get_system_state(db, key) or "null")
+        if restart or not state or state.get("finished_at") or dry_run:
+            state = {"last_id": 0, "processed": 0, "changed": 0, "started_at": datetime.now().isoformat(), "finished_at": None}
+        else:
+            logger.info(f"{op_name}: resuming after id {state['last_id']} ({state['processed']} rows done)")
+
+        start = time.monotonic()
+        last_log = start
+        read_id = state["last_id"]
+        pending = deque()
+        while True:
+            chunk = _read_chunk(db, op, read_id, batch_size, max(1, workers) * 2)
+            for batch in chunk:
+                pending.append((batch[-1][0], len(batch), _submit(executor, op.transform, batch)))
+                read_id = batch[-1][0]
+
+            # Write everything but the chunk just submitted, which the pool works on meanwhile
+            while len(pending) > len(chunk) or (not chunk and pending):
+                last_id, count, future = pending.popleft()
+                changes = future.result()
+                state["changed"] += op.write(db, changes) if not dry_run else len(changes)
+                state["processed"] += count
+                state["last_id"] = last_id
+                if not dry_run:
+                    set_system_state(db, key, json.dumps(state))
+                    db.commit()
+                if time.monotonic() - last_log >= PROGRESS_INTERVAL:
+                    last_log = time.monotonic()
+                    rate = state["processed"] / (last_log - start)
+                    logger.info(f"{op_name}: {state['processed']} rows, {state['changed']} changed ({rate:.0f} rows/s)")
+            if not chunk:
+                break
+
+        state["finished_at"] = datetime.now().isoformat()
+        if not dry_run:
+            set_system_state(db, key, json.dumps(state))
+            db.commit()
+        elapsed = time.monotonic() - start
+        logger.info(f"{op_name}: {'would change' if dry_run else 'changed'} {state['changed']} of {state['processed']} rows in {elapsed:.1f}s")
+        return {"processed": state["processed"], "changed": state["changed"], "last_id": state["last_id"], "seconds": round(elapsed, 3)}
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        db.close()
+
+def main() -> None:
+    """Parse options and run the requested operations in order."""
+    parser = argparse.ArgumentParser(description="Re-apply citation, domain, tag or sector processing to stored rows.")
+    parser.add_argument("operations", nargs="+", choices=sorted(OPERATIONS), help="Operations to run, in order.")
+    parser.add_argument("--batch-size", type=int, default=500, help="Rows per batch.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (0 = run in this process).")
+    parser.add_argument("--restart", action="store_true", help="Ignore checkpoints and start from the first row.")
+    parser.add_argument("--dry-run", action="store_true", help="Count changes without writing them.")
+    args = parser.parse_args()
+
+    try:
+        for op_name in args.operations:
+            reprocess(op_name, max(1, args.batch_size), max(0, args.workers), restart=args.restart, dry_run=args.dry_run)
+    finally:
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Summarization worker consuming the trend job queue.
+
+Trend discovery (``python -m backend.util_scripts.cronjob --discover-only``)
+enqueues one ``pipeline_trends`` job per trend. Any number of workers, on
+any number of machines, claim those jobs with ``SELECT ... FOR UPDATE
+SKIP LOCKED`` and run the article search, summarize, score and persist
+stages for them::
+
+    python -m backend.util_scripts.worker --concurrency 8
+    python -m backend.util_scripts.worker --once      # drain the queue and exit
+
+A worker keeps ``--concurrency`` jobs in flight and claims a new job as
+soon as a slot frees up. Claims last ``settings.QUEUE_VISIBILITY_TIMEOUT``
+seconds and are extended at every stage checkpoint, so jobs held by a
+worker that dies become claimable again. SIGTERM/SIGINT stops claiming
+and lets in-flight jobs finish.
+"""
+
+import argparse
+import logging
+import signal
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Optional
+
+from backend.config import settings
+from backend.db.database import SessionLocal, engine
+from backend.db.crud import claim_pipeline_trends, finish_pipeline_run
+from backend.services.http_client import close_clients
+from backend.util_scripts.cronjob import WORKER_ID, process_trend
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def claim_jobs(limit: int) -> list[tuple[int, int, str, str]]:
+    """Claim up to ``limit`` jobs for this worker.
+
+    :param limit: Maximum number of jobs to claim.
+    :returns: List of ``(checkpoint_id, run_id, sector, trend)`` tuples.
+    """
+    db = SessionLocal()
+    try:
+        jobs = claim_pipeline_trends(db, WORKER_ID, limit, settings.QUEUE_VISIBILITY_TIMEOUT, settings.QUEUE_MAX_ATTEMPTS)
+        return [(job.id, job.run_id, job.sector, job.trend) for job in jobs]
+    finally:
+        db.close()
+
+def finish_run(run_id: int):
+    """Refresh the status of ``run_id`` after one of its jobs ended."""
+    db = SessionLocal()
+    try:
+        finish_pipeline_run(db, run_id)
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"Could not update run {run_id}: {e}")
+    finally:
+        db.close()
+
+def run_worker(concurrency: int, stop_event: threading.Event, once: bool = False, poll_seconds: Optional[float] = None) -> int:
+    """Process queued trend jobs until stopped (or, with ``once``, until the queue is empty).
+
+    :param concurrency: Maximum jobs processed at the same time.
+    :param stop_event: Set to stop claiming new jobs.
+    :param once: Exit as soon as no job can be claimed.
+    :param poll_seconds: Idle poll interval (defaults to ``settings.WORKER_POLL_SECONDS``).
+    :returns: Number of articles created.
+    """
+    poll_seconds = settings.WORKER_POLL_SECONDS if poll_seconds is None else poll_seconds
+    created = 0
+    in_flight = {}
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="job") as pool:
+        while in_flight or not stop_event.is_set():
+            free = concurrency - len(in_flight)
+            if free > 0 and not stop_event.is_set():
+                try:
+                    jobs = claim_jobs(free)
+                except Exception as e:
+                    logger.error(f"Claiming jobs failed: {e}")
+                    jobs = []
+                for checkpoint_id, run_id, sector, trend in jobs:
+                    logger.info(f"[{trend[:40]}] Claimed job {checkpoint_id} ({sector})")
+                    in_flight[pool.submit(process_trend, trend, sector, None, checkpoint_id)] = run_id
+
+            if not in_flight:
+                if once:
+                    break
+                stop_event.wait(poll_seconds)
+                continue
+
+            done, _ = wait(in_flight, timeout=poll_seconds, return_when=FIRST_COMPLETED)
+            for future in done:
+                run_id = in_flight.pop(future)
+                if future.result() is not None:
+                    created += 1
+                finish_run(run_id)
+
+    logger.info(f"Worker {WORKER_ID} stopped after creating {created} article(s)")
+    return created
+
+def main() -> None:
+    """Parse options and run the worker until signalled to stop."""
+    parser = argparse.ArgumentParser(description="Claim and summarize queued trend jobs.")
+    parser.add_argument("--concurrency", type=int, default=settings.INGEST_WORKERS, help="Jobs processed at the same time.")
+    parser.add_argument("--once", action="store_true", help="Exit when the queue is empty.")
+    args = parser.parse_args()
+
+    stop_event = threading.Event()
+
+    def handle_signal(signum, _frame):
+        if stop_event.is_set():
+            raise SystemExit(1)
+        logger.info(f"Received {signal.Signals(signum).name}, finishing in-flight jobs...")
+        stop_event.set()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    logger.info(f"Worker {WORKER_ID} started with concurrency {args.concurrency}")
+    try:
+        run_worker(max(1, args.concurrency), stop_event, once=args.once)
+    finally:
+        close_clients()
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()